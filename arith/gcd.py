@@ -0,0 +1,9 @@
+#!/usr/bin/python3
+"""
+Greatest common divisor shared by the primality tests and factoring methods.
+
+gcd() is math.gcd: CPython runs Euclid in C for single digit operands and
+Lehmer's algorithm for multi digit ones, so it beats any Python loop at every
+size bench/gcd.py measures.
+"""
+from math import gcd
@@ -0,0 +1,33 @@
+#!/usr/bin/python3
+"""
+Jacobi symbol (a/n) for odd n > 0, shared by baillie_psw and solovay-strassen.
+
+jacobi() removes every factor of two of a with one shift, counted by
+(a & -a).bit_length(), and takes the (2/n) sign from a table indexed by
+n mod 8; reciprocity only flips the sign when a and n are both 3 mod 4.
+bench/jacobi.py times it against a binary variant and the previous version.
+"""
+
+# (2/n) for n mod 8, zero for even n
+TWO_SIGN = (0, 1, 0, -1, 0, -1, 0, 1)
+
+
+def jacobi(a, n):
+    if n <= 0 or not n & 1:
+        raise ValueError('n must be a positive odd number.')
+
+    a %= n
+    t = 1
+
+    while a:
+        if not a & 1:
+            z = (a & -a).bit_length() - 1
+            a >>= z
+            if z & 1:
+                t *= TWO_SIGN[n & 7]
+
+        if a & n & 2:
+            t = -t
+        a, n = n % a, a
+
+    return t if n == 1 else 0
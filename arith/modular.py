@@ -0,0 +1,28 @@
+#!/usr/bin/python3
+
+
+class ModContext:
+    """
+    Per-modulus context shared by the primality tests and factoring methods.
+
+    It keeps the values every test recomputes for the same n (n - 1 = 2^s * d
+    and (n - 1) / 2), so several witnesses or exponentiations with the same n
+    only pay the setup once. pow() is the builtin pow, which runs in C and
+    beats a Montgomery ladder in Python at every size bench/montgomery.py
+    measures.
+    """
+
+    def __init__(self, n):
+        if n < 2:
+            raise ValueError('The modulus must be at least 2.')
+
+        self.n = n
+        self.n_minus_1 = n - 1
+        self.half = (n - 1) >> 1
+
+        d = n - 1
+        s = (d & -d).bit_length() - 1
+        self.s, self.d = s, d >> s
+
+    def pow(self, a, e):
+        return pow(a, e, self.n)
@@ -0,0 +1,140 @@
+#!/usr/bin/python3
+"""
+Integer roots shared by the primality tests and factoring methods.
+
+isqrt() is math.isqrt. is_square() first rejects non-squares by their
+residues mod 64, 63, 65 and 11, which leaves about 1 in 100 of them, and only
+takes the root of the rest. iroot() and perfect_power() do the same for k-th
+powers, filtering with small primes p = 1 (mod k): only about 1 in k of the
+residues mod p are k-th powers, those r with r^((p - 1) / k) = 1 (mod p).
+"""
+from bisect import bisect_left
+from math import isqrt
+
+# Quadratic residues modulo 64, 63, 65 and 11: a square mod 64 * 63 * 65 * 11
+# is a square for all four, and only about 1 in 100 non-squares passes them.
+SQUARE_MODULI = (64, 63, 65, 11)
+SQUARE_RESIDUES = tuple(bytes(1 if r in {x * x % m for x in range(m)} else 0 for r in range(m))
+                        for m in SQUARE_MODULI)
+
+# k-th powers are filtered mod up to this many primes p = 1 (mod k) below
+# POWER_FILTER_BOUND.
+POWER_FILTER_PRIMES = 4
+POWER_FILTER_BOUND = 1 << 16
+
+_power_filters = dict()
+_small_primes = list()
+
+
+def is_square(n):
+    if n < 0:
+        return False
+
+    r = n % 45045  # 63 * 65 * 11
+    q64, q63, q65, q11 = SQUARE_RESIDUES
+    if not (q64[n & 63] and q63[r % 63] and q65[r % 65] and q11[r % 11]):
+        return False
+
+    s = isqrt(n)
+    return s * s == n
+
+
+def small_primes(limit):
+    """
+    The primes below limit, by a sieve kept between calls.
+    """
+    global _small_primes
+
+    if not _small_primes or _small_primes[-1] < limit:
+        size = max(limit, 2 * POWER_FILTER_BOUND)
+        sieve = bytearray([1]) * size
+        sieve[:2] = b'\x00\x00'
+        for i in range(2, isqrt(size - 1) + 1):
+            if sieve[i]:
+                sieve[i * i::i] = bytes(len(range(i * i, size, i)))
+        _small_primes = [i for i in range(size) if sieve[i]]
+
+    return _small_primes
+
+
+def power_filters(k):
+    """
+    (p, (p - 1) / k) for the first primes p = 1 (mod k) below
+    POWER_FILTER_BOUND, for an odd prime k.
+    """
+    if k not in _power_filters:
+        primes = small_primes(POWER_FILTER_BOUND)
+        filters = list()
+        # p - 1 is even, so p = 2jk + 1
+        for p in range(2 * k + 1, POWER_FILTER_BOUND, 2 * k):
+            if primes[bisect_left(primes, p)] == p:
+                filters.append((p, (p - 1) // k))
+                if len(filters) == POWER_FILTER_PRIMES:
+                    break
+        _power_filters[k] = filters
+
+    return _power_filters[k]
+
+
+def iroot(n, k):
+    """
+    Integer k-th root of n (the largest r with r^k <= n), by Newton's method
+    from a power of two above the root.
+    """
+    if n < 0:
+        raise ValueError('Roots are only taken of non-negative numbers.')
+
+    if k == 1 or n < 2:
+        return n
+
+    if k == 2:
+        return isqrt(n)
+
+    x = 1 << ((n.bit_length() + k - 1) // k)
+    while True:
+        y = ((k - 1) * x + n // x ** (k - 1)) // k
+        if y >= x:
+            return x
+        x = y
+
+
+def is_power(n, k):
+    """
+    The k-th root of n when n is a perfect k-th power, otherwise None.
+    """
+    if k == 2:
+        if not is_square(n):
+            return None
+    else:
+        for p, e in power_filters(k):
+            r = n % p
+            if r and pow(r, e, p) != 1:
+                return None
+
+    r = iroot(n, k)
+    return r if r ** k == n else None
+
+
+def perfect_power(n, smallest=2):
+    """
+    Returns (r, k) with r^k == n for the smallest prime k that works, or
+    (n, 1). Every prime factor of n is known to be at least `smallest`,
+    which bounds k by log(n) / log(smallest).
+    """
+    if n < 4:
+        return n, 1
+
+    limit = n.bit_length() // max(smallest.bit_length() - 1, 1)
+
+    for k in small_primes(limit + 1):
+        if k > limit:
+            break
+        r = is_power(n, k)
+        if r is not None:
+            return r, k
+
+    return n, 1
+
+
+def is_perfect_power(n):
+    return perfect_power(n)[1] > 1
@@ -0,0 +1,269 @@
+#!/usr/python3
+"""
+Vectorized Baillie-PSW for arrays of integers below 2^63.
+
+Every step of baillie_psw (small primes, perfect squares, strong base 2 test
+and strong Lucas test) runs over whole numpy uint64 arrays. Products are
+kept in Montgomery form with R = 2^64; the high half of each 128-bit product
+comes from the four 32-bit partial products, so nothing overflows as long as
+n < 2^63. BPSW has no known counterexample in this range, so the answer is
+the same as miller_rabin with its deterministic bases.
+"""
+from time import time
+
+import numpy as np
+
+from baillie_psw import is_prime, primes10000, selfridge_symbols
+
+LIMIT = 1 << 63
+TRIAL_PRIMES = np.array(primes10000[1:64], dtype=np.uint64)
+SMALL_PRIMES = np.array(primes10000, dtype=np.uint64)
+SMALL_LIMIT = primes10000[-1] + 1
+# Selfridge values of D looked up per element; the few elements left over
+# go to the scalar is_prime.
+SELFRIDGE_VECTOR_SIZE = 32
+
+U32 = np.uint64(0xffffffff)
+S32 = np.uint64(32)
+ZERO = np.uint64(0)
+ONE = np.uint64(1)
+
+_selfridge_table = None
+
+
+def mul_hi(a, b):
+    """
+    High 64 bits of the 128-bit products a * b.
+    """
+    a0, a1 = a & U32, a >> S32
+    b0, b1 = b & U32, b >> S32
+
+    p00, p01, p10, p11 = a0 * b0, a0 * b1, a1 * b0, a1 * b1
+    mid = (p00 >> S32) + (p01 & U32) + (p10 & U32)
+
+    return p11 + (p01 >> S32) + (p10 >> S32) + (mid >> S32)
+
+
+class Montgomery:
+    """
+    Montgomery arithmetic modulo each element of an array of odd n < 2^63.
+    """
+
+    def __init__(self, n):
+        self.n = n
+
+        # Newton iteration for n^-1 mod 2^64, exact to 3 bits at the start.
+        inv = n.copy()
+        for i in range(5):
+            inv *= np.uint64(2) - n * inv
+        self.n_prime = ZERO - inv
+
+        # R mod n, then R^2 mod n by doubling it 64 times.
+        self.one = (ZERO - n) % n
+        r2 = self.one.copy()
+        for i in range(64):
+            r2 = self.add(r2, r2)
+        self.r2 = r2
+
+        self.minus_one = n - self.one
+
+    def add(self, a, b):
+        s = a + b
+        return np.where(s >= self.n, s - self.n, s)
+
+    def sub(self, a, b):
+        return np.where(a >= b, a - b, a + (self.n - b))
+
+    def half(self, a):
+        return np.where(a & ONE, (a >> ONE) + ((self.n >> ONE) + ONE), a >> ONE)
+
+    def mul(self, a, b):
+        n = self.n
+        lo, hi = a * b, mul_hi(a, b)
+        m = lo * self.n_prime
+
+        # lo + low(m * n) is 0 or 2^64, so the carry is set whenever lo != 0.
+        u = hi + mul_hi(m, n) + (lo != ZERO).astype(np.uint64)
+        return np.where(u >= n, u - n, u)
+
+    def to_mont(self, a):
+        return self.mul(a % self.n, self.r2)
+
+    def pow(self, a, e, bits=64):
+        """
+        a^e with a in Montgomery form and one exponent per element.
+        """
+        x = self.one.copy()
+        for i in range(bits - 1, -1, -1):
+            x = self.mul(x, x)
+            bit = ((e >> np.uint64(i)) & ONE).astype(bool)
+            x = np.where(bit, self.mul(x, a), x)
+        return x
+
+
+def split_power_of_two(m):
+    """
+    m = 2^s * d with d odd, for every element of m.
+    """
+    s = np.zeros(m.shape, dtype=np.uint64)
+    d = m.copy()
+    even = (d & ONE) == ZERO
+    while even.any():
+        d = np.where(even, d >> ONE, d)
+        s += even
+        even = (d & ONE) == ZERO
+    return s, d
+
+
+def is_square(n):
+    r = np.floor(np.sqrt(n.astype(np.float64))).astype(np.uint64)
+    # the float root may be one off around 2^63
+    r = np.where(r * r > n, r - ONE, r)
+    r = np.where((r + ONE) * (r + ONE) <= n, r + ONE, r)
+    return r * r == n
+
+
+def strong_pseudoprime(n, mont, bits):
+    s, d = split_power_of_two(n - ONE)
+    x = mont.pow(mont.to_mont(np.full(n.shape, 2, dtype=np.uint64)), d, bits)
+
+    passed = (x == mont.one) | (x == mont.minus_one)
+    for r in range(1, int(s.max())):
+        x = mont.mul(x, x)
+        passed |= (x == mont.minus_one) & (np.uint64(r) < s)
+
+    return passed
+
+
+def selfridge_params(n):
+    """
+    First D of 5, -7, 9, -11, ... with Jacobi symbol (D/n) = -1, looked up in
+    tables of (D/r) for r mod 4|D|. Returns D, the symbol found (0 when D
+    shares a factor with n) and a mask of elements that ran out of table
+    entries.
+    """
+    global _selfridge_table
+
+    if _selfridge_table is None:
+        ds = [(5 + 2 * i) * (-1) ** i for i in range(SELFRIDGE_VECTOR_SIZE)]
+        _selfridge_table = [(d, 4 * abs(d), selfridge_symbols(d)) for d in ds]
+    selfridge_table = _selfridge_table
+
+    d = np.zeros(n.shape, dtype=np.int64)
+    symbol = np.ones(n.shape, dtype=np.int64)
+    pending = np.ones(n.shape, dtype=bool)
+
+    for ds, m, symbols in selfridge_table:
+        t = np.asarray(symbols, dtype=np.int64)[(n % np.uint64(m)).astype(np.int64)]
+        found = pending & (t != 1)
+        d[found], symbol[found] = ds, t[found]
+        pending &= ~found
+        if not pending.any():
+            break
+
+    return d, symbol, pending
+
+
+def strong_lucas_pseudoprime(n, mont, d, bits):
+    """
+    Strong Lucas test with P = 1 and Q = (1 - D) / 4, after selfridge_params.
+    """
+    q = (1 - d) // 4
+    qm = mont.to_mont(np.where(q < 0, n - np.abs(q).astype(np.uint64), q.astype(np.uint64)))
+    dm = mont.to_mont(np.where(d < 0, n - np.abs(d).astype(np.uint64), d.astype(np.uint64)))
+
+    s, k = split_power_of_two(n + ONE)
+
+    u = np.zeros(n.shape, dtype=np.uint64)
+    v = mont.add(mont.one, mont.one)
+    qk = mont.one.copy()
+
+    for i in range(bits, -1, -1):
+        # U_2k = U_k V_k, V_2k = V_k^2 - 2 Q^k
+        u, v = mont.mul(u, v), mont.sub(mont.mul(v, v), mont.add(qk, qk))
+        qk = mont.mul(qk, qk)
+
+        # U_k+1 = (U_k + V_k) / 2, V_k+1 = (D U_k + V_k) / 2
+        bit = ((k >> np.uint64(i)) & ONE).astype(bool)
+        u, v = (np.where(bit, mont.half(mont.add(u, v)), u),
+                np.where(bit, mont.half(mont.add(mont.mul(dm, u), v)), v))
+        qk = np.where(bit, mont.mul(qk, qm), qk)
+
+    passed = (u == ZERO) | (v == ZERO)
+    for r in range(1, int(s.max())):
+        v = mont.sub(mont.mul(v, v), mont.add(qk, qk))
+        qk = mont.mul(qk, qk)
+        passed |= (v == ZERO) & (np.uint64(r) < s)
+
+    return passed
+
+
+def is_prime_array(numbers):
+    """
+    Boolean array telling which of the numbers (all below 2^63) are prime.
+    """
+    n = np.asarray(numbers, dtype=np.uint64)
+    if n.size and int(n.max()) >= LIMIT:
+        raise ValueError('Only numbers below 2^63 are supported.')
+
+    result = np.zeros(n.shape, dtype=bool)
+
+    small = n < np.uint64(SMALL_LIMIT)
+    result[small] = np.isin(n[small], SMALL_PRIMES)
+
+    # Candidates are compacted after every step, so each test only sees the
+    # numbers that survived the cheaper ones.
+    idx = np.flatnonzero(~small & ((n & ONE) == ONE))
+    for p in TRIAL_PRIMES:
+        idx = idx[n[idx] % p != ZERO]
+
+    idx = idx[~is_square(n[idx])]
+    if not idx.size:
+        return result
+
+    m = n[idx]
+    bits = int(m.max()).bit_length() + 1
+    mont = Montgomery(m)
+    keep = strong_pseudoprime(m, mont, bits)
+    idx, m = idx[keep], m[keep]
+    if not idx.size:
+        return result
+
+    d, symbol, pending = selfridge_params(m)
+
+    # D with a common factor with n > 10000 means n is composite.
+    keep = (symbol == -1) & ~pending
+    for i in np.flatnonzero(pending):
+        result[idx[i]] = is_prime(int(m[i]))
+    idx, m, d = idx[keep], m[keep], d[keep]
+    if not idx.size:
+        return result
+
+    mont = Montgomery(m)
+    result[idx] = strong_lucas_pseudoprime(m, mont, d, bits)
+
+    return result
+
+
+def test_vector(count=100000):
+    rng = np.random.default_rng()
+
+    for bits in (16, 32, 48, 63):
+        numbers = rng.integers(1, 1 << bits, size=count, dtype=np.uint64, endpoint=False) | ONE
+        sample = [int(x) for x in numbers[:2000]]
+
+        ini = time()
+        flags = is_prime_array(numbers)
+        vector = time() - ini
+
+        ini = time()
+        expected = [is_prime(x) for x in sample]
+        scalar = (time() - ini) * count / len(sample)
+
+        assert list(flags[:len(sample)]) == expected
+        print('%d bits: %d primes of %d, vector %4.8f (%.0f/s), scalar %4.8f (%.0f/s)' %
+              (bits, flags.sum(), count, vector, count / vector, scalar, count / scalar))
+
+
+if __name__ == '__main__':
+    test_vector()
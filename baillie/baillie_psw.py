@@ -1,29 +1,49 @@
 #!/usr/python3
+import os
+import sys
 from time import time
-from primes_list import *
-
-def gcd(a, b):
-    while b:
-        a, b = b, a % b
-    return a
-
-# Newton's method
-def isqrt(n):
-    if n < 0:
-        raise ValueError('Square root is not defined for negative numbers.')
-    
-    x = n
-    y = (x + 1) // 2
-    
-    while y < x:
-        x = y
-        y = (x + n // x) // 2
-    
-    return x
-
-def is_square(n):
-    s = isqrt(n)
-    return s * s == n
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from arith.gcd import gcd
+from arith.jacobi import jacobi
+from arith.modular import ModContext
+from arith.roots import is_square, isqrt
+
+# Test corpora, read from corpus/<name>.bin on first access only.
+CORPORA = ('primes10000', 'primes64', 'primes128', 'primes256', 'primes512')
+
+# Primes used by the batch screen: one gcd against their product replaces the
+# trial division loop of baillie_psw for every candidate of a batch.
+SMALL_PRIMES_BOUND = 1000
+
+# The first Selfridge values of D. (D/n) only depends on n mod 4|D|, so for
+# these D it is looked up in a table of 4|D| symbols.
+SELFRIDGE_FIRST = (5, -7, 9, -11, 13)
+
+_batch_tables = None
+_selfridge_tables = None
+
+# D values tried by selfridge() over all its calls
+selfridge_counts = {'calls': 0, 'tried': 0}
+
+
+def load_primes(name):
+    """
+    One of the CORPORA as a list. Importing this module does not load any of
+    them, so tools that only call is_prime do not pay for the benchmark data.
+    """
+    primes = globals().get(name)
+    if primes is None:
+        from corpus.corpus import load_corpus
+        primes = globals()[name] = list(load_corpus(name))
+    return primes
+
+
+def __getattr__(name):
+    # keeps `from baillie_psw import primes10000` working
+    if name in CORPORA:
+        return load_primes(name)
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
 
 
 def factor(n, p=2):
@@ -41,45 +61,82 @@ def factor(n, p=2):
     return s, n
 
 
-def jacobi(a, p):
-    if (not p & 1) or (p < 0):
-        raise ValueError('p must be a positive odd number.')
+def selfridge_symbols(ds):
+    """
+    (D/r) for every residue r mod 4|D|, zero for even r.
+    """
+    return [jacobi(ds, r) if r & 1 else 0 for r in range(4 * abs(ds))]
 
-    if (a == 0) or (a == 1):
-        return a
 
-    a = a % p
-    t = 1
+def selfridge_tables():
+    """
+    (D, 4|D|, symbols) for each D of SELFRIDGE_FIRST, 180 symbols in all.
+    """
+    global _selfridge_tables
 
-    while a != 0:
-        while not a & 1:
-            a >>= 1
-            if p & 7 in (3, 5):
-                t = -t
-        a, p = p, a
-        if (a & 3 == 3) and (p & 3) == 3:
-            t = -t
-        a = a % p
-    if p == 1:
-        return t
-    return 0
+    if _selfridge_tables is None:
+        _selfridge_tables = [(ds, 4 * abs(ds), selfridge_symbols(ds)) for ds in SELFRIDGE_FIRST]
 
+    return _selfridge_tables
 
-def selfridge(n):
-    d = 5
-    s = 1
-    ds = d * s
+
+def selfridge_walk(n, d=5, s=1):
+    """
+    First D of d * s, -(d + 2) * s, ... with (D/n) != 1 and the number of D
+    values tried. Never returns for a perfect square n.
+    """
+    tried = 0
 
     while True:
+        ds = d * s
+        tried += 1
+
         if gcd(ds, n) > 1:
-            return ds, 0, 0
+            return (ds, 0, 0), tried
 
         if jacobi(ds, n) == -1:
-            return ds, 1, (1 - ds) // 4
+            return (ds, 1, (1 - ds) // 4), tried
 
         d += 2
         s *= -1
-        ds = d * s
+
+
+def selfridge(n):
+    """
+    Selfridge's method A for odd n: (D, P, Q) with D the first of 5, -7, 9,
+    -11, ... such that (D/n) = -1, P = 1 and Q = (1 - D) / 4, or (D, 0, 0) when
+    D shares a factor with n. The first five D come from selfridge_tables().
+
+    A perfect square has no D with (D/n) = -1, and about 1 in 32 non-squares
+    gets past the first five D, so only those are checked with is_square; a
+    square gives (0, 0, 0).
+    """
+    selfridge_counts['calls'] += 1
+
+    for i, (ds, m, symbols) in enumerate(selfridge_tables()):
+        t = symbols[n % m]
+
+        if t != 1:
+            selfridge_counts['tried'] += i + 1
+            # a zero symbol means gcd(D, n mod 4|D|) = gcd(D, n) > 1
+            return (ds, 1, (1 - ds) // 4) if t == -1 else (ds, 0, 0)
+
+    selfridge_counts['tried'] += len(SELFRIDGE_FIRST)
+    if is_square(n):
+        return 0, 0, 0
+
+    last = SELFRIDGE_FIRST[-1]
+    params, tried = selfridge_walk(n, abs(last) + 2, -1 if last > 0 else 1)
+    selfridge_counts['tried'] += tried
+    return params
+
+
+def selfridge_average():
+    """
+    Average number of D values tried per selfridge() call so far.
+    """
+    calls = selfridge_counts['calls']
+    return selfridge_counts['tried'] / calls if calls else 0.0
 
 
 def lucas_sequence(n, u1, v1, u2, v2, d, q, m):
@@ -110,7 +167,8 @@ def lucas_sequence(n, u1, v1, u2, v2, d, q, m):
 
 def strong_pseudoprime(n, base=2, s=None, d=None):
     if not s or not d:
-        s, d = factor(n)
+        ctx = ModContext(n)
+        s, d = ctx.s, ctx.d
 
     x = pow(base, d, n)
 
@@ -124,8 +182,8 @@ def strong_pseudoprime(n, base=2, s=None, d=None):
     return False
 
 
-def strong_lucas_pseudoprime(n):
-    d, p, q = selfridge(n)
+def strong_lucas_pseudoprime(n, params=None):
+    d, p, q = selfridge(n) if params is None else params
 
     if p == 0:
         return n == d
@@ -152,10 +210,11 @@ def baillie_psw(n, limit=100):
     if not n & 1:
         return False
 
-    if n < 2 or is_square(n):
+    # perfect squares are left to selfridge()
+    if n < 2:
         return False
 
-    bound = min(limit, isqrt(n))
+    bound = limit if n >= limit * limit else isqrt(n)
     for i in range(3, bound, 2):
         if not n % i:
             return False
@@ -163,6 +222,51 @@ def baillie_psw(n, limit=100):
     return strong_pseudoprime(n, 2) and strong_lucas_pseudoprime(n)
 
 
+def build_batch_tables():
+    """
+    Setup shared by every call of is_prime_many: the small primes and their
+    primorial.
+    """
+    global _batch_tables
+
+    if _batch_tables is None:
+        small = [p for p in load_primes('primes10000') if p < SMALL_PRIMES_BOUND]
+        primorial = 1
+        for p in small:
+            primorial *= p
+
+        _batch_tables = frozenset(small), small[-1], primorial
+
+    return _batch_tables
+
+
+def is_prime_many(candidates):
+    """
+    Batch version of is_prime. Returns a bytearray with one flag per
+    candidate, 1 for (probable) primes and 0 for composites.
+    """
+    small, largest, primorial = build_batch_tables()
+    result = bytearray()
+
+    for n in candidates:
+        if n <= largest:
+            result.append(n in small)
+            continue
+
+        if gcd(n, primorial) != 1:
+            result.append(0)
+            continue
+
+        # no factor up to largest, so n is prime below largest ** 2
+        if n < largest * largest:
+            result.append(1)
+            continue
+
+        result.append(strong_pseudoprime(n, 2) and strong_lucas_pseudoprime(n))
+
+    return result
+
+
 def is_safe_prime(n):
     return is_prime(n) and is_prime((n - 1) // 2)
 
@@ -174,6 +278,12 @@ def is_prime(n):
 
 
 def test_primes():
+    primes10000 = load_primes('primes10000')
+    primes64 = load_primes('primes64')
+    primes128 = load_primes('primes128')
+    primes256 = load_primes('primes256')
+    primes512 = load_primes('primes512')
+
     q = 0
     ini = time()
     for p in primes10000:
@@ -215,5 +325,44 @@ def test_primes():
     print('primes512: %d primes in %4.8f' % (q, end))
 
 
+def test_batch():
+    build_batch_tables()
+
+    for name in CORPORA:
+        numbers = load_primes(name)
+        ini = time()
+        q = sum(1 for p in numbers if is_prime(p))
+        loop = time() - ini
+
+        ini = time()
+        flags = is_prime_many(numbers)
+        batch = time() - ini
+
+        assert sum(flags) == q
+        print('%s: %d primes, loop %4.8f, batch %4.8f, speedup %.2fx' % (name, q, loop, batch, loop / batch))
+
+
+def test_selfridge():
+    selfridge_tables()
+
+    for name in CORPORA:
+        numbers = [n for n in load_primes(name) if n & 1 and not is_square(n)]
+
+        ini = time()
+        walk = [selfridge_walk(n)[0] for n in numbers]
+        plain = time() - ini
+
+        selfridge_counts.update(calls=0, tried=0)
+        ini = time()
+        fast = [selfridge(n) for n in numbers]
+        table = time() - ini
+
+        assert fast == walk
+        print('%s: %d numbers, walk %4.8f, table %4.8f, %.2f D tried on average' %
+              (name, len(numbers), plain, table, selfridge_average()))
+
+
 if __name__ == '__main__':
     test_primes()
+    test_batch()
+    test_selfridge()
@@ -0,0 +1,228 @@
+#!/usr/python3
+from multiprocessing import Pool, cpu_count
+from random import SystemRandom
+from time import time
+
+from baillie_psw import is_prime, is_safe_prime, primes10000, strong_pseudoprime, strong_lucas_pseudoprime
+
+# Odd primes below 10000. Candidates with a factor among them never reach the
+# (expensive) strong pseudoprime tests.
+SIEVE_PRIMES = primes10000[1:]
+WINDOW = 4096
+MIN_BITS = 16
+
+_random = SystemRandom()
+
+
+def random_odd(bits):
+    """
+    Random odd number with exactly `bits` bits.
+    """
+    return _random.getrandbits(bits) | (1 << (bits - 1)) | 1
+
+
+def sieve_window(residues, window=WINDOW, primes=SIEVE_PRIMES):
+    """
+    Mark the offsets i in [0, window) such that start + 2i has a small factor,
+    where residues[j] == start % primes[j].
+    """
+    composite = bytearray(window)
+    ones = b'\x01' * window
+
+    for p, r in zip(primes, residues):
+        # start + 2i == 0 (mod p)  <=>  i == -r * 2^-1 (mod p)
+        i = (p - r) * ((p + 1) >> 1) % p
+        if i < window:
+            composite[i::p] = ones[:(window - 1 - i) // p + 1]
+
+    return composite
+
+
+def sieve_candidates(start, bits, window=WINDOW, primes=SIEVE_PRIMES):
+    """
+    Yield the odd numbers from start on that survive the small-prime sieve,
+    stopping when they no longer fit in `bits` bits. The residues are only
+    computed once and then moved forward window by window.
+    """
+    residues = [start % p for p in primes]
+    step = 2 * window
+    limit = 1 << bits
+
+    while start < limit:
+        composite = sieve_window(residues, window, primes)
+        for i in range(window):
+            if not composite[i]:
+                n = start + 2 * i
+                if n >= limit:
+                    return
+                yield n
+
+        start += step
+        residues = [(r + step) % p for p, r in zip(primes, residues)]
+
+
+def sieve_window_safe(residues, window=WINDOW, primes=SIEVE_PRIMES):
+    """
+    Same as sieve_window for q = start + 2i, but also marks the offsets where
+    p = 2q + 1 has a small factor, i.e. q == (p - 1) / 2 (mod p).
+    """
+    composite = bytearray(window)
+    ones = b'\x01' * window
+
+    for p, r in zip(primes, residues):
+        half = (p + 1) >> 1
+        for target in (0, p >> 1):
+            i = (target - r) * half % p
+            if i < window:
+                composite[i::p] = ones[:(window - 1 - i) // p + 1]
+
+    return composite
+
+
+def is_probable_prime(n):
+    return strong_pseudoprime(n, 2) and strong_lucas_pseudoprime(n)
+
+
+def random_prime(bits, window=WINDOW, stats=None):
+    """
+    Random prime with exactly `bits` bits: sieve a window of odd numbers after
+    a random start and run BPSW only on the survivors. When `stats` is a dict,
+    the number of starts and tested candidates is added to it.
+    """
+    if bits < MIN_BITS:
+        raise ValueError('bits must be at least %d.' % MIN_BITS)
+
+    while True:
+        if stats is not None:
+            stats['starts'] = stats.get('starts', 0) + 1
+
+        for n in sieve_candidates(random_odd(bits), bits, window):
+            if stats is not None:
+                stats['tested'] = stats.get('tested', 0) + 1
+
+            if is_probable_prime(n):
+                return n
+
+
+def random_safe_prime(bits, window=WINDOW, stats=None):
+    """
+    Random safe prime p = 2q + 1 with exactly `bits` bits. Both q and p are
+    sieved together, then q and p must pass the strong base 2 test before the
+    Lucas part of BPSW runs on any of them.
+    """
+    if bits < MIN_BITS + 1:
+        raise ValueError('bits must be at least %d.' % (MIN_BITS + 1))
+
+    step = 2 * window
+    limit = 1 << (bits - 1)
+
+    while True:
+        if stats is not None:
+            stats['starts'] = stats.get('starts', 0) + 1
+
+        start = random_odd(bits - 1)
+        residues = [start % p for p in SIEVE_PRIMES]
+
+        while start < limit:
+            composite = sieve_window_safe(residues, window)
+            for i in range(window):
+                if composite[i]:
+                    continue
+
+                q = start + 2 * i
+                if q >= limit:
+                    break
+
+                if stats is not None:
+                    stats['tested'] = stats.get('tested', 0) + 1
+
+                p = 2 * q + 1
+                if not strong_pseudoprime(q, 2) or not strong_pseudoprime(p, 2):
+                    continue
+
+                if strong_lucas_pseudoprime(q) and strong_lucas_pseudoprime(p):
+                    return p
+
+            start += step
+            residues = [(r + step) % p for p, r in zip(SIEVE_PRIMES, residues)]
+
+
+def _safe_prime_worker(bits):
+    return random_safe_prime(bits)
+
+
+def random_safe_prime_parallel(bits, workers=None):
+    """
+    Search for a safe prime in several processes, each one from its own random
+    start, and return the first one found.
+    """
+    workers = workers or cpu_count()
+
+    if workers == 1:
+        return random_safe_prime(bits)
+
+    with Pool(workers) as pool:
+        for p in pool.imap_unordered(_safe_prime_worker, [bits] * workers):
+            pool.terminate()
+            return p
+
+
+def naive_random_safe_prime(bits, stats=None):
+    while True:
+        p = 2 * random_odd(bits - 1) + 1
+        if stats is not None:
+            stats['tested'] = stats.get('tested', 0) + 1
+        if is_safe_prime(p):
+            return p
+
+
+def naive_random_prime(bits, stats=None):
+    while True:
+        n = random_odd(bits)
+        if stats is not None:
+            stats['tested'] = stats.get('tested', 0) + 1
+        if is_prime(n):
+            return n
+
+
+def test_generation(count=10):
+    for bits in (512, 1024, 2048):
+        for name, generate in (('naive', naive_random_prime), ('sieve', random_prime)):
+            if name == 'naive' and bits > 1024:
+                continue
+
+            stats = dict()
+            ini = time()
+            for i in range(count):
+                p = generate(bits, stats=stats)
+                assert p.bit_length() == bits and is_prime(p)
+            end = time() - ini
+
+            print('%s %d bits: %d primes in %4.8f, %.1f candidates tested per prime' %
+                  (name, bits, count, end, stats['tested'] / count))
+
+
+def test_safe_generation(count=5):
+    for bits in (256, 512, 1024):
+        for name, generate in (('naive', naive_random_safe_prime), ('sieve', random_safe_prime)):
+            if name == 'naive' and bits > 256:
+                continue
+
+            stats = dict()
+            ini = time()
+            for i in range(count):
+                p = generate(bits, stats=stats)
+                assert p.bit_length() == bits and is_safe_prime(p)
+            end = time() - ini
+
+            print('%s safe %d bits: %d primes in %4.8f, %.1f candidates tested per prime' %
+                  (name, bits, count, end, stats['tested'] / count))
+
+    ini = time()
+    p = random_safe_prime_parallel(1024)
+    print('parallel safe 1024 bits: %d workers, 1 prime in %4.8f' % (cpu_count(), time() - ini))
+
+
+if __name__ == '__main__':
+    test_generation()
+    test_safe_generation()
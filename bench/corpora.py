@@ -0,0 +1,161 @@
+#!/usr/bin/python3
+"""
+Composite corpora for the benchmarks. The prime corpora only measure the
+worst case of each test; these exercise the early exits:
+
+  odd_composites<bits>  random odd composites
+  semiprimes<bits>      products of two random primes of bits / 2
+  carmichael            Carmichael numbers below 2 * 10^5 and Chernick
+                        numbers (6k + 1)(12k + 1)(18k + 1) up to 512 bits
+  spsp2                 strong pseudoprimes to base 2 below 2 * 10^6, composite
+                        Mersenne numbers 2^p - 1 and (4^p + 1) / 5 for prime p
+  lucas_psp             strong Lucas pseudoprimes (Selfridge parameters) below
+                        2 * 10^6
+
+They are generated once by `python bench/corpora.py` and stored next to the
+prime corpora, so every benchmark run sees the same numbers.
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus.corpus import CORPUS_DIR, load_corpus, write_corpus
+from engine.loader import load
+
+SIZES = (64, 128, 256, 512)
+SMALL_BOUND = 2 * 10 ** 6
+SEED = 2021
+
+COMPOSITE_CORPORA = (tuple('odd_composites%d' % bits for bits in SIZES) +
+                     tuple('semiprimes%d' % bits for bits in SIZES) +
+                     ('carmichael', 'spsp2', 'lucas_psp'))
+
+
+def odd_composites(bits, count, rng):
+    is_prime = load('baillie_psw').is_prime
+    numbers = list()
+
+    while len(numbers) < count:
+        n = rng.getrandbits(bits) | (1 << (bits - 1)) | 1
+        if not is_prime(n):
+            numbers.append(n)
+
+    return numbers
+
+
+def semiprimes(bits, count):
+    random_prime = load('prime_gen').random_prime
+    return [random_prime(bits // 2) * random_prime(bits - bits // 2) for i in range(count)]
+
+
+def smallest_factors(bound):
+    spf = list(range(bound))
+    for i in range(2, int(bound ** 0.5) + 1):
+        if spf[i] == i:
+            for j in range(i * i, bound, i):
+                if spf[j] == j:
+                    spf[j] = i
+    return spf
+
+
+def small_carmichael(bound):
+    """
+    Korselt's criterion: n is squarefree, composite, and p - 1 | n - 1 for
+    every prime p | n.
+    """
+    spf = smallest_factors(bound)
+    numbers = list()
+
+    for n in range(3, bound, 2):
+        if spf[n] == n:
+            continue
+
+        m, ok = n, True
+        while m > 1 and ok:
+            p = spf[m]
+            m //= p
+            ok = m % p != 0 and (n - 1) % (p - 1) == 0
+
+        if ok:
+            numbers.append(n)
+
+    return numbers
+
+
+def chernick(bits, count, rng):
+    """
+    Carmichael numbers (6k + 1)(12k + 1)(18k + 1) of about `bits` bits.
+    """
+    is_prime = load('baillie_psw').is_prime
+    k = int((2 ** bits / 1296) ** (1 / 3)) + rng.getrandbits(bits // 8)
+    numbers = list()
+
+    while len(numbers) < count:
+        k += 1
+        if is_prime(6 * k + 1) and is_prime(12 * k + 1) and is_prime(18 * k + 1):
+            numbers.append((6 * k + 1) * (12 * k + 1) * (18 * k + 1))
+
+    return numbers
+
+
+def strong_pseudoprimes_base2(bound):
+    bpsw = load('baillie_psw')
+    return [n for n in range(5, bound, 2) if bpsw.strong_pseudoprime(n, 2) and not bpsw.is_prime(n)]
+
+
+def large_strong_pseudoprimes_base2(max_bits=1024):
+    """
+    A composite 2^p - 1 with p prime is a strong pseudoprime to base 2, and so
+    is (4^p + 1) / 5 for prime p > 5 when composite.
+    """
+    bpsw = load('baillie_psw')
+    numbers = list()
+
+    for p in bpsw.load_primes('primes10000'):
+        if p > max_bits // 2:
+            break
+        for n in (2 ** p - 1, (4 ** p + 1) // 5 if p > 5 else 0):
+            if n > SMALL_BOUND and n.bit_length() <= max_bits and not bpsw.is_prime(n):
+                numbers.append(n)
+
+    return sorted(numbers)
+
+
+def lucas_pseudoprimes(bound):
+    bpsw = load('baillie_psw')
+    return [n for n in range(5, bound, 2)
+            if not bpsw.is_square(n) and bpsw.strong_lucas_pseudoprime(n) and not bpsw.is_prime(n)]
+
+
+def build(count=500):
+    rng = random.Random(SEED)
+    corpora = dict()
+
+    for bits in SIZES:
+        corpora['odd_composites%d' % bits] = odd_composites(bits, count, rng)
+        corpora['semiprimes%d' % bits] = semiprimes(bits, count // 5)
+
+    carmichael = small_carmichael(SMALL_BOUND // 10)
+    for bits in SIZES:
+        carmichael += chernick(bits, 3, rng)
+    corpora['carmichael'] = carmichael
+
+    corpora['spsp2'] = strong_pseudoprimes_base2(SMALL_BOUND) + large_strong_pseudoprimes_base2()
+    corpora['lucas_psp'] = lucas_pseudoprimes(SMALL_BOUND)
+
+    for name, numbers in corpora.items():
+        write_corpus(os.path.join(CORPUS_DIR, name + '.bin'), numbers)
+        print('%s: %d numbers' % (name, len(numbers)))
+
+
+def load_composite_inputs(corpora=COMPOSITE_CORPORA):
+    """
+    {(corpus, 'composite'): numbers}, in the layout used by bench.suite.
+    """
+    return {(name, 'composite'): list(load_corpus(name)) for name in corpora}
+
+
+if __name__ == '__main__':
+    build()
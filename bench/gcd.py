@@ -0,0 +1,105 @@
+#!/usr/bin/python3
+"""
+Python gcd algorithms against math.gcd.
+
+CPython's math.gcd runs Euclid in C for single digit operands and Lehmer's
+algorithm for multi digit ones. lehmer_gcd() and binary_gcd() are the same
+algorithms in Python; this script checks that math.gcd still beats them and
+the plain Euclid loop at every size.
+"""
+import os
+import sys
+from random import getrandbits
+from time import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arith.gcd import gcd
+
+# Lehmer works on the leading DIGIT_BITS bits of the operands, and finishes
+# with Euclid once the smaller one fits in a single digit.
+DIGIT_BITS = 62
+
+
+def euclid_gcd(a, b):
+    a, b = abs(a), abs(b)
+    while b:
+        a, b = b, a % b
+    return a
+
+
+def binary_gcd(a, b):
+    """
+    Stein's algorithm, stripping every trailing zero with one shift.
+    """
+    a, b = abs(a), abs(b)
+    if not a or not b:
+        return a | b
+
+    shift = ((a | b) & -(a | b)).bit_length() - 1
+    a >>= (a & -a).bit_length() - 1
+
+    while b:
+        b >>= (b & -b).bit_length() - 1
+        if a > b:
+            a, b = b, a
+        b -= a
+
+    return a << shift
+
+
+def lehmer_gcd(a, b):
+    """
+    Lehmer's algorithm (Knuth, TAOCP 4.5.2, algorithm L): the quotients of
+    Euclid are guessed from the leading digits of a and b and applied to the
+    full numbers as one 2x2 matrix, so most steps avoid a long division.
+    """
+    a, b = abs(a), abs(b)
+    if a < b:
+        a, b = b, a
+
+    while b >> DIGIT_BITS:
+        shift = a.bit_length() - DIGIT_BITS
+        x, y = a >> shift, b >> shift
+        p, q, r, s = 1, 0, 0, 1
+
+        while y + r and y + s:
+            t = (x + p) // (y + r)
+            if t != (x + q) // (y + s):
+                break
+            p, q, r, s = r, s, p - t * r, q - t * s
+            x, y = y, x - t * y
+
+        if q == 0:
+            a, b = b, a % b
+        else:
+            a, b = p * a + q * b, r * a + s * b
+
+    return euclid_gcd(a, b)
+
+
+def test_gcd(work=1 << 18):
+    functions = (('euclid', euclid_gcd), ('binary', binary_gcd), ('lehmer', lehmer_gcd), ('math.gcd', gcd))
+
+    for bits in (64, 128, 256, 512, 1024, 2048, 4096):
+        pairs = [(getrandbits(bits), getrandbits(bits)) for i in range(max(4, work // bits))]
+        common = getrandbits(bits // 4) | 1
+        pairs += [(a * common, b * common) for a, b in pairs[:len(pairs) // 2]]
+
+        times = dict()
+        for name, f in functions:
+            ini = time()
+            for a, b in pairs:
+                f(a, b)
+            times[name] = time() - ini
+
+        for a, b in pairs[:8] + pairs[-8:]:
+            assert euclid_gcd(a, b) == binary_gcd(a, b) == lehmer_gcd(a, b) == gcd(a, b)
+
+        print('%d bits: %s (%d pairs, math.gcd %.1fx faster than euclid)' %
+              (bits, ', '.join('%s %4.8f' % (name, times[name]) for name, f in functions), len(pairs),
+               times['euclid'] / times['math.gcd']))
+
+
+if __name__ == '__main__':
+    test_gcd()
@@ -0,0 +1,305 @@
+#!/usr/bin/python3
+"""
+Performance regression check.
+
+Times a fixed set of cases on fixed inputs (the primality tests over the
+prime corpora used by test_primes, the lucas_sequence / jacobi / pow kernels
+on seeded primes per bit size, and rho / p - 1 splitting seeded
+semiprimes), appends the run
+to a history file (CSV, or JSON when the name ends in .json) and compares it
+with a stored baseline.
+
+A case regresses when its median trial is more than `threshold` slower than
+the baseline and a one-sided Mann-Whitney U test over the trial times says
+the slowdown is significant at `alpha`. The exit status is 1 if any case
+regressed, so it can gate CI. Without a baseline (or with --update-baseline)
+the run becomes the new baseline. A baseline taken with another --count or
+seed timed other inputs, so it is not compared against (exit status 2).
+"""
+import argparse
+import csv
+import json
+import math
+import os
+import random
+import statistics
+import sys
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench.suite import environment, measure
+from corpus.corpus import load_corpus
+from engine.loader import load
+from engine.screen import TESTS, get_test
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+HISTORY = os.path.join(BENCH_DIR, 'history.csv')
+BASELINE = os.path.join(BENCH_DIR, 'baseline.json')
+
+SIZES = (64, 128, 256, 512)
+COUNT = 100
+REPEAT = 9
+WARMUP = 1
+THRESHOLD = 0.10
+ALPHA = 0.01
+SEED = 2021
+
+# rho splits semiprimes with two factors of these sizes; p - 1 splits a
+# factor of this size with SMOOTH_BOUND-smooth p - 1 times a 64 bit prime
+FACTOR_BITS = (16, 20, 24)
+SMOOTH_BOUND = 1000
+
+
+def next_prime(n, is_prime):
+    n |= 1
+    while not is_prime(n):
+        n += 2
+    return n
+
+
+def seeded_primes(bits, count, rng, prime_gen):
+    """
+    count primes of exactly `bits` bits, each the first sieve survivor after
+    a start drawn from rng that passes BPSW.
+    """
+    primes = list()
+
+    while len(primes) < count:
+        start = rng.getrandbits(bits) | 1 << (bits - 1) | 1
+        for n in prime_gen.sieve_candidates(start, bits):
+            if prime_gen.is_probable_prime(n):
+                primes.append(n)
+                break
+
+    return primes
+
+
+def smooth_prime(bits, small, rng, is_prime):
+    """
+    Prime p of about `bits` bits with p - 1 built from the primes in small.
+    """
+    while True:
+        m = 2
+        while m.bit_length() < bits:
+            m *= rng.choice(small)
+        if is_prime(m + 1):
+            return m + 1
+
+
+def lucas_case(bpsw, n):
+    d, p, q = bpsw.selfridge(n)
+    return lambda: bpsw.lucas_sequence(n, 1, p, 1, p, d, q, (n + 1) >> 1)
+
+
+def build_cases(count=COUNT):
+    """
+    {name: (function, inputs)}. Inputs are the same on every run: corpus
+    prefixes, or numbers drawn from a seeded generator.
+    """
+    bpsw = load('baillie_psw')
+    prime_gen = load('prime_gen')
+    is_prime = bpsw.is_prime
+    cases = dict()
+
+    for bits in SIZES:
+        corpus = 'primes%d' % bits
+        numbers = list(load_corpus(corpus))[:count]
+        # the corpora hold only a few primes at 256 and 512 bits
+        primes = seeded_primes(bits, count, random.Random('%d/%d' % (SEED, bits)), prime_gen)
+
+        for test in sorted(TESTS):
+            cases['%s/%s' % (test, corpus)] = (get_test(test), numbers)
+
+        cases['pow/%d' % bits] = (lambda n: pow(2, n - 1, n), primes)
+        cases['jacobi/%d' % bits] = (lambda n: bpsw.jacobi(n >> 1, n), primes)
+        # selfridge is kept out of the timed call
+        cases['lucas_sequence/%d' % bits] = (lambda f: f(), [lucas_case(bpsw, p) for p in primes])
+
+    rng = random.Random(SEED)
+    rho = load('rho')
+    smooth = load('smooth')
+    small = list(smooth.cached_primes(SMOOTH_BOUND))
+
+    for bits in FACTOR_BITS:
+        semiprimes = [next_prime(rng.getrandbits(bits) | 1 << (bits - 1), is_prime) *
+                      next_prime(rng.getrandbits(bits) | 1 << (bits - 1), is_prime) for i in range(count // 10)]
+        cases['rho/%d' % (2 * bits)] = (rho.find_divisor, semiprimes)
+
+        semiprimes = [smooth_prime(bits, small, rng, is_prime) *
+                      next_prime(rng.getrandbits(64) | 1 << 63, is_prime) for i in range(count // 10)]
+        cases['smooth/%d' % bits] = (lambda n: smooth.find_factors(n, SMOOTH_BOUND), semiprimes)
+
+    return cases
+
+
+def run(cases, repeat=REPEAT, warmup=WARMUP, report=print):
+    """
+    {name: trial times in ns}, one total per repetition over all inputs.
+
+    The repetitions go round-robin over the cases, so a slow phase of the
+    machine spreads over every case instead of shifting one of them, and
+    shows up in the spread the U test sees.
+    """
+    for name, (function, inputs) in cases.items():
+        measure(function, inputs, 0, warmup)
+
+    trials = {name: list() for name in cases}
+    for i in range(repeat):
+        for name, (function, inputs) in cases.items():
+            random.seed(SEED)
+            trials[name] += measure(function, inputs, 1, 0)[1]
+
+    if report:
+        for name, (function, inputs) in cases.items():
+            report('%-34s %5d  median %12.0f ns' % (name, len(inputs), statistics.median(trials[name])))
+
+    return trials
+
+
+def mann_whitney(baseline, current):
+    """
+    One-sided p-value for `current` being stochastically larger than
+    `baseline`, from the normal approximation of the U statistic with a
+    continuity and tie correction.
+    """
+    n1, n2 = len(baseline), len(current)
+    pooled = sorted([(x, 0) for x in baseline] + [(x, 1) for x in current])
+
+    ranks, ties, i = [0.0] * len(pooled), 0, 0
+    while i < len(pooled):
+        j = i
+        while j + 1 < len(pooled) and pooled[j + 1][0] == pooled[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        ties += (j - i + 1) ** 3 - (j - i + 1)
+        i = j + 1
+
+    u = sum(r for r, (x, group) in zip(ranks, pooled) if group) - n2 * (n2 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def compare(baseline, trials, threshold=THRESHOLD, alpha=ALPHA):
+    """
+    One row per case: medians, their ratio, the p-value and whether the case
+    regressed. Cases missing from the baseline are reported as new.
+    """
+    rows = list()
+
+    for name, current in trials.items():
+        row = dict(case=name, median_ns=statistics.median(current))
+
+        if name in baseline:
+            row['baseline_ns'] = statistics.median(baseline[name])
+            row['ratio'] = row['median_ns'] / row['baseline_ns']
+            row['p_value'] = mann_whitney(baseline[name], current)
+            row['regressed'] = row['ratio'] > 1 + threshold and row['p_value'] < alpha
+        else:
+            row.update(baseline_ns=None, ratio=None, p_value=None, regressed=False)
+
+        rows.append(row)
+
+    return rows
+
+
+def read_baseline(path):
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def write_baseline(path, trials, repeat, warmup, count):
+    with open(path, 'w') as f:
+        json.dump({'environment': environment(), 'repeat': repeat, 'warmup': warmup, 'count': count,
+                   'seed': SEED, 'trials': trials}, f, indent=2)
+
+
+def append_history(path, rows):
+    """
+    Append this run to the history: CSV rows, or a JSON list of runs.
+    """
+    timestamp = datetime.now(timezone.utc).isoformat(timespec='seconds')
+    python = environment()['python']
+    records = [dict(timestamp=timestamp, python=python, **row) for row in rows]
+
+    if path.endswith('.json'):
+        history = list()
+        if os.path.exists(path):
+            with open(path) as f:
+                history = json.load(f)
+        history.append({'timestamp': timestamp, 'environment': environment(), 'results': rows})
+        with open(path, 'w') as f:
+            json.dump(history, f, indent=2)
+        return
+
+    new = not os.path.exists(path)
+    with open(path, 'a', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(records[0]))
+        if new:
+            writer.writeheader()
+        writer.writerows(records)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Check the benchmarks against a stored baseline.')
+    parser.add_argument('--cases', nargs='+', help='only the cases whose name starts with one of these')
+    parser.add_argument('--count', type=int, default=COUNT, help='inputs per corpus')
+    parser.add_argument('--repeat', type=int, default=REPEAT)
+    parser.add_argument('--warmup', type=int, default=WARMUP)
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help='relative slowdown of the median that counts as a regression')
+    parser.add_argument('--alpha', type=float, default=ALPHA, help='significance level of the U test')
+    parser.add_argument('--history', default=HISTORY, help='.csv or .json file the run is appended to')
+    parser.add_argument('--baseline', default=BASELINE)
+    parser.add_argument('--update-baseline', action='store_true', help='store this run as the baseline')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    cases = build_cases(args.count)
+    if args.cases:
+        cases = {name: case for name, case in cases.items() if name.startswith(tuple(args.cases))}
+
+    if not cases:
+        print('no cases selected')
+        return 2
+
+    baseline = read_baseline(args.baseline)
+    if baseline is not None and not args.update_baseline:
+        inputs = (baseline.get('count'), baseline.get('seed'))
+        if inputs != (args.count, SEED):
+            print('%s was taken with --count %s and seed %s, not --count %d and seed %d; '
+                  'rerun with --update-baseline' % ((args.baseline,) + inputs + (args.count, SEED)))
+            return 2
+
+    trials = run(cases, args.repeat, args.warmup)
+    rows = compare(baseline['trials'] if baseline else dict(), trials, args.threshold, args.alpha)
+    append_history(args.history, rows)
+
+    if baseline is None or args.update_baseline:
+        write_baseline(args.baseline, trials, args.repeat, args.warmup, args.count)
+        print('baseline written to %s' % args.baseline)
+        return 0
+
+    regressions = [row for row in rows if row['regressed']]
+    for row in rows:
+        if row['ratio'] is not None:
+            print('%-34s %7.3fx  p %.4f%s' % (row['case'], row['ratio'], row['p_value'],
+                                             '  REGRESSION' if row['regressed'] else ''))
+
+    print('%d regressions in %d cases' % (len(regressions), len(rows)))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,61 @@
+#!/usr/bin/python3
+"""
+Square and perfect power tests of arith.roots against the Newton isqrt.
+
+newton_isqrt() is the Newton iteration from x = n that baillie_psw used
+before math.isqrt; the square test built on it is what is_square() replaced.
+"""
+import os
+import sys
+from random import getrandbits
+from time import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arith.roots import is_perfect_power, is_power, is_square, isqrt, perfect_power
+
+
+def newton_isqrt(n):
+    if n < 0:
+        raise ValueError('Square root is not defined for negative numbers.')
+
+    x = n
+    y = (x + 1) // 2
+
+    while y < x:
+        x = y
+        y = (x + n // x) // 2
+
+    return x
+
+
+def test_roots(count=2000, rounds=3):
+    def best(f, numbers):
+        elapsed = float('inf')
+        for i in range(rounds):
+            ini = time()
+            for n in numbers:
+                f(n)
+            elapsed = min(elapsed, time() - ini)
+        return elapsed
+
+    for bits in (64, 128, 256, 512, 1024, 2048):
+        numbers = [getrandbits(bits) | (1 << (bits - 1)) | 1 for i in range(count)]
+        powers = [getrandbits(bits // 3) ** 3 for i in range(count // 10)]
+
+        for n in numbers[:32]:
+            assert newton_isqrt(n) == isqrt(n)
+            assert is_square(n * n) and is_power(n ** 3, 3) == n and perfect_power(n ** 5) == (n, 5)
+        assert all(is_perfect_power(n) for n in powers if n > 3)
+
+        newton = best(lambda n: newton_isqrt(n) ** 2 == n, numbers)
+        square = best(is_square, numbers)
+        power = best(is_perfect_power, numbers)
+
+        print('%d bits: newton square test %4.8f, is_square %4.8f (%.0fx), is_perfect_power %4.8f (%d numbers)' %
+              (bits, newton, square, newton / square, power, count))
+
+
+
+if __name__ == '__main__':
+    test_roots()
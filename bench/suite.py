@@ -0,0 +1,169 @@
+#!/usr/bin/python3
+"""
+Benchmark suite for the primality tests.
+
+Every test runs over the same inputs: the primes64..primes512 corpora, each
+split into its primes and its composites. Each (test, corpus, kind) is run
+once as warmup and then `repeat` times; every call is timed with
+perf_counter_ns, so the report has per-call median/p95/p99 latencies and
+ops/sec from the median trial. Results can be written as JSON.
+
+With --composites the inputs are the composite corpora of bench.corpora
+instead (random odd composites, semiprimes, Carmichael numbers and strong
+pseudoprimes), so the latencies are the time each test takes to reject a
+composite; `accepted` counts the composites a test wrongly called prime.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+from time import perf_counter_ns
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench.corpora import COMPOSITE_CORPORA, load_composite_inputs
+from corpus.corpus import load_corpus
+from engine.loader import load
+from engine.screen import TESTS, get_test
+
+CORPORA = ('primes64', 'primes128', 'primes256', 'primes512')
+REPEAT = 5
+WARMUP = 1
+
+
+def percentile(samples, q):
+    """
+    Nearest-rank percentile of sorted samples.
+    """
+    k = max(0, min(len(samples) - 1, round(q / 100 * len(samples)) - 1))
+    return samples[k]
+
+
+def summarize(samples, trials):
+    samples = sorted(samples)
+    median_trial = statistics.median(trials)
+
+    return {
+        'calls': len(samples),
+        'mean_ns': statistics.fmean(samples),
+        'stdev_ns': statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        'median_ns': percentile(samples, 50),
+        'p95_ns': percentile(samples, 95),
+        'p99_ns': percentile(samples, 99),
+        'trial_ns': trials,
+        'ops_per_sec': len(samples) / len(trials) / (median_trial / 1e9) if median_trial else 0.0,
+    }
+
+
+def measure(function, numbers, repeat=REPEAT, warmup=WARMUP):
+    """
+    Per-call times (ns) of function over numbers for `repeat` trials, and the
+    total time of each trial.
+    """
+    for i in range(warmup):
+        for n in numbers:
+            function(n)
+
+    samples, trials = list(), list()
+    for i in range(repeat):
+        trial = 0
+        for n in numbers:
+            ini = perf_counter_ns()
+            function(n)
+            elapsed = perf_counter_ns() - ini
+            samples.append(elapsed)
+            trial += elapsed
+        trials.append(trial)
+
+    return samples, trials
+
+
+def load_inputs(corpora=CORPORA):
+    """
+    {(corpus, kind): numbers}, with kind 'prime' or 'composite' as decided by
+    baillie_psw.is_prime.
+    """
+    is_prime = load('baillie_psw').is_prime
+    inputs = dict()
+
+    for name in corpora:
+        numbers = list(load_corpus(name))
+        inputs[(name, 'prime')] = [n for n in numbers if is_prime(n)]
+        inputs[(name, 'composite')] = [n for n in numbers if not is_prime(n)]
+
+    return inputs
+
+
+def run(tests=tuple(sorted(TESTS)), inputs=None, repeat=REPEAT, warmup=WARMUP, report=print):
+    inputs = inputs or load_inputs()
+    results = list()
+
+    for test in tests:
+        function = get_test(test)
+
+        for (corpus, kind), numbers in inputs.items():
+            if not numbers:
+                continue
+
+            samples, trials = measure(function, numbers, repeat, warmup)
+            result = dict(test=test, corpus=corpus, kind=kind, count=len(numbers))
+            if kind == 'composite':
+                result['accepted'] = sum(1 for n in numbers if function(n))
+            result.update(summarize(samples, trials))
+            results.append(result)
+
+            if report:
+                report('%-16s %-17s %-9s %5d  median %9.0f ns  p95 %9.0f ns  p99 %9.0f ns  %10.1f ops/s%s' %
+                       (test, corpus, kind, len(numbers), result['median_ns'], result['p95_ns'],
+                        result['p99_ns'], result['ops_per_sec'],
+                        '  accepted %d' % result['accepted'] if result.get('accepted') else ''))
+
+    return results
+
+
+def environment():
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'system': platform.system(),
+    }
+
+
+def write_json(path, results, repeat, warmup):
+    with open(path, 'w') as f:
+        json.dump({'environment': environment(), 'repeat': repeat, 'warmup': warmup, 'results': results},
+                  f, indent=2)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the primality tests.')
+    parser.add_argument('--tests', nargs='+', default=sorted(TESTS), choices=sorted(TESTS))
+    parser.add_argument('--corpora', nargs='+', choices=CORPORA + COMPOSITE_CORPORA,
+                        help='default: the prime corpora, or every composite corpus with --composites')
+    parser.add_argument('--composites', action='store_true',
+                        help='time-to-reject over the composite corpora of bench.corpora')
+    parser.add_argument('--repeat', type=int, default=REPEAT)
+    parser.add_argument('--warmup', type=int, default=WARMUP)
+    parser.add_argument('--json', help='write the results to this file')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.composites:
+        inputs = load_composite_inputs(args.corpora or COMPOSITE_CORPORA)
+    else:
+        inputs = load_inputs(args.corpora or CORPORA)
+
+    results = run(args.tests, inputs, args.repeat, args.warmup)
+
+    if args.json:
+        write_json(args.json, results, args.repeat, args.warmup)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/python3
+"""
+Binary corpora of test numbers.
+
+A corpus file is a header (magic, format version, number count) followed by
+one record per number: a 2-byte big-endian length and the number itself as
+big-endian unsigned bytes. Files are memory-mapped and numbers are decoded
+one at a time while iterating, so nothing is built at import time.
+"""
+import mmap
+import os
+import struct
+
+CORPUS_DIR = os.path.dirname(os.path.abspath(__file__))
+MAGIC = b'PCOR'
+VERSION = 1
+HEADER = struct.Struct('>4sBI')
+LENGTH = struct.Struct('>H')
+
+_corpora = dict()
+
+
+class Corpus:
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.count = HEADER.unpack_from(self.map)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('%s is not a version %d corpus file.' % (path, VERSION))
+
+        self.path = path
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        data = self.map
+        offset = HEADER.size
+
+        for i in range(self.count):
+            size, = LENGTH.unpack_from(data, offset)
+            offset += LENGTH.size
+            yield int.from_bytes(data[offset:offset + size], 'big')
+            offset += size
+
+
+def write_corpus(path, numbers):
+    numbers = list(numbers)
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(numbers)))
+        for n in numbers:
+            if n < 0:
+                raise ValueError('Only non-negative numbers can be stored.')
+            data = n.to_bytes((n.bit_length() + 7) // 8, 'big')
+            f.write(LENGTH.pack(len(data)))
+            f.write(data)
+
+
+def load_corpus(name):
+    """
+    The corpus CORPUS_DIR/<name>.bin, opened once per process.
+    """
+    if name not in _corpora:
+        _corpora[name] = Corpus(os.path.join(CORPUS_DIR, name + '.bin'))
+    return _corpora[name]
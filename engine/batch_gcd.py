@@ -0,0 +1,256 @@
+#!/usr/bin/python3
+"""
+Bernstein's batch gcd, run in front of the rho and p - 1 factorers.
+
+For moduli N_1..N_m the product tree gives P = N_1 ... N_m, and the
+remainder tree reduces P modulo every N_i^2 on the way down, so
+
+    g_i = gcd(N_i, (P mod N_i^2) / N_i)
+
+is the product of the primes N_i shares with the other moduli, for all i in
+quasi-linear time. Moduli that share a prime are split by one division and
+never reach rho or p - 1.
+
+Moduli are streamed from a file and each tree level is a Level: it stays in
+memory until it outgrows the memory budget and then moves to a temporary
+file, so only a couple of levels are ever held in memory at once.
+"""
+import argparse
+import os
+import struct
+import sys
+import tempfile
+from random import randint
+from time import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arith.gcd import gcd
+from corpus.corpus import Corpus
+from engine.loader import load
+
+# Bytes of numbers a Level keeps in memory before it spills to disk.
+MEMORY_BUDGET = 64 << 20
+LENGTH = struct.Struct('>Q')
+# p - 1 bound for the smooth fallback, as in its own test loop.
+SMOOTH_BOUND = 1000
+
+
+def read_moduli(path):
+    """
+    Moduli from a corpus file (.bin) or a text file with one number per line,
+    decimal or 0x-prefixed hex. Blank lines and # comments are skipped.
+    """
+    if path.endswith('.bin'):
+        yield from Corpus(path)
+        return
+
+    with open(path) as f:
+        for line in f:
+            line = line.split('#', 1)[0].strip()
+            if line:
+                yield int(line, 0)
+
+
+class Level:
+    """
+    One level of a product or remainder tree, written once and then read
+    sequentially as many times as needed.
+    """
+
+    def __init__(self, numbers, budget=MEMORY_BUDGET, directory=None):
+        self.numbers = list()
+        self.file = None
+        self.count = size = 0
+
+        for n in numbers:
+            self.count += 1
+
+            if self.file is not None:
+                self.write(n)
+                continue
+
+            self.numbers.append(n)
+            size += (n.bit_length() + 7) // 8
+            if size > budget:
+                self.file = tempfile.TemporaryFile(dir=directory)
+                for m in self.numbers:
+                    self.write(m)
+                self.numbers = None
+
+    def write(self, n):
+        data = n.to_bytes((n.bit_length() + 7) // 8, 'big')
+        self.file.write(LENGTH.pack(len(data)))
+        self.file.write(data)
+
+    @property
+    def spilled(self):
+        return self.file is not None
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        if self.file is None:
+            yield from self.numbers
+            return
+
+        f = self.file
+        f.flush()
+        f.seek(0)
+        for i in range(self.count):
+            size, = LENGTH.unpack(f.read(LENGTH.size))
+            yield int.from_bytes(f.read(size), 'big')
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+        self.numbers = self.file = None
+
+
+def pairs(numbers):
+    it = iter(numbers)
+    for a in it:
+        yield a, next(it, None)
+
+
+def product_tree(moduli, budget=MEMORY_BUDGET, directory=None):
+    """
+    Levels from the leaves (the moduli) up to the root [N_1 ... N_m]; an odd
+    node out is carried up unchanged.
+    """
+    levels = [Level(moduli, budget, directory)]
+
+    while len(levels[-1]) > 1:
+        level = ((a if b is None else a * b) for a, b in pairs(levels[-1]))
+        levels.append(Level(level, budget, directory))
+
+    return levels
+
+
+def remainders(levels, budget=MEMORY_BUDGET, directory=None):
+    """
+    P mod N_i^2 for every leaf, reducing the parent's remainder modulo the
+    square of each node on the way down. Consumes and closes the levels.
+    """
+    rems = Level(levels[-1], budget, directory)
+    levels.pop().close()
+
+    while levels:
+        nodes = levels.pop()
+        parents = iter(rems)
+        parent = None
+
+        def reduced():
+            nonlocal parent
+            for i, node in enumerate(nodes):
+                if not i & 1:
+                    parent = next(parents)
+                yield parent % (node * node)
+
+        level = Level(reduced(), budget, directory)
+        rems.close()
+
+        if not levels:
+            yield from zip(nodes, level)
+            level.close()
+        else:
+            rems = level
+        nodes.close()
+
+
+def batch_gcd(moduli, budget=MEMORY_BUDGET, directory=None):
+    """
+    (n, g) for every modulus, in order, where g = gcd(n, product of the other
+    moduli). g == 1 when n shares no prime; g == n when every prime of n shows
+    up elsewhere (a repeated modulus, for instance), which the batch cannot
+    split.
+    """
+    levels = product_tree(moduli, budget, directory)
+
+    if len(levels) == 1:
+        # zero or one modulus, nothing to share
+        yield from ((n, 1) for n in levels.pop())
+        return
+
+    for n, r in remainders(levels, budget, directory):
+        yield n, gcd(n, r // n)
+
+
+def split_moduli(moduli, fallback='rho', budget=MEMORY_BUDGET, directory=None):
+    """
+    (n, f1, f2, source) for every modulus: split by the batch gcd when n
+    shares a prime with another modulus, and otherwise by rho or p - 1
+    (fallback 'rho', 'smooth' or None to leave it as (n, 1)).
+    """
+    if fallback == 'rho':
+        factor = load('rho').find_two_factors
+    elif fallback == 'smooth':
+        find_factors = load('smooth').find_factors
+        factor = lambda n: find_factors(n, SMOOTH_BOUND)
+    elif fallback is None:
+        factor = lambda n: (n, 1)
+    else:
+        raise ValueError('Unknown fallback %r, expected rho, smooth or None.' % fallback)
+
+    for n, g in batch_gcd(moduli, budget, directory):
+        if 1 < g < n:
+            yield n, g, n // g, 'batch'
+        else:
+            f1, f2 = factor(n)
+            yield n, f1, f2, fallback or 'none'
+
+
+def test_batch_gcd(count=2000, bits=256, shared=50):
+    """
+    count RSA-like moduli where `shared` pairs reuse a prime, split by the
+    batch and by pairwise gcds, and once more with a budget small enough
+    that every level spills to disk.
+    """
+    rho = load('rho')
+    primes = [rho.probable_prime(bits // 2) for i in range(2 * count - shared)]
+    moduli = [primes[2 * i] * primes[2 * i + 1] for i in range(count - shared)]
+    moduli += [primes[randint(0, len(moduli) - 1)] * primes[2 * (count - shared) + i] for i in range(shared)]
+
+    ini = time()
+    found = [n for n, g in batch_gcd(moduli) if g > 1]
+    batch = time() - ini
+
+    ini = time()
+    spilled = [n for n, g in batch_gcd(moduli, budget=1 << 12) if g > 1]
+    disk = time() - ini
+    assert spilled == found
+
+    sample = moduli[:200] + moduli[-shared:]
+    ini = time()
+    pairwise = [n for n in sample if any(gcd(n, m) > 1 for m in moduli if m != n)]
+    naive = (time() - ini) * count / len(sample)
+    members = set(sample)
+    assert pairwise == [n for n in found if n in members]
+
+    print('%d moduli of %d bits: %d share a prime, batch %4.8f, spilled %4.8f, pairwise ~%4.8f' %
+          (count, bits, len(found), batch, disk, naive))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Split moduli that share primes, then factor the rest.')
+    parser.add_argument('path', help='text file with one modulus per line, or a .bin corpus')
+    parser.add_argument('--fallback', choices=('rho', 'smooth', 'none'), default='rho')
+    parser.add_argument('--budget', type=int, default=MEMORY_BUDGET >> 20, help='MiB per tree level in memory')
+    parser.add_argument('--spill-dir', help='directory for the spilled levels')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    fallback = None if args.fallback == 'none' else args.fallback
+
+    for n, f1, f2, source in split_moduli(read_moduli(args.path), fallback, args.budget << 20, args.spill_dir):
+        print('%d ; %d, %d ; %s' % (n, f1, f2, source))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        main()
+    else:
+        test_batch_gcd()
@@ -0,0 +1,192 @@
+#!/usr/bin/python3
+import atexit
+import os
+import sqlite3
+import sys
+from ast import literal_eval
+from collections import OrderedDict
+from time import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus.corpus import load_corpus
+from engine.loader import load
+
+MAX_SIZE = 1 << 16
+# The disk store commits after this many new results (and at exit).
+COMMIT_EVERY = 256
+
+# cached name -> (script, function); factorize lives in engine.factorize
+FUNCTIONS = {
+    'is_prime': ('baillie_psw', 'is_prime'),
+    'miller_rabin': ('miller_rabin', 'miller_rabin'),
+    'solovay_strassen': ('solovay_strassen', 'solovay_strassen'),
+    'find_two_factors': ('rho', 'find_two_factors'),
+    'factorize': (None, 'factorize'),
+}
+
+_store = None
+_cached = dict()
+
+
+def key(n):
+    return n.to_bytes(n.bit_length() // 8 + 1, 'big', signed=True)
+
+
+class DiskStore:
+    """
+    Results kept in SQLite, keyed by the function name and the bytes of n.
+    Values are stored with repr() and read back with literal_eval, which is
+    enough for the bools, tuples and dicts of ints returned here.
+    """
+
+    def __init__(self, path):
+        self.db = sqlite3.connect(path)
+        self.db.execute('CREATE TABLE IF NOT EXISTS results '
+                        '(function TEXT, key BLOB, value TEXT, PRIMARY KEY (function, key))')
+        self.pending = 0
+
+    def get(self, function, n):
+        row = self.db.execute('SELECT value FROM results WHERE function = ? AND key = ?',
+                              (function, key(n))).fetchone()
+        return (False, None) if row is None else (True, literal_eval(row[0]))
+
+    def put(self, function, n, value):
+        self.db.execute('INSERT OR REPLACE INTO results VALUES (?, ?, ?)', (function, key(n), repr(value)))
+        self.pending += 1
+        if self.pending >= COMMIT_EVERY:
+            self.commit()
+
+    def commit(self):
+        self.db.commit()
+        self.pending = 0
+
+    def close(self):
+        self.commit()
+        self.db.close()
+
+
+class CachedFunction:
+    """
+    Memoizes a function of one integer with a bounded LRU in memory and,
+    when a DiskStore is open, a persistent store behind it.
+    """
+
+    def __init__(self, name, function, maxsize=MAX_SIZE):
+        self.name = name
+        self.function = function
+        self.maxsize = maxsize
+        self.lru = OrderedDict()
+        self.hits = self.disk_hits = self.misses = 0
+
+    def __call__(self, n):
+        lru = self.lru
+
+        if n in lru:
+            self.hits += 1
+            lru.move_to_end(n)
+            value = lru[n]
+        else:
+            found, value = _store.get(self.name, n) if _store else (False, None)
+
+            if found:
+                self.disk_hits += 1
+            else:
+                self.misses += 1
+                value = self.function(n)
+                if _store:
+                    _store.put(self.name, n, value)
+
+            lru[n] = value
+            if len(lru) > self.maxsize:
+                lru.popitem(last=False)
+
+        return dict(value) if isinstance(value, dict) else value
+
+    def stats(self):
+        calls = self.hits + self.disk_hits + self.misses
+        return {
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'size': len(self.lru),
+            'hit_rate': (self.hits + self.disk_hits) / calls if calls else 0.0,
+        }
+
+    def clear(self):
+        self.lru.clear()
+        self.hits = self.disk_hits = self.misses = 0
+
+
+def open_store(path):
+    """
+    Keep results on disk at path, shared by every cached function.
+    """
+    global _store
+
+    close_store()
+    _store = DiskStore(path)
+
+
+def close_store():
+    global _store
+
+    if _store is not None:
+        _store.close()
+        _store = None
+
+
+def cached_function(name, maxsize=MAX_SIZE):
+    if name not in _cached:
+        script, function = FUNCTIONS[name]
+        if script is None:
+            from engine.factorize import factorize as f
+        else:
+            f = getattr(load(script), function)
+        _cached[name] = CachedFunction(name, f, maxsize)
+
+    return _cached[name]
+
+
+def is_prime(n):
+    return cached_function('is_prime')(n)
+
+
+def miller_rabin(n):
+    return cached_function('miller_rabin')(n)
+
+
+def solovay_strassen(n):
+    return cached_function('solovay_strassen')(n)
+
+
+def find_two_factors(n):
+    return cached_function('find_two_factors')(n)
+
+
+def factorize(n):
+    return cached_function('factorize')(n)
+
+
+def stats():
+    return {name: f.stats() for name, f in _cached.items()}
+
+
+atexit.register(close_store)
+
+
+def test_cache(rounds=3):
+    numbers = list(load_corpus('primes256'))
+
+    for name in ('is_prime', 'miller_rabin', 'solovay_strassen'):
+        f = cached_function(name)
+        for i in range(rounds):
+            ini = time()
+            q = sum(1 for p in numbers if f(p))
+            end = time() - ini
+            print('%s round %d: %d primes in %4.8f' % (name, i + 1, q, end))
+        print('%s: %s' % (name, f.stats()))
+
+
+if __name__ == '__main__':
+    test_cache()
@@ -0,0 +1,122 @@
+#!/usr/bin/python3
+import os
+import sys
+from collections import Counter
+from random import randint
+from time import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arith.roots import perfect_power
+from engine.loader import load
+
+# Pollard p - 1 bounds tried once on every composite cofactor.
+P_MINUS_1_BOUND = 10000
+# Rounds of rho restarts before split() gives up on a cofactor.
+RHO_ROUNDS = 10
+# Strong pseudoprime to the bases 2, 3, 5, 7, 11, 13 and 17.
+PSEUDOPRIME_2_17 = 341550071728321
+
+
+def trial_division(n, factors):
+    """
+    Divide out the primes below 10000, counting them in factors. Returns the
+    cofactor, whose prime factors are all above 10000.
+    """
+    for p in load('baillie_psw').primes10000:
+        if p * p > n:
+            break
+        while n % p == 0:
+            factors[p] += 1
+            n //= p
+
+    return n
+
+
+def p_minus_1(n):
+    smooth = load('smooth')
+    return smooth.smooth_rho(n, P_MINUS_1_BOUND, smooth.STAGE2_FACTOR * P_MINUS_1_BOUND)
+
+
+def split(n):
+    """
+    Non-trivial divisor of a composite n with no factor below 10000.
+    """
+    d = p_minus_1(n)
+    if d:
+        return d
+
+    # BPSW has already found n composite, so the walks skip the prime check
+    rho = load('rho')
+    for i in range(RHO_ROUNDS):
+        d = rho.find_divisor(n, check_prime=False)
+        if d > 1:
+            return d
+
+    raise ValueError('No divisor of %d found in %d rounds of rho.' % (n, RHO_ROUNDS))
+
+
+def factorize(n):
+    """
+    Prime factorization of n as a dict {prime: multiplicity}.
+
+    Small primes go first by trial division. Each remaining cofactor is
+    checked with BPSW before any factoring work, so primes are never handed
+    to p - 1 or rho; composites are reduced by perfect powers, then split with
+    Pollard p - 1 and finally Brent's rho.
+    """
+    if n < 1:
+        raise ValueError('Only positive integers can be factored.')
+
+    is_prime = load('baillie_psw').is_prime
+    bound = load('baillie_psw').primes10000[-1] + 1
+
+    factors = Counter()
+    n = trial_division(n, factors)
+    pending = [(n, 1)]
+
+    while pending:
+        m, e = pending.pop()
+
+        if m == 1:
+            continue
+
+        # no factor below bound, so m is prime below bound ** 2
+        if m < bound * bound or is_prime(m):
+            factors[m] += e
+            continue
+
+        r, k = perfect_power(m, bound)
+        if k > 1:
+            pending.append((r, e * k))
+            continue
+
+        d = split(m)
+        pending.append((d, e))
+        pending.append((m // d, e))
+
+    return dict(sorted(factors.items()))
+
+
+def test_factorize(count=20, bits=96):
+    rho = load('rho')
+    numbers = [randint(2 ** (bits - 1), 2 ** bits) for i in range(count // 2)]
+    numbers += [rho.probable_prime(bits // 4) * rho.probable_prime(bits // 4) ** 2 for i in range(count // 2)]
+    numbers += [PSEUDOPRIME_2_17, 3 * PSEUDOPRIME_2_17 ** 2]
+
+    for n in numbers:
+        ini = time()
+        factors = factorize(n)
+        elapsed_time = time() - ini
+
+        product = 1
+        for p, e in factors.items():
+            product *= p ** e
+        assert product == n
+
+        print('%d ; %s ; %4.8f' % (n, ' * '.join('%d^%d' % f if f[1] > 1 else '%d' % f[0] for f in factors.items()),
+                                   elapsed_time))
+
+
+if __name__ == '__main__':
+    test_factorize()
@@ -0,0 +1,42 @@
+#!/usr/bin/python3
+import importlib.util
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The algorithms live in standalone scripts (some with dashes in their names),
+# so they are loaded from their paths instead of being imported as packages.
+SCRIPTS = {
+    'baillie_psw': os.path.join('baillie', 'baillie_psw.py'),
+    'prime_gen': os.path.join('baillie', 'prime_gen.py'),
+    'miller_rabin': os.path.join('miller', 'miller-rabin.py'),
+    'solovay_strassen': os.path.join('solovay', 'solovay-strassen.py'),
+    'rho': os.path.join('rho', 'rho.py'),
+    'smooth': os.path.join('smooth', 'smooth-pollard_memory.py'),
+}
+
+
+def load(name):
+    """
+    Load one of the algorithm scripts as a module and cache it in sys.modules.
+    Its directory goes to sys.path so its own sibling imports keep working.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    path = os.path.join(ROOT, SCRIPTS[name])
+    directory = os.path.dirname(path)
+    if directory not in sys.path:
+        sys.path.append(directory)
+
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+
+    return module
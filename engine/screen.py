@@ -0,0 +1,123 @@
+#!/usr/bin/python3
+import os
+import sys
+from collections import deque
+from itertools import islice
+from multiprocessing import Pool, cpu_count
+from time import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus.corpus import load_corpus
+from engine.loader import load
+
+# test name -> (script, function)
+TESTS = {
+    'miller_rabin': ('miller_rabin', 'miller_rabin'),
+    'solovay_strassen': ('solovay_strassen', 'solovay_strassen'),
+    'baillie_psw': ('baillie_psw', 'is_prime'),
+}
+
+# Work per chunk grows with bits ** 2 (a little more, really), so chunks of
+# small numbers are made longer to keep the IPC cost per candidate low.
+CHUNK_WORK = 1 << 22
+MIN_CHUNK = 16
+MAX_CHUNK = 4096
+# Chunks submitted per worker and not yet yielded; bounds how far ahead of
+# the consumer an endless stream of candidates is read.
+CHUNKS_IN_FLIGHT = 2
+
+_test = None
+
+
+def get_test(name):
+    if name not in TESTS:
+        raise ValueError('Unknown test %r, expected one of %s.' % (name, ', '.join(sorted(TESTS))))
+
+    script, function = TESTS[name]
+    return getattr(load(script), function)
+
+
+def chunk_size(bits):
+    bits = max(bits, 1)
+    return max(MIN_CHUNK, min(MAX_CHUNK, CHUNK_WORK // (bits * bits)))
+
+
+def chunks(candidates, size=None):
+    """
+    Split a stream of candidates into lists. Without a fixed size, each chunk
+    is sized from the bit length of its first candidate.
+    """
+    it = iter(candidates)
+
+    for first in it:
+        n = size or chunk_size(first.bit_length())
+        chunk = [first]
+        chunk.extend(islice(it, n - 1))
+        yield chunk
+
+
+def _init_worker(name):
+    global _test
+    _test = get_test(name)
+
+
+def _run_chunk(chunk):
+    return bytes(1 if _test(n) else 0 for n in chunk)
+
+
+def screen(candidates, test='baillie_psw', workers=None, size=None):
+    """
+    Run a primality test over a stream of candidates in a process pool.
+    Yields one bool per candidate, in input order.
+    """
+    workers = workers or cpu_count()
+    # an unknown name raises here, not in the pool initializer
+    is_prime = get_test(test)
+
+    if workers == 1:
+        for n in candidates:
+            yield bool(is_prime(n))
+        return
+
+    with Pool(workers, initializer=_init_worker, initargs=(test,)) as pool:
+        pending = deque()
+        it = chunks(candidates, size)
+
+        while True:
+            for chunk in islice(it, workers * CHUNKS_IN_FLIGHT - len(pending)):
+                pending.append(pool.apply_async(_run_chunk, (chunk,)))
+
+            if not pending:
+                break
+
+            for f in pending.popleft().get():
+                yield bool(f)
+
+
+def test_scaling(numbers, test='baillie_psw'):
+    """
+    Time the same corpus with 1, 2, 4, ... workers up to the number of cores.
+    """
+    workers = [1]
+    while workers[-1] * 2 <= cpu_count():
+        workers.append(workers[-1] * 2)
+    if workers[-1] != cpu_count():
+        workers.append(cpu_count())
+
+    base = None
+    for w in workers:
+        ini = time()
+        q = sum(screen(numbers, test, w))
+        elapsed = time() - ini
+        base = base or elapsed
+
+        print('%s: %d workers, %d primes in %4.8f, speedup %.2fx, efficiency %.0f%%' %
+              (test, w, q, elapsed, base / elapsed, 100 * base / elapsed / w))
+
+
+if __name__ == '__main__':
+    numbers = list(load_corpus('primes256')) + list(load_corpus('primes512'))
+
+    for name in sorted(TESTS):
+        test_scaling(numbers, name)
@@ -1,21 +1,36 @@
 #!/usr/bin/python3
+from multiprocessing import Event, Pool, cpu_count
 from random import randint
+import atexit
+import os
+import sys
 import time
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from arith.gcd import gcd
+from arith.roots import perfect_power
+from engine.loader import load
 
-def gcd(m, n):
-    while n != 0:
-        m, n = n, m % n
-    return m
+# Brent multiplies this many |x - y| together before each gcd.
+BRENT_BATCH = 128
+# A walk whose cycle collapses to n is restarted with the next c.
+MAX_RESTARTS = 20
+# find_divisor_parallel first walks alone for about 2 * SHORT_WALK steps,
+# which splits anything with a factor below ~2^30, before racing walks.
+SHORT_WALK = 1 << 14
 
+_pool = None
+_pool_size = 0
+_stop = None
 
-def rho(n):
-    a = b = 2
+
+def rho(n, c=1, seed=2):
+    a = b = seed
 
     while True:
-        a = pow(a, 2, n) + 1 % n
-        b = pow(b, 2, n) + 1 % n
-        b = pow(b, 2, n) + 1 % n
+        a = (a * a + c) % n
+        b = (b * b + c) % n
+        b = (b * b + c) % n
         d = gcd(a - b, n)
 
         if 1 < d < n:
@@ -25,6 +40,164 @@ def rho(n):
             return 1
 
 
+def brent(n, c=1, seed=2, m=BRENT_BATCH, limit=None, stop=None):
+    """
+    Brent's variant of rho for f(x) = x^2 + c. The tortoise only moves at
+    powers of two, so each step costs one squaring, and the |x - y| are
+    multiplied into q so gcd runs once per m steps. When that gcd collapses
+    to n, the last batch is replayed one gcd at a time.
+
+    The walk gives up and returns 1 once the cycle length passes limit, or
+    when stop() is true at a gcd.
+    """
+    y, r, q = seed, 1, 1
+    g = 1
+
+    while g == 1:
+        if limit is not None and r > limit:
+            return 1
+
+        x = y
+        for i in range(r):
+            y = (y * y + c) % n
+
+        k = 0
+        while k < r and g == 1:
+            ys = y
+            for i in range(min(m, r - k)):
+                y = (y * y + c) % n
+                q = q * abs(x - y) % n
+            g = gcd(q, n)
+            k += m
+            if stop is not None and g == 1 and stop():
+                return 1
+
+        r <<= 1
+
+    if g == n:
+        while True:
+            ys = (ys * ys + c) % n
+            g = gcd(abs(x - ys), n)
+            if g > 1:
+                break
+
+    return g if g < n else 1
+
+
+def is_probable_prime(n):
+    """
+    BPSW of an odd n > 3, checked before any walk.
+    """
+    bpsw = load('baillie_psw')
+    return bpsw.strong_pseudoprime(n, 2) and bpsw.strong_lucas_pseudoprime(n)
+
+
+def find_divisor(n, method=brent, c=1, seed=2, restarts=MAX_RESTARTS, check_prime=True):
+    """
+    Non-trivial divisor of n using rho or brent, or 1 if none was found.
+    A prime always collapses to gcd == n, so BPSW probable primes return 1
+    before any walk; callers that already know n is composite skip the
+    check with check_prime=False. Every time the walk of a composite is degenerate it restarts
+    with the next c and a random seed. c = 0 and c = -2 are skipped, since
+    x^2 and x^2 - 2 do not behave like random maps.
+    """
+    if n < 4:
+        return 1
+
+    if n % 2 == 0:
+        return 2
+
+    if check_prime and is_probable_prime(n):
+        return 1
+
+    for i in range(restarts):
+        d = method(n, c, seed)
+        if d > 1:
+            return d
+
+        c += 1
+        while c % n in (0, n - 2):
+            c += 1
+        seed = randint(2, n - 1)
+
+    return 1
+
+
+def _init_worker(stop):
+    global _stop
+    _stop = stop
+
+
+def _walk(args):
+    n, c, seed = args
+    return brent(n, c, seed, stop=_stop.is_set)
+
+
+def get_pool(walks):
+    """
+    The process pool the walks race in. It is created on first use and kept
+    for later calls, and only replaced when a different size is asked for.
+    """
+    global _pool, _pool_size, _stop
+
+    if _pool is None or _pool_size != walks:
+        close_pool()
+        _stop = Event()
+        _pool = Pool(walks, initializer=_init_worker, initargs=(_stop,))
+        _pool_size = walks
+
+    return _pool
+
+
+def close_pool():
+    global _pool
+
+    if _pool is not None:
+        _pool.terminate()
+        _pool.join()
+        _pool = None
+
+
+atexit.register(close_pool)
+
+
+def find_divisor_parallel(n, walks=None):
+    """
+    Non-trivial divisor of n, or 1 if none was found. A short single walk
+    goes first, so small factors never pay for the pool; after it fails,
+    `walks` independent brent walks (c = 2, 3, ... with random seeds) race
+    in the shared pool. The first divisor stops the others at their next gcd.
+    """
+    walks = walks or cpu_count()
+
+    if walks == 1 or n < 4 or n % 2 == 0 or is_probable_prime(n):
+        return find_divisor(n)
+
+    d = brent(n, limit=SHORT_WALK)
+    if d > 1:
+        return d
+
+    args = list()
+    c = 1
+    while len(args) < walks:
+        c += 1
+        if c % n not in (0, n - 2):
+            args.append((n, c, randint(2, n - 1)))
+
+    pool = get_pool(walks)
+    found = 1
+    try:
+        for d in pool.imap_unordered(_walk, args):
+            if d > 1 and found == 1:
+                found = d
+                _stop.set()
+    finally:
+        # every walk has returned, so the flag is free for the next call
+        _stop.clear()
+
+    return found
+
+
 def find_factors(n):
     l = list()
 
@@ -32,7 +205,7 @@ def find_factors(n):
         l.append(2)
         n = n // 2
 
-    r = rho(n)
+    r = find_divisor(n)
     f = n if r == 1 else r
     l.append(f)
     n = n // r
@@ -42,17 +215,66 @@ def find_factors(n):
     return l + find_factors(n) if r > 1 else l
 
 
-def find_two_factors(n):
+def find_two_factors(n, walks=1):
     if n % 2 == 0:
         return 2, n // 2
 
-    r = rho(n)
+    r, k = perfect_power(n)
+    if k > 1:
+        return r, n // r
+
+    r = find_divisor(n) if walks == 1 else find_divisor_parallel(n, walks)
     f = n if r == 1 else r
 
     return f, n // r
 
 
+def probable_prime(bits):
+    while True:
+        p = randint(2 ** (bits - 1), 2 ** bits) | 1
+        if pow(2, p - 1, p) == 1:
+            return p
+
+
+def test_parallel(count=10, bits=34, walks=None):
+    """
+    Semiprimes with two factors of `bits` bits, too large for the short
+    walk, split with one walk and with `walks` racing walks. The pool is
+    started before the clock, as it is reused across calls.
+    """
+    walks = walks or max(cpu_count(), 2)
+    numbers = [probable_prime(bits) * probable_prime(bits) for i in range(count)]
+    get_pool(walks)
+
+    times = dict()
+    for name, w in (('single', 1), ('parallel', walks)):
+        ini = time.time()
+        for n in numbers:
+            d = find_two_factors(n, w)[0]
+            assert 1 < d < n and n % d == 0
+        times[name] = time.time() - ini
+
+    print('%d semiprimes of %d bits: single %4.8f, %d walks %4.8f, speedup %.2fx on %d cores' %
+          (count, 2 * bits, times['single'], walks, times['parallel'], times['single'] / times['parallel'],
+           cpu_count()))
+
+
+def test_brent(count=10, bits=36):
+    numbers = [probable_prime(bits) * probable_prime(bits) for i in range(count)]
+
+    for name, method in (('floyd', rho), ('brent', brent)):
+        ini = time.time()
+        for n in numbers:
+            d = method(n)
+            assert d == 1 or n % d == 0
+        elapsed_time = time.time() - ini
+        print('%s: %d semiprimes of %d bits in %4.8f' % (name, count, 2 * bits, elapsed_time))
+
+
 if __name__ == '__main__':
+    test_brent()
+    test_parallel()
+
     # find_two_factors(161720844233529689499498448342098256937)
 
     # primes128 = [104886234885322983459507420328942558389, 258944132448049816428647600000802608169, 138846131360712174218176189070856607553, 196213069120630278619855713317309441375, 270193651262258175521798716957545296369, 303443603502123595331854851036075679501, 140278711689695351430248546515168364697, 248207264185641974936884365619705013627, 38693845445285424839003090866150421797, 315616169553035005651686106203097758831]
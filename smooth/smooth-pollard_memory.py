@@ -1,69 +1,205 @@
 #!/usr/bin/python3
+from array import array
+from bisect import bisect_left
+from itertools import chain, compress, islice
 from random import randint
-from math import log, sqrt
+from math import log
+import os
+import sys
 import time
 
-# CPU low, MEM intensive
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from arith.gcd import gcd
+from arith.roots import isqrt, perfect_power
+
+# CPU low, MEM bounded by the sieve segment
 
 MAX_TRIES = 15
+SEGMENT_SIZE = 1 << 18
+# Primes below this bound are kept (8 bytes each) between calls.
+MAX_CACHED_BOUND = 10 ** 8
+# Stage 2 covers (B1, STAGE2_FACTOR * B1], one gcd every STAGE2_BATCH primes.
+STAGE2_FACTOR = 100
+STAGE2_BATCH = 256
+
+_cached_primes = array('Q')
+_cached_bound = 0
+
+
+def small_sieve(n):
+    """
+    Odd primes up to n (inclusive), used to cross out the segments.
+    """
+    if n < 3:
+        return []
+
+    size = (n - 1) // 2  # index i stands for 2i + 3
+    odd = bytearray(b'\x01') * size
+    for i in range((isqrt(n) - 1) // 2):
+        if odd[i]:
+            p = 2 * i + 3
+            start = (p * p - 3) // 2
+            odd[start::p] = bytes(len(range(start, size, p)))
+
+    return list(compress(range(3, 2 * size + 3, 2), odd))
+
+
+def sieve(n, segment=SEGMENT_SIZE):
+    """
+    Generator of the primes below n, in order. Only odd numbers are sieved,
+    one bytearray of `segment` flags at a time, so memory does not grow with
+    n beyond the primes up to sqrt(n).
+    """
+    return sieve_range(0, n, segment)
+
+
+def sieve_range(low, high, segment=SEGMENT_SIZE):
+    """
+    Generator of the primes in [low, high), segmented like sieve().
+    """
+    if high <= max(low, 2):
+        return
+    if low <= 2:
+        yield 2
 
+    base = small_sieve(isqrt(high - 1))
+    low = max(low, 3) | 1
 
-def sieve(n):
-    try:
-        psieve = [True] * n
-        psieve[0] = psieve[1] = False  # 0 and 1 are not prime!
-    except (MemoryError, OverflowError) as e:
-        # raise Exception('Not enough memory to create the sieve!')
-        n = n // 2
-        print('Not enough memory to create the sieve! Reducing by half... Testing now with %d.' % n)
-        return sieve(n)
-    except IndexError as e:
-        raise Exception('The number is too small to create the sieve!')
+    while low < high:
+        end = min(low + 2 * segment, high)
+        size = (end - low + 1) // 2  # odd numbers in [low, end)
+        odd = bytearray(b'\x01') * size
 
-    primes = list()
-    for (i, p) in enumerate(psieve):
-        if p:  # if p is marked as prime
-            primes.append(i)
+        for p in base:
+            pp = p * p
+            if pp >= end:
+                break
 
-            for j in range(i * i, n, i):
-                psieve[j] = False  # remove all composites
-    return primes
+            # first odd multiple of p in the segment, skipping p itself
+            start = max(pp, (low + p - 1) // p * p)
+            if not start & 1:
+                start += p
 
+            i = (start - low) // 2
+            odd[i::p] = bytes(len(range(i, size, p)))
 
-def gcd(m, n):
-    while n != 0:
-        m, n = n, m % n
-    return m
+        yield from compress(range(low, end, 2), odd)
+        low += 2 * segment
 
 
-def smooth_rho(n, primes):
+def cached_primes(bound, low=0):
+    """
+    Iterator over the primes in [low, bound). The process keeps one growing
+    table of primes, so a larger bound only sieves [old bound, new bound) and
+    every call (retries and different n alike) reuses it. Past
+    MAX_CACHED_BOUND primes are streamed from the segmented sieve instead of
+    being stored.
+    """
+    global _cached_bound
+
+    limit = min(bound, MAX_CACHED_BOUND)
+    if limit > _cached_bound:
+        _cached_primes.extend(sieve_range(_cached_bound, limit))
+        _cached_bound = limit
+
+    start = bisect_left(_cached_primes, low)
+    if bound <= _cached_bound:
+        return islice(_cached_primes, start, bisect_left(_cached_primes, bound))
+
+    return chain(islice(_cached_primes, start, None), sieve_range(max(low, _cached_bound), bound))
+
+
+def smooth_rho(n, b1, b2=None):
+    """
+    Pollard p - 1 with stage 1 bound b1 and, when b2 is given, stage 2 over
+    the primes in (b1, b2]. The stage 2 primes are only sieved once stage 1
+    has failed.
+    """
     a = randint(2, n - 1)
     d = gcd(a, n)
 
     if d >= 2:
         return d
 
-    for q in primes:
-        l = log(n) // log(q)
-        t = int(pow(q, l))
+    for q in cached_primes(b1):
+        # an integer power: int(pow(q, l)) with a float l loses the low bits
+        l = int(log(n) // log(q))
+        t = q ** l
         a = pow(a, t, n)
 
     d = gcd(a - 1, n)
 
+    if d == 1 and b2 is not None:
+        return stage_two(n, a, cached_primes(b2, max(b1, 3)))
+
     return None if d == 1 or d == n else d
 
 
+def stage_two(n, b, primes):
+    """
+    Standard p - 1 stage 2: b = a^E is the stage 1 result and primes are the
+    odd primes q in (B1, B2]. It finds p when p - 1 is B1-smooth except for a
+    single prime q. Consecutive b^q are linked by b^(gap) taken from a table
+    indexed by the (even) prime gaps, and the b^q - 1 are multiplied together
+    so gcd runs once per STAGE2_BATCH primes.
+    """
+    primes = iter(primes)
+    q = next(primes, None)
+    if q is None:
+        return None
+
+    x = pow(b, q, n)
+    b2 = b * b % n
+    gaps = [1, b2]  # gaps[i] == b^(2i)
+    batch = list()
+    acc = 1
+
+    for r in chain(primes, [None]):
+        batch.append(x)
+        acc = acc * (x - 1) % n
+
+        if len(batch) == STAGE2_BATCH or r is None:
+            d = gcd(acc, n)
+
+            if d == n:
+                # several factors showed up in the same batch, so go back
+                # and look at each b^q on its own
+                for x in batch:
+                    d = gcd(x - 1, n)
+                    if 1 < d < n:
+                        return d
+                return None
+
+            if d > 1:
+                return d
+
+            batch.clear()
+
+        if r is None:
+            return None
+
+        g = (r - q) >> 1
+        while len(gaps) <= g:
+            gaps.append(gaps[-1] * b2 % n)
+
+        x = x * gaps[g] % n
+        q = r
+
+
 def find_factors(n, bound, tries=0):
     if n % 2 == 0:
         return 2, n // 2
 
-    if tries > MAX_TRIES or bound > int(1 + sqrt(n)):
+    if not tries:
+        r, k = perfect_power(n)
+        if k > 1:
+            return r, n // r
+
+    if tries > MAX_TRIES or bound > 1 + isqrt(n):
         #return 'No solution found using this bound.'
         return -1, -1
 
-    primes = sieve(bound)
-
-    r = smooth_rho(n, primes)
+    r = smooth_rho(n, bound, STAGE2_FACTOR * bound)
     f = n if r == 1 else r
 
     if r:
@@ -74,7 +210,53 @@ def find_factors(n, bound, tries=0):
         return find_factors(n, bound, tries + 1)
 
 
+def probable_prime(bits, large=None, small=None):
+    """
+    Fermat probable prime with about `bits` bits. With large and small, p - 1
+    is 2 * large times random primes taken from small.
+    """
+    while True:
+        if large is None:
+            p = randint(2 ** (bits - 1), 2 ** bits) | 1
+        else:
+            m = 2 * large
+            while m.bit_length() < bits:
+                m *= small[randint(0, len(small) - 1)]
+            p = m + 1
+
+        if pow(2, p - 1, p) == 1:
+            return p
+
+
+def test_stage2(bound=2000, count=20):
+    """
+    n = p * q where p - 1 is bound-smooth except for one prime in
+    (bound, STAGE2_FACTOR * bound]: stage 1 alone cannot split it.
+    """
+    small = list(cached_primes(bound))
+    large = list(cached_primes(STAGE2_FACTOR * bound, bound))
+    numbers = list()
+
+    for i in range(count):
+        q = large[randint(0, len(large) - 1)]
+        numbers.append(probable_prime(64, q, small) * probable_prime(64))
+
+    for name in ('stage 1', 'stage 1 + 2'):
+        found = 0
+        ini = time.time()
+        for n in numbers:
+            d = smooth_rho(n, bound, STAGE2_FACTOR * bound if name != 'stage 1' else None)
+            if d and 1 < d < n and n % d == 0:
+                found += 1
+        elapsed_time = time.time() - ini
+
+        print('%s: %d of %d split in %4.8f, %.2f factors per second' %
+              (name, found, count, elapsed_time, found / elapsed_time))
+
+
 if __name__ == '__main__':
+    test_stage2()
+
     # p = randint(1, 2 ** 512)
 
     primes128 = [175120399228547846888456991422137905271, 35244174869138595766891618528472617627,
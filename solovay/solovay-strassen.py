@@ -1,2834 +1,21 @@
 #!/usr/python3
+import os
+import sys
 from random import randint
 from time import time
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from arith.jacobi import jacobi
+from arith.modular import ModContext
+from corpus.corpus import load_corpus
 
-def test_primes():
-    primes10000 = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97, 101,
-                   103, 107, 109, 113, 127, 131, 137, 139, 149, 151, 157, 163, 167, 173, 179, 181, 191, 193, 197, 199,
-                   211, 223, 227, 229, 233, 239, 241, 251, 257, 263, 269, 271, 277, 281, 283, 293, 307, 311, 313, 317,
-                   331, 337, 347, 349, 353, 359, 367, 373, 379, 383, 389, 397, 401, 409, 419, 421, 431, 433, 439, 443,
-                   449, 457, 461, 463, 467, 479, 487, 491, 499, 503, 509, 521, 523, 541, 547, 557, 563, 569, 571, 577,
-                   587, 593, 599, 601, 607, 613, 617, 619, 631, 641, 643, 647, 653, 659, 661, 673, 677, 683, 691, 701,
-                   709, 719, 727, 733, 739, 743, 751, 757, 761, 769, 773, 787, 797, 809, 811, 821, 823, 827, 829, 839,
-                   853, 857, 859, 863, 877, 881, 883, 887, 907, 911, 919, 929, 937, 941, 947, 953, 967, 971, 977, 983,
-                   991, 997, 1009, 1013, 1019, 1021, 1031, 1033, 1039, 1049, 1051, 1061, 1063, 1069, 1087, 1091, 1093,
-                   1097, 1103, 1109, 1117, 1123, 1129, 1151, 1153, 1163, 1171, 1181, 1187, 1193, 1201, 1213, 1217, 1223,
-                   1229, 1231, 1237, 1249, 1259, 1277, 1279, 1283, 1289, 1291, 1297, 1301, 1303, 1307, 1319, 1321, 1327,
-                   1361, 1367, 1373, 1381, 1399, 1409, 1423, 1427, 1429, 1433, 1439, 1447, 1451, 1453, 1459, 1471, 1481,
-                   1483, 1487, 1489, 1493, 1499, 1511, 1523, 1531, 1543, 1549, 1553, 1559, 1567, 1571, 1579, 1583, 1597,
-                   1601, 1607, 1609, 1613, 1619, 1621, 1627, 1637, 1657, 1663, 1667, 1669, 1693, 1697, 1699, 1709, 1721,
-                   1723, 1733, 1741, 1747, 1753, 1759, 1777, 1783, 1787, 1789, 1801, 1811, 1823, 1831, 1847, 1861, 1867,
-                   1871, 1873, 1877, 1879, 1889, 1901, 1907, 1913, 1931, 1933, 1949, 1951, 1973, 1979, 1987, 1993, 1997,
-                   1999, 2003, 2011, 2017, 2027, 2029, 2039, 2053, 2063, 2069, 2081, 2083, 2087, 2089, 2099, 2111, 2113,
-                   2129, 2131, 2137, 2141, 2143, 2153, 2161, 2179, 2203, 2207, 2213, 2221, 2237, 2239, 2243, 2251, 2267,
-                   2269, 2273, 2281, 2287, 2293, 2297, 2309, 2311, 2333, 2339, 2341, 2347, 2351, 2357, 2371, 2377, 2381,
-                   2383, 2389, 2393, 2399, 2411, 2417, 2423, 2437, 2441, 2447, 2459, 2467, 2473, 2477, 2503, 2521, 2531,
-                   2539, 2543, 2549, 2551, 2557, 2579, 2591, 2593, 2609, 2617, 2621, 2633, 2647, 2657, 2659, 2663, 2671,
-                   2677, 2683, 2687, 2689, 2693, 2699, 2707, 2711, 2713, 2719, 2729, 2731, 2741, 2749, 2753, 2767, 2777,
-                   2789, 2791, 2797, 2801, 2803, 2819, 2833, 2837, 2843, 2851, 2857, 2861, 2879, 2887, 2897, 2903, 2909,
-                   2917, 2927, 2939, 2953, 2957, 2963, 2969, 2971, 2999, 3001, 3011, 3019, 3023, 3037, 3041, 3049, 3061,
-                   3067, 3079, 3083, 3089, 3109, 3119, 3121, 3137, 3163, 3167, 3169, 3181, 3187, 3191, 3203, 3209, 3217,
-                   3221, 3229, 3251, 3253, 3257, 3259, 3271, 3299, 3301, 3307, 3313, 3319, 3323, 3329, 3331, 3343, 3347,
-                   3359, 3361, 3371, 3373, 3389, 3391, 3407, 3413, 3433, 3449, 3457, 3461, 3463, 3467, 3469, 3491, 3499,
-                   3511, 3517, 3527, 3529, 3533, 3539, 3541, 3547, 3557, 3559, 3571, 3581, 3583, 3593, 3607, 3613, 3617,
-                   3623, 3631, 3637, 3643, 3659, 3671, 3673, 3677, 3691, 3697, 3701, 3709, 3719, 3727, 3733, 3739, 3761,
-                   3767, 3769, 3779, 3793, 3797, 3803, 3821, 3823, 3833, 3847, 3851, 3853, 3863, 3877, 3881, 3889, 3907,
-                   3911, 3917, 3919, 3923, 3929, 3931, 3943, 3947, 3967, 3989, 4001, 4003, 4007, 4013, 4019, 4021, 4027,
-                   4049, 4051, 4057, 4073, 4079, 4091, 4093, 4099, 4111, 4127, 4129, 4133, 4139, 4153, 4157, 4159, 4177,
-                   4201, 4211, 4217, 4219, 4229, 4231, 4241, 4243, 4253, 4259, 4261, 4271, 4273, 4283, 4289, 4297, 4327,
-                   4337, 4339, 4349, 4357, 4363, 4373, 4391, 4397, 4409, 4421, 4423, 4441, 4447, 4451, 4457, 4463, 4481,
-                   4483, 4493, 4507, 4513, 4517, 4519, 4523, 4547, 4549, 4561, 4567, 4583, 4591, 4597, 4603, 4621, 4637,
-                   4639, 4643, 4649, 4651, 4657, 4663, 4673, 4679, 4691, 4703, 4721, 4723, 4729, 4733, 4751, 4759, 4783,
-                   4787, 4789, 4793, 4799, 4801, 4813, 4817, 4831, 4861, 4871, 4877, 4889, 4903, 4909, 4919, 4931, 4933,
-                   4937, 4943, 4951, 4957, 4967, 4969, 4973, 4987, 4993, 4999, 5003, 5009, 5011, 5021, 5023, 5039, 5051,
-                   5059, 5077, 5081, 5087, 5099, 5101, 5107, 5113, 5119, 5147, 5153, 5167, 5171, 5179, 5189, 5197, 5209,
-                   5227, 5231, 5233, 5237, 5261, 5273, 5279, 5281, 5297, 5303, 5309, 5323, 5333, 5347, 5351, 5381, 5387,
-                   5393, 5399, 5407, 5413, 5417, 5419, 5431, 5437, 5441, 5443, 5449, 5471, 5477, 5479, 5483, 5501, 5503,
-                   5507, 5519, 5521, 5527, 5531, 5557, 5563, 5569, 5573, 5581, 5591, 5623, 5639, 5641, 5647, 5651, 5653,
-                   5657, 5659, 5669, 5683, 5689, 5693, 5701, 5711, 5717, 5737, 5741, 5743, 5749, 5779, 5783, 5791, 5801,
-                   5807, 5813, 5821, 5827, 5839, 5843, 5849, 5851, 5857, 5861, 5867, 5869, 5879, 5881, 5897, 5903, 5923,
-                   5927, 5939, 5953, 5981, 5987, 6007, 6011, 6029, 6037, 6043, 6047, 6053, 6067, 6073, 6079, 6089, 6091,
-                   6101, 6113, 6121, 6131, 6133, 6143, 6151, 6163, 6173, 6197, 6199, 6203, 6211, 6217, 6221, 6229, 6247,
-                   6257, 6263, 6269, 6271, 6277, 6287, 6299, 6301, 6311, 6317, 6323, 6329, 6337, 6343, 6353, 6359, 6361,
-                   6367, 6373, 6379, 6389, 6397, 6421, 6427, 6449, 6451, 6469, 6473, 6481, 6491, 6521, 6529, 6547, 6551,
-                   6553, 6563, 6569, 6571, 6577, 6581, 6599, 6607, 6619, 6637, 6653, 6659, 6661, 6673, 6679, 6689, 6691,
-                   6701, 6703, 6709, 6719, 6733, 6737, 6761, 6763, 6779, 6781, 6791, 6793, 6803, 6823, 6827, 6829, 6833,
-                   6841, 6857, 6863, 6869, 6871, 6883, 6899, 6907, 6911, 6917, 6947, 6949, 6959, 6961, 6967, 6971, 6977,
-                   6983, 6991, 6997, 7001, 7013, 7019, 7027, 7039, 7043, 7057, 7069, 7079, 7103, 7109, 7121, 7127, 7129,
-                   7151, 7159, 7177, 7187, 7193, 7207, 7211, 7213, 7219, 7229, 7237, 7243, 7247, 7253, 7283, 7297, 7307,
-                   7309, 7321, 7331, 7333, 7349, 7351, 7369, 7393, 7411, 7417, 7433, 7451, 7457, 7459, 7477, 7481, 7487,
-                   7489, 7499, 7507, 7517, 7523, 7529, 7537, 7541, 7547, 7549, 7559, 7561, 7573, 7577, 7583, 7589, 7591,
-                   7603, 7607, 7621, 7639, 7643, 7649, 7669, 7673, 7681, 7687, 7691, 7699, 7703, 7717, 7723, 7727, 7741,
-                   7753, 7757, 7759, 7789, 7793, 7817, 7823, 7829, 7841, 7853, 7867, 7873, 7877, 7879, 7883, 7901, 7907,
-                   7919, 7927, 7933, 7937, 7949, 7951, 7963, 7993, 8009, 8011, 8017, 8039, 8053, 8059, 8069, 8081, 8087,
-                   8089, 8093, 8101, 8111, 8117, 8123, 8147, 8161, 8167, 8171, 8179, 8191, 8209, 8219, 8221, 8231, 8233,
-                   8237, 8243, 8263, 8269, 8273, 8287, 8291, 8293, 8297, 8311, 8317, 8329, 8353, 8363, 8369, 8377, 8387,
-                   8389, 8419, 8423, 8429, 8431, 8443, 8447, 8461, 8467, 8501, 8513, 8521, 8527, 8537, 8539, 8543, 8563,
-                   8573, 8581, 8597, 8599, 8609, 8623, 8627, 8629, 8641, 8647, 8663, 8669, 8677, 8681, 8689, 8693, 8699,
-                   8707, 8713, 8719, 8731, 8737, 8741, 8747, 8753, 8761, 8779, 8783, 8803, 8807, 8819, 8821, 8831, 8837,
-                   8839, 8849, 8861, 8863, 8867, 8887, 8893, 8923, 8929, 8933, 8941, 8951, 8963, 8969, 8971, 8999, 9001,
-                   9007, 9011, 9013, 9029, 9041, 9043, 9049, 9059, 9067, 9091, 9103, 9109, 9127, 9133, 9137, 9151, 9157,
-                   9161, 9173, 9181, 9187, 9199, 9203, 9209, 9221, 9227, 9239, 9241, 9257, 9277, 9281, 9283, 9293, 9311,
-                   9319, 9323, 9337, 9341, 9343, 9349, 9371, 9377, 9391, 9397, 9403, 9413, 9419, 9421, 9431, 9433, 9437,
-                   9439, 9461, 9463, 9467, 9473, 9479, 9491, 9497, 9511, 9521, 9533, 9539, 9547, 9551, 9587, 9601, 9613,
-                   9619, 9623, 9629, 9631, 9643, 9649, 9661, 9677, 9679, 9689, 9697, 9719, 9721, 9733, 9739, 9743, 9749,
-                   9767, 9769, 9781, 9787, 9791, 9803, 9811, 9817, 9829, 9833, 9839, 9851, 9857, 9859, 9871, 9883, 9887,
-                   9901, 9907, 9923, 9929, 9931, 9941, 9949, 9967, 9973]
-
-    primes64 = [1008404740944957198409, 313204847553783823321, 428008609162852229623, 651673590071593359939,
-                176804822200853107355, 523164971275439050891, 950115811830707564037, 513738809964539459227,
-                561595227710841207565, 1141968727525288392271, 940127255686733186465, 396396423567493660169,
-                1135515060963643566453, 1122060438736232620287, 18670487525842934899, 745543844671699488721,
-                51480341584038716335, 226610058216370823005, 560581135341165217889, 551275976473851683619,
-                783591403470653067917, 1068287570218589497147, 233314921297051492313, 938279148605207674981,
-                770297506623067587137, 799642031590398691941, 1065101953292674656799, 175714479505625176691,
-                428801448184180306761, 1010197464802122252603, 613502726436154453367, 477371934761183514279,
-                481834454300993950943, 294151370656065331707, 274653564134477708459, 603261980635260777707,
-                61416095487401773003, 796783033495519836419, 791307658225074480653, 429389710523501174111,
-                255825288052421842569, 618198140263523103673, 704519183769744134605, 737055613899191518377,
-                804568934807121694127, 542964110877301215159, 743325712029174085637, 797550240816433532849,
-                1058524130268226408067, 95286003070167837273, 948116802541587753429, 748863598063187456801,
-                644079380674099198103, 1027209056862454766997, 130095196385345037277, 27148492557393166993,
-                722399290940393419673, 77295897009852211631, 405548739310559610211, 765675192872722988931,
-                239199186717144900649, 1006486813694144523579, 545264783434110021963, 384701871801394221959,
-                62513005775011222379, 416239281252503896873, 725094318096547093103, 523491035095545523911,
-                773150620260564308779, 291333096071889757335, 155342892719915185543, 974242943320692051115,
-                129084611821942768095, 680872761338244576369, 953733505205777706279, 256644378383320404727,
-                54420752892545981089, 495633328975434396141, 466803449409045370129, 740725720416273618277,
-                606901008853591303199, 804422283601060784485, 552790732691932268253, 1079777962548904597897,
-                213502143732567830683, 454654668160737374845, 700833031951007578451, 807052041128271827137,
-                525867129245205830907, 66103580018851791921, 512945491951647969723, 99723379442834535895,
-                1179778267160552514647, 611555829832117695269, 312532895976175173173, 44569236217825653669,
-                653134344369786412061, 907766585189841874017, 546615070566638674991, 569735316865325732031,
-                597800376025879982411, 1055259391142712690463, 739871696748417548309, 905176571446353498335,
-                468917552526557051375, 46072598014079421935, 344921719656176636467, 153765070183363855373,
-                35551634594535371013, 947936149407123536901, 41682121349600564063, 64376550311387803087,
-                763337322482070780065, 972923914732008358735, 479060195091857846767, 878051081179938724301,
-                768986214111724623449, 190672853519771427753, 610264521777980380751, 34308078882287045491,
-                810949002928531215869, 357317002679920481849, 1169414411992724182499, 201176403739415311705,
-                458543081891606619691, 997278261901146874293, 212891244351204655505, 876626322013807323883,
-                48336791222166583189, 673035616199581673297, 622195910949235284675, 847331823736933207875,
-                254962320627422004671, 470521091053318402119, 949797391678269767037, 400500599559398474833,
-                452442741079185270811, 1010870221295683262677, 745490313830176500103, 464357280253023763195,
-                1166229117472559556917, 1124896752569681799337, 590149453317853592959, 1031212729970598206751,
-                134575214896654006107, 1085073918188878204703, 662484725813149325459, 67935890550896564683,
-                22803256916303762329, 823960939463894412185, 1168980332331784537611, 67053984028801752949,
-                983043396881534654265, 466661092404308049329, 177992060054652243211, 467171153144125188785,
-                393602400193642993797, 629416967335736657107, 691185217437531603903, 929247518551033731145,
-                990829691763972889247, 940570856703211245925, 916211270655363538097, 693577671721313244345,
-                866856465047356061749, 789250050149506083981, 1034630642433640642935, 858779017796850572357,
-                1079936378640236666281, 3834986530252642089, 925407066230560263353, 259492085719840592037,
-                517748628584226792411, 989566053602452460879, 575906504818700606525, 996972576705221292895,
-                390509604156778576193, 578346938638303896837, 365887103746750984293, 412558461100146075467,
-                1131522219312402220133, 1005973188081397017303, 205945137102669378709, 870312290845548022307,
-                420458720592406639201, 924183108258931973965, 1054376077385111700169, 803702630274144021163,
-                267058682973474941583, 1172857687962170991537, 1002430885656367409503, 881877351446460227549,
-                259666913906593563479, 157279425052043354453, 929799410092877321491, 238011372474024950313,
-                1024344618351571308871, 157607561936962217423, 670031307364909416291, 646683804947256891723,
-                832061459094451166609, 926716807929624432539, 1139197295019219792079, 1167686038176484040015,
-                668707135123864631229, 1143630322803868319063, 856251797354724232525, 772388634964560423265,
-                1037533261720637855179, 189124969059889863593, 729584024429491848095, 142556553359686861531,
-                214273372974730318585, 325244981722712514935, 1148067075331192924233, 280086627717708989529,
-                875064738638804268951, 125513197329720399879, 179681929990121768977, 1068844316136325513757,
-                1078588821017787442473, 663881362106947752121, 1024826047080456220951, 955939859900581141201,
-                57375958431529587205, 1080376735299514301339, 283007167322121809175, 379809855400500512299,
-                72650034955861442061, 709094588251007658231, 91587530513110389059, 804920695422332471607,
-                760198659066364154419, 848937155293304475747, 869717742326041099565, 33964621335704215147,
-                384660886865476558453, 226807880891025213029, 380182946110761128545, 679823978921955210559,
-                898623806916021920183, 295583409175386319327, 475410985126235646911, 528921264676302753953,
-                589305336507422509423, 867363424809823386069, 286182433696573685567, 1113124907460127488455,
-                1113742341233839298873, 694542511403519234257, 507798802000921453285, 966198221115883601209,
-                81719114433300753147, 126963413552177835133, 435733136354443349093, 849220983471300711825,
-                380297796654684375435, 1175540598940453680917, 892731080793174328925, 184874304996567185457,
-                629593210624951022033, 1146771786058993463343, 397602128350768391151, 1104989118255484578293,
-                1165743205202297842647, 384386954365287565609, 568720073823372093085, 603634133545253761391,
-                371382231480281827337, 1129297627490702725257, 150189930006843959321, 110590045231601391885,
-                17333052848178733827, 914358877755113144427, 14653349379619451153, 716447448493692240599,
-                334374707705185477671, 701398823418912068581, 97245695845287654579, 606052418496676084637,
-                509712554110600034525, 244100444212751982401, 1055522587154385400191, 1143999104442513070725,
-                1026219572698483526617, 12961314699199304341, 10383190205198107185, 184851011726162707985,
-                249951689496976729817, 1008844857014754903053, 974149078095494229535, 500262958106728882495,
-                377806895285286239809, 108693074607051805121, 61492187381842829983, 88569695672680591507,
-                307504409938463400071, 1084686429860959545659, 74671991526780723441, 244986763500046442695,
-                478066005149807714805, 1107098028814184987113, 433856828229887338875, 337116699054001059367,
-                1112599661802869433919, 684658390169478522929, 833276274534116350145, 1120073722240455819167,
-                101873044781113277757, 824879281344918143203, 391323513558767049717, 957543003855038951797,
-                1002899400809709992535, 1007784779095627129551, 220572494990634398705, 1010866623089211546445,
-                1074765958944222639019, 694207205639015003955, 74492497167044093587, 566103007183390992497,
-                471859256016144126487, 129386064374230628943, 932407782356725173867, 507023514670745372767,
-                502340601276873005601, 382532918933067673365, 1069029648062535306967, 804077544841040096511,
-                402178167587184680951, 232489032065604810179, 1093646427934230474083, 683869346230118905569,
-                1103327039574722454491, 570506506945139984001, 917605305901607278145, 311976804834306201565,
-                1106661401611575637423, 113718169166833019845, 255085108936267949565, 1088667528040890770449,
-                1123838861023293962715, 615317679515771337397, 546042074666609974513, 1068347931968297685771,
-                883290785760699901209, 839628233376637087815, 269122175943642195039, 58367083646838931331,
-                436601751148998225045, 421002357448114065619, 679905876872900262495, 650700720482456891577,
-                912981883829041815541, 739487385195785878103, 502808418903757656565, 275678082453583012549,
-                46150614413950798415, 1057085413181299598831, 43237986259658667911, 185108897054355241047,
-                648055552777432262277, 717210013904833249239, 1128401021394254172391, 977694988463522593089,
-                32345360818136452621, 1097398964972068058305, 587751825861673012097, 951845169822289512417,
-                67691378148238718601, 878366340374453058531, 350739994081316714217, 349238915597360091929,
-                1178239053643675922161, 535733127812909295055, 977926294940551072749, 326096050553119283873,
-                128016765904914732115, 728173357262619395347, 944205153667867825203, 62232612867130838645,
-                180436906246649302239, 996064958620614997571, 264310757918708823443, 65323406297318956973,
-                90690762218733815129, 310318129227908872011, 905055840334092450609, 925889932769818873387,
-                1082526834080777736279, 1166708751962214410477, 1118111620632998611591, 81045270125569553919,
-                586541447547692329863, 1083496589355622629235, 1045575597724767372305, 535761010660357325473,
-                1083715954880322929123, 1097336575013206592477, 449218660931757156289, 740545506356143727749,
-                490307644072395442047, 494934932367692356161, 858338905477935516113, 491322753428023338065,
-                760580166810336580989, 686836567345225759335, 117638894564071580375, 873074918280635661915,
-                1102309567670354767845, 1058530792895281479091, 518274130122604926581, 1052830248094484548899,
-                1141602551642716864829, 1025481123172136933117, 396394261886886388161, 1144149248717364461691,
-                224878593157296250509, 726381177059579031169, 846333454286064327765, 1073300937816118636413,
-                918023569373837214507, 680873295142918477965, 1050396703768227175731, 1099642135195339628329,
-                42073831710777091541, 790887095843497965739, 952868106737972664563, 782380346949857278857,
-                1173681108743417727523, 1042048528471619019599, 1050004233684556131457, 406888230164787391709,
-                288698303775853141037, 55343761720596200403, 108376310811976186957, 757627705056323367427,
-                19978613725543584087, 1048539592918273325413, 1116868392222436647093, 45346606424273804115,
-                343479567218740521831, 148895544454134388447, 592284435425676261521, 916019116119367873601,
-                914355292655637696945, 904271710235384223421, 57035336272271938163, 730765734954671807523,
-                977403282254134668535, 737643166571084661647, 1153670737536725022937, 1108588917360052454243,
-                700668517814434866285, 1156318484016871148701, 1044504499096791668661, 138475004895986031361,
-                1000885873009077409277, 849189105012327623465, 588282389892090592159, 604509614765394868999,
-                187747290022522000895, 3502935493843990241, 537483328418636147029, 761499478243014084923,
-                481854306904950010201, 760139205845008028983, 488772690986876934029, 249190458419392261581,
-                304390346111280844117, 661385109090235359371, 352637823333878730989, 264634849622259141093,
-                414763923903830920567, 877766481857769422011, 333762701608840369993, 841143394617619097827,
-                931801074779824093603, 1081425914978951669357, 794974513474385126277, 1148249534782600378331,
-                726643360067017670413, 578841519584536496233, 400264136580299577745, 414809792816915795341,
-                932891257436659050371, 422218675586141079963, 954414683382486028451, 722646829749565678311,
-                1088518843126904444185, 546790108176309915311, 311110984772996019559, 497132277458374653205,
-                715467159228035007399, 113140717942252622385, 928132247293836205165, 862556629772595325429,
-                138267793595656467719, 895718606186539739225, 339745819788462466335, 75623953802465434019,
-                924854717194092943811, 1009123210555103062719, 436323483775137553513, 255892422624960604633,
-                436243082790488715207, 719288035079534143631, 227003079912651354967, 289965208355748550671,
-                435752881959433181931, 1067658337934589973709, 37694251397627130005, 118424638219880370417,
-                566933306383216805841, 1150418786738475956455, 1068765005123097522481, 261565148698712639125,
-                547056627755054798575, 29032688804784061479, 540513602265957771813, 586763143330913681257,
-                632687178674578410781, 1151840349674025994825, 233835784002086606013, 282102300158146026861,
-                155638741422576651039, 159178397947658624371, 1133074707249096810743, 374480641000534859581,
-                157234354072326036119, 655712005295443245325, 477264402887614929783, 115158008678968536281,
-                920624305570731089951, 1145442462546699707841, 1100273645458260686511, 664144889113883076135,
-                627255126750462865969, 551111067014085450077, 564395718201866348561, 511990022645230417843,
-                150779404145634553045, 842583777990165387345, 1024671056428788761173, 214600959310852510669,
-                606846589455936837051, 23919481105293361773, 196482764927493740991, 714971020701804702071,
-                927338184856804952013, 1123412675694373195047, 122644852664182477633, 516255764939928642873,
-                924809520894456523443, 424744674058807071797, 792116610362955275535, 152345285871694614775,
-                671164805007008650839, 662620147554736601561, 589010847133071550961, 340163860520157436117,
-                659910269490256775103, 808914006365520724201, 419284722468805480835, 1081274235084257336537,
-                1028242400933589461807, 512387659123263081693, 384849044565180796107, 86553596951391460337,
-                112903288444430818187, 133963852320172744397, 1052115449061535069183, 1059897414031690174189,
-                976437637138336116967, 985973550701772412121, 194384948005643002219, 750430929059797131947,
-                738388053368466541353, 623712352489685102035, 174329050895375394551, 606618521365391718147,
-                693008995360743075925, 1077505888345553632657, 1131191557061745856679, 23644198421645104911,
-                853553571656543874049, 229653787596620613235, 59242172673550576129, 1175241023666728029441,
-                237337004897705647935, 290884673646911492469, 962528586180994410735, 263848915652007509441,
-                6852113002571947133, 874352427290328933907, 592226035870846064465, 163189114738661428387,
-                573374060747871078875, 426204374929264441461, 863362722338735640609, 1009234326190390449511,
-                47168681911273969653, 1132812214966867857113, 1169748221847665754971, 89154871714373057241,
-                1169377940961315760995, 518756715723726165985, 1113864203860819067019, 64940991361500954785,
-                1067915855685751192221, 264482315879009327059, 608211249899226297701, 613642061775682237017,
-                502465696314004954293, 1040122113753568780729, 313303984340823276777, 656064374973165285079,
-                525326173872049325429, 284116212416644453857, 566805605196395160131, 384313960734117924929,
-                605733910305018954879, 569622796643775342939, 921404109636528711645, 857523470735514321911,
-                175047282210796857383, 713294104143934738011, 634352939437836922459, 109325950005324805109,
-                306109595566139741199, 379392158454141405467, 570004268649080814151, 271874831472775661593,
-                696123599151453522741, 445928079127882708777, 803907296780550956773, 955006393838006528859,
-                387323752585580824571, 840331562571962202333, 459386923672772144115, 539773708574711177085,
-                179656226351684709349, 735903281138671153719, 452269412854552427021, 643603976386084191381,
-                1100546506347693007041, 775299561196140427759, 143139682869667264999, 899598160383279473187,
-                895890620206140139173, 891883128425348844767, 496170029386616208553, 95371956899304767681,
-                808343539232468515841, 498651635562130735659, 1044620992683475563529, 952058618339748593861,
-                180294549954984266361, 539050574460789696917, 292774933796339389157, 861814440406071680825,
-                879642659611286166157, 200519421987101041791, 112772658781485331083, 267917654223176876735,
-                236043322603373847377, 381195014372095647201, 1005139527590540439737, 85490065248495579863,
-                559911609040669075293, 1098820073758352856935, 318673110244274612543, 487485615376461747175,
-                650543813693208923633, 808069080082278377367, 187401340059081804475, 331319284118866180749,
-                862265660442575398899, 346322475713520838881, 498352002471260720009, 169557463663221804613,
-                86738350019598173239, 821680803491536574625, 150092399346761685687, 374797800463219186859,
-                967916138452803666579, 155262489453745675961, 54011897595758777161, 616444188874332440547,
-                943794156698793376419, 423498334175293118453, 507765238943052597917, 87742470294401731935,
-                73355855497927842949, 754421116211944262185, 56420885503782802087, 889822222476003599577,
-                369623601345272991995, 692330855268321021633, 430498430060603410779, 756825341528800950477,
-                981574827341030757351, 1011729603641222007247, 1029085416358167102269, 1008476420743022743845,
-                704781752930386544235, 1095629690391200600053, 420883409605286205261, 362077386317068097771,
-                142192148153056533875, 562331343725260390141, 855545278930835278403, 92647726286225965223,
-                740097519692890745273, 706513782027457785719, 1023886382704492868467, 316108142121331862165,
-                902644715301080361159, 839753286815260615683, 146662347727774658493, 655692244147554704491,
-                387773427086002446103, 296350598345578850501, 382342297352677036793, 729342195872272402125,
-                204191363214402821879, 8806158306105888685, 365435527114391558511, 216648663616410645469,
-                584723555882339489179, 1168737107388441720519, 1114824041902304253125, 983341205626791826519,
-                723156346256411175467, 278351332026975356739, 798400464346758709923, 369519697055604960961,
-                848777810748314283961, 332437633627853642389, 307123742252816718041, 484740517770286034065,
-                734539105009888185285, 1070713187742439707417, 484343201249177206181, 333154403118702358691,
-                652295651311865472105, 767916226173696841961, 813537496370681941933, 669724284862473493925,
-                487156913078802593329, 642048187401681741305, 956316243638470280713, 505787571198223704737,
-                784711057438970032733, 217194698019312988165, 374904728215463441439, 1144276960779453391231,
-                393528410648932982551, 216786447787114380045, 758474969689518739757, 193219104162796383559,
-                118437847387361766233, 471677601672313222001, 998542537342645231109, 637498627399656009539,
-                537821063957530654945, 562721660193237107797, 915022905114618389669, 366458008071687463317,
-                111979862381501329887, 1132167093702297641601, 661882900335170580431, 99260958678756774631,
-                446358677521633343791, 1046655344559786542265, 364654568752142978849, 521232782173388418963,
-                250117642788640343141, 1019547315924361368177, 127737743907802865785, 939565456337636858219,
-                168011553103003869597, 378646849818363064623, 653784338071508406783, 229877031977308516973,
-                1693645386419082713, 992483723378260335765, 633131797060638807843, 756129859817634227303,
-                587794255575022126843, 643417833354315226295, 161336382387789602381, 964740393772375303471,
-                296036765899192763165, 1180252214112496100063, 623960044045468561717, 558004320075929758007,
-                262058789507203166619, 99265966669352997253, 490789031226231853015, 927886921830719057527,
-                6361422035849717007, 637122419648671682499, 252945239702128391403, 649720146105710997481,
-                307544751421806739523, 982076937602715588059, 1099974379556603496441, 542862512560615057673,
-                1087423871208491815013, 546725826598307711907, 386026255370131542697, 42377599064515249575,
-                195318787545258861699, 1090165776891292860903, 464831942766254965827, 160125781872125098543,
-                36226750965669556543, 919240231535819065423, 764620419888433731895, 1002418643195444075587,
-                117807048888991640447, 554931417195345093835, 655674904828569050057, 549116385998597082779,
-                655476858563435426571, 483798506068890395681, 1014953752104633905391, 669632853334707717431,
-                338002397238448403749, 992715443112946458583, 923231938462395801415, 1027530384655869212901,
-                905553131791010735287, 258083901155214813431, 78380520062466592093, 159166932288891432603,
-                949348420442700804967, 119766137756194854251, 359680047704579051149, 1019806316182106418375,
-                1053407221637103711027, 431793644007027268969, 642866043123623435099, 910636551642305675705,
-                49385866823821026157, 747619162420888801669, 1026667795636751016025, 546158514016888046209,
-                637508567811261103933, 1080645327142960488157, 903432386124698601221, 979216443178820868499,
-                119616477193593734783, 1173012811979414952433, 686977691999148129931, 350877127760301848385,
-                280742238237049667447, 297211790305803437179, 713406750142514710409, 111081263506883035389,
-                455139985329806816923, 1174096030101660601125, 636609437137506620041, 687812551240370602319,
-                444821462727125814971, 1135521827565446810599, 169183423580639602803, 267356389596927741865,
-                1166809126923903770493, 499156882896740758683, 433157649813693328341, 111243526674475459425,
-                970170775239904243783, 499923945107194661075, 457647817724861744975, 132413126412576171103,
-                1130057016482180103759, 30588685464285058439, 1025057463858565549387, 1093487282415905311595,
-                560563834523650846171, 525033208590681366207, 685466486684699773763, 1143935482125079497155,
-                845773110987763291913, 251651505086200305463, 223616086208749822593, 633057687951483026525,
-                785424055672587336279, 154076657622087376805, 839449903088487763879, 391709035328429540739,
-                403356721624710143943, 781878112874729600229, 917201882073332864587, 1053889420679916093641,
-                402534733968924293199, 123829923713608949795, 1100949575983190301497, 89263174634453534873,
-                947394950566177390879, 865109764563970280407, 537013287927212803685, 1081835356139572215705,
-                810818629104867255579, 640997585847782079451, 573295106442471894505, 1113712308805099391293,
-                399853792488027307463, 1167721743089952483897, 916398179442986120233, 825466974951784833115,
-                778735846800595447449, 368939937571561989513, 1059500635815026717319, 58355892253139441333,
-                737511516508876584513, 751798945423705263037, 873147941281074217097, 1081803391896594883067,
-                1026955820556891858523, 870574080310105427985, 976177385023129306231, 157075750401926878225,
-                534683061793152820101, 990873203089642825011, 261121050852391005713, 219256081302917157053,
-                417159662094603003233, 909546121842455458269, 37058230562948055009, 191225845580512560633,
-                319536748083738862623, 541237595781830961351, 548241310425722001775, 135920493814789094593,
-                860557800188265782067, 524101258481088281779, 653469988048220549909, 448294756519490587575,
-                513062419018221184573, 395928807192914450807, 233119888836547009223, 1104323792834830166485,
-                1118957745793569488679, 821267902631447024799, 104167326573667159379, 563610703262514360975,
-                565412747035766252129, 1020462358576156991275, 957137200403653244947, 14663707491564493977,
-                878037282181690071679, 17354371944152017831, 374511401117651209735, 210516976250261062671,
-                382280857865327875297, 432813017964517692355, 109176168388254734351, 826490975242756869541,
-                264411257282018488089, 1115712714525031743251, 644905385388521435739, 378454193000385933335,
-                127573652470545228057, 467515439686574313459, 293422377139595859693, 68565242818608652943,
-                476056122825209739747, 1093572191334262127571, 907395264365613348733, 114985943469229281077,
-                365999911718605352415, 783192615990534867471, 890366249357373640823, 935610384158018166939,
-                604600270430744563461, 1093618429695523269323, 71263267985940024567, 568956160255483339757,
-                829841057093461545955, 389276780169657130321, 1076249597876991601263, 92069359931037791681,
-                951163052236766200481, 967245280796465996373, 414104560624774170767, 643598149061321363203,
-                349530237773095024563, 288355064190056253467, 653325419122973498119, 635283258465705066675,
-                906149446370991656839, 673303645387664674177, 125754205411494090099, 139151510915411622913,
-                495997488701757108043, 989937852360478174127, 1077234467385052760397, 569344768930601586295]
-
-    primes128 = [494916199054195260085896547533562095517, 903401169263786190337909944521667540121,
-                 1124677436491935881797954676804132347475, 602376286880567769771601939422455321989,
-                 191631850372088821128067425426410116749, 203582987307768577375370870389299047007,
-                 415720808778429421232669523003720668901, 1353998043230929848732851481784465017889,
-                 1316578064918795221732739141593043521121, 1077454177471489866292138939529628519727,
-                 731688608202548015575626169006637111451, 1330848509606144724108180539321487554229,
-                 946326053441763925710913798236406392015, 1138459913517879258644963818898875815535,
-                 1001376612060144210994275342099503777031, 444708730504918019834127759113331336163,
-                 11232084489793249233661856772995618187, 981985739312841032801941332115917834979,
-                 1352281208568597249596301846003419551585, 695534916441258219132972751113335124067,
-                 399318959294259408013874774094601079687, 121600213867873418430612407110113792627,
-                 846888674619187480454403576098835098483, 1162737369000223341999382516000591916473,
-                 193420871149458935927962780284769555627, 958522705414326184485477685786085774887,
-                 79623177905888029253061241138141895771, 387922178893995486938249957210206179235,
-                 982422611652712844931474531544286869685, 1256180010921563255822253285249277698717,
-                 840082151501776583443619206878538579809, 969053404992680911341207563320788786321,
-                 1238149996814875283764215020992156324241, 266926803540978354142059490462940979171,
-                 52384829068924363879012996788829079877, 859379746531692577995701315182921595159,
-                 1305344273766454125809935409051327978749, 479397574484213274815712465350819783813,
-                 1194304373943119498018944241984070638127, 1301555482810756679273454449433930093913,
-                 759787837074035062313378213507053330823, 1037850952018435583342628116517752794503,
-                 1305526005899317931879839163066811041255, 1038219372851873375309533047413221828537,
-                 953290049918419166412702015332792315945, 416714687486791410299674684368131619847,
-                 1080780229970672925948399332284903927809, 939080336562936553251541855388614127697,
-                 1197723653202416418022075794793267949251, 746751530793588193425941894665569952145,
-                 211418873744660860438455607301521753569, 1122131989619775621636110519986740691147,
-                 580686006929583085144828497869854913355, 947626786135088691441302333054300721201,
-                 776814468602482477577361123194387054855, 1318384351693137131958026338648615391605,
-                 1356592259289772156135366958562321385663, 577287328152470514506850311900234598455,
-                 461611611174492269440384566332407596831, 660263309105768844997541634096158588591,
-                 733624448515700544820128113231938584975, 477875279232193366922584217680890632753,
-                 842132533174769195017892155074502855909, 956164130497528243260362124282319140127,
-                 1097934929432359560279181388994652003887, 885915298795742510776353578061284501215,
-                 852233660543774412568782136408752976861, 418462217920903595247825551200219344235,
-                 1359574179234976070524380576650955718003, 216982871442064328762388408766125244499,
-                 361137258856840240332295943764349086581, 498289138741610214776607184262113451221,
-                 122506321107007060378357915553779034465, 1236302543263575317842202497249778974629,
-                 1195261494485555027766661760566494263593, 190511120030599835406216283746835233653,
-                 559615760941669419118570714684037753211, 1054013828209373882360600183678697289153,
-                 444940363874970143078622129152286935237, 1291647355048816380383371581407947043349,
-                 593405638729884718115298382716469831587, 906909676168729736396261058169202693447,
-                 1082095278096603070833793649013014402417, 537964073077155847021408054264777674935,
-                 130808969456577887787703822473067708181, 1028417208928453096951145634991253558453,
-                 435281778943544681374947172634628902643, 1347984836033522906615718593309510649513,
-                 1319730769926648382030682752211203480207, 81052464394481162431193301526043700437,
-                 677841925926795426281128986867149585707, 702873130373195372404206779065892149663,
-                 279350841958919374114751962662022087303, 3919732952113960905037917520154062113,
-                 1337512389780055404589412855387077492833, 854751789683780996711352746772183091175,
-                 956094081930514146761467504244901789829, 209040351145485893191155604952720442149,
-                 747542438715445148155212477903094819319, 848937069432425915225076254334854815821,
-                 149423430949443331051878563947439016013, 88449943956292537311982947455723148127,
-                 834009867877430316275542715813094948955, 229672751222486556777438532994449691013,
-                 721480878092844211499092017384713175589, 1140356245227462523906611931106302748337,
-                 916020991849582615011646637851835113409, 84220252068745352806924826878749195631,
-                 5590347515455239386082018398632944397, 1242333442936362273490520537157381655965,
-                 567364971914499304091747276593003194289, 812471939124793960079799083461846189525,
-                 433230534491397214287100620678282481389, 1257914613841172830647822756848982046713,
-                 1142639079503273118910582523738198901549, 989824355767685732465302303232639848893,
-                 312419787646220805413703315716556483133, 880124640160214507352719219613459030765,
-                 1298056445052238524518411812941517489549, 765407299603962315045772104962805091673,
-                 690388986680506034291675288120322027953, 954733583468154055400785122369588931993,
-                 679411607650150781951587033871348496195, 799525587350621808682493513746994422273,
-                 163066976561492252425637824133196661325, 1142286925402344819802111652378354411149,
-                 1266811563944889183519717285882992842575, 1129412370681777228017822250530514498157,
-                 1239217656274739929789638696377378905483, 318179938516731776755696462631478816947,
-                 968006428295673811192206920115327063017, 952907304554182603347951479982607095289,
-                 506517512828229029181215760339190799857, 924956632191766104175654336159683442495,
-                 1222493660399410260797714746536985762713, 972074261451234680137475827485973351079,
-                 818408308901577540445562239103843738761, 959161591135173390892790423170463275465,
-                 921834228997710266339064862536580610093, 207665652926697556012571682598036494449,
-                 772125447188073148031166612265804905433, 1240284363072887966455845159328797128207,
-                 506360491675516681525437594245695095081, 915489435106522893502508646972985874731,
-                 580673628793857451299673554827735897159, 7852470744856468400962715288136916905,
-                 512431296987467002631951927824475217129, 447312806615499456814273948201950224871,
-                 1234228953671662504898917702769352492743, 181221590344936745256532734467511559609,
-                 180995192268780268641087917351867784899, 370665957140461396771413765779097115919,
-                 103267218667515134248245156142694917583, 1236450015455651630799335346196855225809,
-                 747443521066717053059546781984097142529, 282004844598617863421931957724252727465,
-                 699325750136810167190500665979123140305, 982977857766840630183172943678906913359,
-                 25621086543276005773981544465022998557, 1262022640025700472975214079702269619529,
-                 1186943079186773352379801854332751984569, 1287999283563299218979615230588493839175,
-                 157993684347214974281847500729022944493, 801975587444647350705200650915771250923,
-                 781901676455885324648956516132084500915, 1031311043924420299239876149498763683877,
-                 679894054632200486005867061389617615777, 1100685287925751961995516920089072889329,
-                 1105941412063775994305277887499663114319, 95260400229003272425715614490117575613,
-                 1152051787025539240795135449233219347009, 557191846379604610190577591770579803603,
-                 618391278634725643365405813715545729517, 1070062228894866473797509303740629931719,
-                 975285617285470512389962097658906039099, 363814950147109544555557786590691367353,
-                 65958197723596679049617349571470555807, 136645056776099350700435044333057974431,
-                 239591637034551608603110652375063036359, 525521132576521577278659784788141264613,
-                 1179130485655133013110412831236757234405, 1250086238635416394744186507576203000533,
-                 1095694351519112888378658826547731319139, 1212034069744633894360830495068477694795,
-                 756663483248695449504140694572106171323, 621043522244248721877024460612826471431,
-                 20086867570179757416759362357580757047, 910485776122863938294219205388065606745,
-                 843914808581448034297022865206764051075, 1335206702174034632187024774398670602929,
-                 375875201565093054984368589815556613805, 329960477280117266676650583910489312457,
-                 248026991069167287188799049744622871159, 237348310458743265826007508684659897593,
-                 151040941129955521458399892293625758871, 1210262767161861975118322514893905445057,
-                 1284068104449560294465173796771478965725, 1077950339358963909501783682435253437075,
-                 994255699965984766257066301626419055959, 1308297971361108325018277633517668029671,
-                 717581326505801763272205912487718968155, 1204694176285445234551557774853247918039,
-                 567837008450829508419179150998770088691, 528510924137574450195055563239102557811,
-                 358666186325123147079307798095318694599, 735664852183985948602387952093330023971,
-                 1051049918108056227488731261654368057039, 686907465688325633051306780638424656079,
-                 1293956670089848426510558859826742228831, 198401849885249865988658862711530698717,
-                 671938122130908706318457806898120268543, 112889211859391912477414424744235765859,
-                 56375676130430682262531137673110046023, 494898813879512780500050155091399519123,
-                 1291874341804263864314186692398766340465, 1226526709445024212523276506236087236267,
-                 37783640640249111125477700638909535963, 666703033308413163300829637267670227271,
-                 833097482740848253782248614823571663609, 888551728751782451700687265677934254493,
-                 718451956301391861816102913508322573385, 482544814931224400425008088738525718355,
-                 984501085564358079975630501613611417251, 1125110986509398955329962697281859625243,
-                 361913053228881694590890548776317374323, 224309247908687860495443311051319094919,
-                 353612073623596716222949358016861609713, 850031054827065314141100888553587255451,
-                 1112986219164907827595818538638845282169, 1180040925327479012400246966361048246621,
-                 1020578557603389677772053046802871395129, 1235371081232230473848924326969631549117,
-                 239268070504880731455527171058410311861, 1259600689224667025196477752623403587879,
-                 345767174962459465350529142616993467427, 787853853537245234524005776565135033155,
-                 1017434021160311482945569667151867779735, 1001814548164656636543177108205547294061,
-                 347124317858195755501836442897098235031, 1302816237118389969258075894691566866305,
-                 1054969646418508084206421631829807257969, 365138835858490045669089758653403119205,
-                 67397690042270834928842602710106189713, 940560026092543697215699242842896307469,
-                 360725658765557614540505268250397394973, 942382770815287229989769601833049484383,
-                 358774493873461790193351387757439461421, 808195687220690422888806091137535146227,
-                 771960613975866378178785015355250027931, 1116959129077314466552500844034065714815,
-                 889346978023614415160824573112136765499, 92654581959625710044418445963604874427,
-                 1016210443059460634473009078544884842377, 480279847664809776592145552671109306701,
-                 773876735008457637504032668765004529479, 652392875834703645099660665050044659285,
-                 1092598526195013248188420454899760422779, 577073391238399568063421505250577553489,
-                 602536043524822782312187160728718542549, 432827465217298361404217492357762729987,
-                 62156332400987920701684073671954430169, 467269895054183774047162019377172735143,
-                 498075660599453007513844894124070944209, 470182178260196688618231326432129995653,
-                 160875370333878009616247380741202035561, 1043309363593268577897031161694594698343,
-                 1196850019419884317965348664838470555041, 748994738841690580495657334123854389387,
-                 1311294055848173884394637516357618647945, 1105067891753675973326150586468354288687,
-                 1081546035720468636501953095828229144725, 128294377035169465315222782429233482339,
-                 62304139580337369429448160134478681697, 345003459619200637378782223541336854625,
-                 1142003885326898752796006090520187075865, 875660105477649174608427268193633163539,
-                 541393437860948751219842766711847732475, 558908302283025647667111241786248018843,
-                 604475843079036942267108266358123764527, 902071609874947925577212377632412940729,
-                 1345603836306218054267866076886772050011, 1112506418605314575113842157963591227293,
-                 1256603810664617285611540508693521117669, 471735032590773246689089223628851683225,
-                 1311097126780347450642085501745107483135, 783659260484081265669695985877758457185,
-                 747614087511719605901964914832074753997, 1138578179922886276457092383724111945775,
-                 415877533719388099548036637440650354799, 312806418304127248019347199530703979153,
-                 100353118581965713548722561650437176155, 820225716779812313231648137137874215453,
-                 1162730297895759182835347624312854745175, 1202916695767137323414093656072560293357,
-                 46914083539953590658862945756763963193, 1142586540800393542236286278528943256423,
-                 905633623148873163123915103893571226913, 17519918384507330283815182942427375043,
-                 273792375055624611856522203012430308765, 1240826919553912832279088407204919500799,
-                 592217731402053387015863118919224243133, 182280387445587723640251934743587462199,
-                 1206630752408236291811734889340615336723, 822900400321372860348597714369772489639,
-                 917852094177983025566053154994544070759, 1244022125124134154881517886607934189027,
-                 1277669506902068886670042650969089770763, 228414694868638881773666417808974157619,
-                 149525768581559575867698652685103775663, 978264958581037493649106787650536828075,
-                 645845205766588706243616013764692616647, 984955773475076541049710357020789713461,
-                 528125089441608521417579805544073314305, 962180079955550609581374571677044590099,
-                 196990994062507591906844429723224884347, 136155320838825445553537529051071361331,
-                 1091895608691230772171874852550905567397, 9978052198926462471418202089621411425,
-                 134677763782972387665501696464984407781, 837618090275509177235301969805491158057,
-                 344460134517414680951803890298591315797, 131133102812507435272104313593462777215,
-                 234055336693842892626427742456899958289, 617077786873496392463449447933026473301,
-                 79905520792665634098397300846651855561, 332568481243569312438394984732869583483,
-                 464705339405610464731559268328856371555, 45131282495001146712339241789814970959,
-                 230892340165633103750731038519663965941, 591389549994294005246725887782498679913,
-                 698701498113498970755111773183253277913, 1308932155695748562930501538924169459361,
-                 715220259736402911111670571072379139093, 448458552149985522506955382910344855333,
-                 1225714201359604842664623300168485981763, 537199518738584378527563670986370556677,
-                 258083424516743887818163607465557435131, 430455416369241561249593443916526020447,
-                 375472044528852819484339624116345203143, 1054633089555531014906558461572637913867,
-                 1304705545574654188001681652472259747257, 121946755448010052685679477366366100631,
-                 43225058403005492621809217289659671139, 867000729227961705720122766678859443383,
-                 1047472671708385271925038700089450861559, 650971058489857445534017333967654697779,
-                 131857837532865215579678133740925056035, 416416700920115274773907107687786491283,
-                 564900674459255145555426765736142427043, 1145508284948348412378963304837715232317,
-                 569169342351386597635894129662369939619, 1099049828410472954425960202304488217137,
-                 39082275939042091170331587095739888847, 715213533299428517304259764719535671605,
-                 819472562654630222267710904797447225549, 934991965110108672502634482894264218739,
-                 785816634481995990616391365262166362701, 1718935397022886240400127981744326481,
-                 7923090993870564567997581988305201477, 1205835558494813845684123716247560033973,
-                 693546109557187996112889672046951670185, 620819279104366333685307745561690170985,
-                 813276510083116608961790521763183525981, 796047835794829622047946584912128869299,
-                 998434438146265528370193146835537948281, 119953400605367331048251539476515089407,
-                 1046085813079862110032647785529950820239, 1307025257847118971943242474753215042325,
-                 1326241588006624001690479696039305471767, 106388224299662099158065679785444390867,
-                 1242605858470468071535466656487911164517, 94500059533097083269769850615993850405,
-                 970377072523603944127036344254053633137, 226243626812977538644323231031436984031,
-                 311357899691801453407892803179969441331, 1251558654139294506378062248979926350961,
-                 1113436030722071702917913661322888831525, 1209314816656704026730616753070482988215,
-                 758882950583539968204623652555582635455, 396065815018888498189128938861364817237,
-                 813458997578714893377430551160741285491, 1033689870772917302970098481875622662437,
-                 1143423524496316602344405224016623288373, 689628913860763610325852034117338177641,
-                 600941530971445964068193304993986891913, 517076266621541007234961430465574645487,
-                 644944327635898475654099237594463416419, 918263066235499353862526311932313146163,
-                 1263647116057355180063064648138596230719, 732922708008559007056065981922850972421,
-                 143644743591524125422051105509246326297, 1084278645497139727961425482137927630179,
-                 1186055250944459559747728740419361382255, 556591094072873339568673662313001589759,
-                 104034684113955053428480929258345133087, 786479365281348094100051903823253711985,
-                 382493792964165938658108869776362727361, 327936791020739547016419747607092517211,
-                 1259676644670814543340364559536066814463, 1192441095412083646053193853328590952823,
-                 811461313529830912946853288846575831477, 84617725115201745604783819424424933201,
-                 161217726887835132143035912864829887503, 1158882058681983985212952745545534704223,
-                 1295241359541351509809230559652807932357, 335344293853171019711078387097329693259,
-                 424793537275704266471208113698805598335, 392500113522670299506362162134260378489,
-                 1078884100838205097113229654714540099549, 952031652868994712894479009691162741487,
-                 989191588243217025859055893456385371157, 182305505845703099534053554390388041709,
-                 1358107949506737292561180782128328983907, 894617220076023512277623970424143329043,
-                 817942609484787337423223649702153122769, 205767488019352801661776387250995216111,
-                 657990216006586465590426450382853490285, 170395610794944649839133263674236831495,
-                 1255952774117941101346864944580459106785, 479251794313393215398564856169740432475,
-                 611592098152446504915794911886419079319, 1038265659952572778309847889405967304469,
-                 381348385801434188596260360078089613957, 567404176997815576423835965410008144481,
-                 1229509939772133827906940663623395307311, 373537908856251091166959780654024731563,
-                 645838848581457252515326701358152667729, 1080582823935649261391443787346209069351,
-                 743223220808451748895815482710230804767, 961068837791179813399443231126273435113,
-                 477738234071646529614827083956469833995, 1121645906435456010971807475897075697301,
-                 476269795387036164876268137497143551535, 1282543871184336756908572892637892510643,
-                 654788639649519703723665021557859572837, 129569493328488774946685697345601873875,
-                 424203209474477885478986890023375291189, 862060413441955508967210274930685224647,
-                 405288271273559056548884394841124348187, 1075741642653535570626906763554932207421,
-                 255328980537085009666989411250474028865, 473872030038300013858802398533007442391,
-                 163631495985526205476556828853750647919, 742702905189342675761372212421598456395,
-                 334156795871488126915076527825764919229, 1335034480769008241668722041491868290231,
-                 936708238507038618446527645818074775441, 281979667082122667809706025790843893229,
-                 291257272103518331709688966177152438233, 299398517654185723376944258733551013161,
-                 101117058377934586554247644523138319275, 305440655899818274338116214025476500489,
-                 172799594298767739503177352990512414467, 111283117945890939796650618524933840437,
-                 773786878697227959055241567387504637201, 148538146345085337661716507995329851375,
-                 1253959869105446615227186409200977518679, 805741368407936025057596008150228834283,
-                 827950041167289001857973390931257437293, 872489378439834438151244453256730123465,
-                 1318824908823988615046486658956792966749, 964558535153068487453579745048818546975,
-                 821970718061825701715910569187962067883, 1322262058796852549091461377507327208301,
-                 303879024343479611943208634228254051489, 962491715285092631347866494455004100467,
-                 325803494887583399737743666893879430417, 534128636114312266720741588093948617149,
-                 1350316676815912243250783078312858838203, 77913716208048957801250526139116684243,
-                 217462613872277318020719610646904598007, 751084441103826017689786337204264686169,
-                 1049874407395221519267109801810529952793, 576115941619068745168179910748179521643,
-                 885042673181610190060933111411237308633, 398950007715238799194345336696607213963,
-                 595699982960145523923400386247495726095, 358456236710743342419060135747021772381,
-                 610355833787482885577539934166513280511, 642404609779208645478718024939238439905,
-                 340723843176282140047553203357566913705, 1264624985724846301024328624134329086709,
-                 448515136637294207223939726634362695305, 462428676012259147431998854010628283431,
-                 1341460791741537867232106402889834479503, 864179576943515686700915610032431999681,
-                 878778230908546153681583606097750469023, 751707384100792045527448435785913879485,
-                 1101028721974662424052909304622386513125, 1185703656220350093386848942382037750121,
-                 1299379873511634413060468866320084976825, 323457089358334888403665546393360825433,
-                 889128346663554142885168296901791599729, 679943068219777162364736117529230416357,
-                 1155234008912929851071488663567940928801, 121632196197724525962307009181564875323,
-                 329146825494631264366474972655568523427, 837750753904342938344853284765962635037,
-                 948513662876064716319471461120701313215, 1286365332551603336818707870747273255407,
-                 967463816399067142915940228405040353941, 165230794055211484710460123852849486873,
-                 806650685299285041433498773852411900685, 1196653837273829323281272960046019987113,
-                 157005479439189629841201068322003559583, 357564694488506000271844357135190098409,
-                 1078347369108970255123819845039040107683, 624364125458811746471847176183150236101,
-                 1029866379248017741706047775728245555699, 408615443716001698512227801124132402373,
-                 514792510230622739218285835736657951757, 1150245492476333811684128507977123416493,
-                 638202617400810998830363895368966049651, 359315290179678211730490995267405521681,
-                 987130685668171323814011286281505909401, 743588697098043566867988123706382084717,
-                 1298166882318690511322720174682665007205, 1338471575830243265599037933707210526855,
-                 611449524414997929221245676774484040773, 946509563913138928005134623928715784693,
-                 633465824645927663403568536961494941693, 1339812929585692703513685937818842715435,
-                 883961031406369720097158419443863049275, 466273945950758797858838937702513202927,
-                 339370621163286426720809241947022458675, 1102994367773241555932780131271468852719,
-                 627101263138180301992576238726275862039, 1130728855336284248838911709753696375035,
-                 1121218180421298987956030941820345995121, 303144109119373630604064343125167485945,
-                 607620568491306963100540026003207702627, 1159785875585211118187907161159746591135,
-                 545090914296241851028445671687591697505, 373592925179421341446922760847142965195,
-                 1036912872541326603886783879766055012895, 46315802047274280875030363749885839279,
-                 786366277991985756501829539670857131909, 35556407128463880967832092459057324131,
-                 447973212319182790632713608222522046895, 666704014342724850710488302410605549351,
-                 64493435536643750543920270305972374721, 395482138669055055816238825716910555215,
-                 1228364940873833651060645128356024124355, 1171331484047920275959263416451685568391,
-                 40116323574216594623035512123350575671, 250128107332181627757124415696354672951,
-                 512347129585252573993700043819650704561, 596428669170345028297162175413636227501,
-                 917144626625039741363936194037561065971, 504776220563337155995976732525385335229,
-                 228147645450022848159106516904526704487, 1259747665828843657107530738698818976833,
-                 455762511083354952393452790756822115071, 1045731018730837697602603591139546968483,
-                 334597046817547225564453185500009309283, 974483810475634713771837479417662830699,
-                 820695114400010163471207314282111147825, 802981578600900790087465465655030502985,
-                 1304915259445079093480678831522305073691, 596605925415216114505331723895711232787,
-                 807491140792590099801372936999120091245, 1035201741904861429175435203202119502157,
-                 114164514087288869663104765470871400757, 346261735727828209552076836336675090569,
-                 655427252085726498792743348823577726689, 411530014963777500433633045765717660347,
-                 1340021407552265807469782995452216948113, 892753039957378397378959478383815047203,
-                 351766428434729237657742915221256433637, 666267769368734202147394775269752164561,
-                 672627845886001372004340981431820636691, 27109621055538701904937202511768634377,
-                 370782052387188348707614899143928845363, 1340759380742603175901428518292604414095,
-                 1162436156751701597023850530046810744913, 243520390361141470182011680803108400891,
-                 501303288253006759457999202616332973225, 1264434333187968331281700388617654342863,
-                 585580621025044091294013494352082447681, 753970914138502470644210361854773701075,
-                 1276131002685248168107453138077022911653, 930881701267330405365239629637625259775,
-                 282953265391217429052233672138631722883, 1240889736255130728482794563215385754347,
-                 744379959487570042542183375088162447629, 1303239213188216650332734286926538962439,
-                 268039248584373191325719995236276153867, 865226217790904699656921722652836905881,
-                 140847825625262244251704779968155402715, 1061158766183685441872406801443914752137,
-                 510925900550363889471884149282442514375, 717518364243959174477246732016389491101,
-                 564772993601804106660631727816296983237, 885197604623094296040819981308489988601,
-                 1221381977088641408739169946892933840517, 67395795298394537236520158885224468023,
-                 731185128758064301246931525502352507147, 115861368645387245585046384898111415335,
-                 1112179772779030809702596682911769133545, 461268734444299921316927422480543249871,
-                 433439542644878905367786914980664682219, 793824770207026547537043124248325791693,
-                 86972259647758312430222605424198980221, 522068169059313999544314730215814617643,
-                 1340690469717702977827482551888082868073, 813550966944372302828375490000694158925,
-                 35921902829711578158944788428431302195, 791563140506090749882366901734630836569,
-                 962943862533948668968495583723891634049, 545868614526961041031065521531072696617,
-                 1201006329496208789817962780393651443451, 1126921364218259778370272449701652575011,
-                 278343506377920645915524326621767713665, 1004499015361569221120602598359221507237,
-                 544630443649526296544418412847817533327, 1162486737575291297004683385657532065691,
-                 1240260927391945588971072443150638579837, 1184005781506124538380583237920590765323,
-                 11289550888377750103102044204208745329, 885225101706654756226904337245125834269,
-                 871617669911836433503224747595537875651, 686236730578139353934620102881356081753,
-                 583472352822707189511613449917926495115, 311668279989749530961132909903915727509,
-                 1333021513391006172939841051717889607941, 1064261682748425466991962928989608374153,
-                 232665185121821230704005392014135423043, 311926644320933289248037200679752185391,
-                 357468856928597291731056821077296439693, 1132320522418887463535667002655770907643,
-                 857920973731289152365609432196360590501, 1175869286890581772993135033344317566869,
-                 629024747410723737838990470763884991331, 913113465580857429822681073449660154985,
-                 1216850059548972277289861362875908562043, 853837348587339550460532382874380266677,
-                 413827808343987698399342008767394013603, 313411777113763106127065352654628319071,
-                 1113628446982677817530792846445348969137, 1281621931525511545901952791294908880447,
-                 425830986068901036350205855884108478469, 738930606603090357808688047368206729141,
-                 125252188797234173651897066235273603737, 851848496706053911430470980660574904413,
-                 768258822176101401601440911426592953025, 402504167685945077687387649799943277825,
-                 1018341632028660676795499585183052479609, 738525876734202700093130970749129201783,
-                 1348789849123373127623585514299036430639, 748254559830293009855068549931592338423,
-                 631021374683781926595409313838207772983, 1248642083683235038281026727689481337779,
-                 902692798401195572590843034301062586973, 142372990556110176940223970274306393823,
-                 338122274306185562225013804666616617565, 872160124373254741508837528304424284371,
-                 350491929527899011274216899686811923665, 707955995741992708408249877222185555541,
-                 1044476380818568656077004465427291014737, 505170283299252528507219722893319437373,
-                 1118887011982691776045050224004857666707, 575118750799339442786050282218356360699,
-                 607427385906283459272277502028279242743, 831706413150003679107793286765452724743,
-                 115386726329896984636234217777812022479, 740658425135443433428467637962893039599,
-                 676871468930675652745080069871409767903, 700370447209097914284508057877832973367,
-                 331937027899944590802903637865638145869, 259476561648039227886122204501889965417,
-                 731093603427306220086043450020575379571, 1285985025712697663077366964090496090503,
-                 279229120107484528212519325345110203343, 826710665851954777541746426378976191967,
-                 1354193681296212511088384825617049803759, 298307483552628379944673547144664099401,
-                 914876864609717145608330415305410369167, 374927257861888931293505231964299690681,
-                 1205179889830215719471301005669180341993, 549178826849392771992508421411971416443,
-                 146712837853223159080183955463443400025, 1002985971915985028859484064062355708061,
-                 1072291768701303114998686441327392708343, 932915917114088941880080835239788383495,
-                 603637433955658809865924682376781289923, 1281306451298689133873854740374860498509,
-                 670729428536836279178159629582125602645, 249649954335209161397033845155106007183,
-                 854036400530742450619239826804873529427, 439064790015348289426256679637095367431,
-                 1030630842634726512646217991181594865249, 604631306152096646673148704602766795749,
-                 739251155570379091482840888885482348589, 665553477114010576200425480467105364773,
-                 912580742888288888103481027892677633065, 224983910547194195258457986613341520175,
-                 1056155517032194067596488711279498436799, 1021862556295479859497202519425597837085,
-                 513023480754237673295211166383062088965, 1310780994867649105235669795458459996915,
-                 1219064547114315240434694744440000936825, 1322238061043194551212245366270885027483,
-                 986922172267480205463407039420853935649, 334436982840466424052266102136134240959,
-                 267253038453431678039817294221460981697, 843556579692424625314203173832065213857,
-                 455026607437689057888966841677783482875, 1163662380084526073763570026836166486979,
-                 247634831443164539201011960218890349055, 876813641831583638348651162990591250633,
-                 787662468008567996910276842859967874695, 39598889610858138941042826124320539889,
-                 775006499026617894468968075095601177707, 559631310079734799384205111938559033499,
-                 999065160671005935717871184631751059603, 335827196371640757697661298418928346957,
-                 234097540221149727773996074561243300971, 79615808518243272040570861154722741961,
-                 176315392013271499630265259619749665961, 23519060946512553699645340528021655641,
-                 224461354297639374148221744913972564991, 380565376602918050364889289085486273247,
-                 208529276141660233652242699853030755183, 286735216954491559019429905242620474741,
-                 350506050928167268449728731838090786333, 172605326776285873675121974738891983187,
-                 557550130497681239371780797655883218727, 505565320610833209554720085730077136161,
-                 169747909753011658397259099166909264923, 880475100790897397981394368997711592089,
-                 138702568134443158939979396121512585541, 260841602183280364592518789950262839239,
-                 999673298669299119630592874536796510931, 78975438782117381871500225731040612253,
-                 810726385795620841231125785158965427371, 367458637511638290431133526535066464499,
-                 953990377206538173731128327331543069377, 463091714236773882059615366936403061735,
-                 935913663653891056433693016348328302833, 628120188360468803991610294564437256237,
-                 619344388336652534168680982050427619095, 8770140484833047790730801084829194577,
-                 962275051655582527118256851196444477649, 358660112420126394909931636153388455665,
-                 162938918680875602833778380994142700403, 531961744464504840055045372634629752839,
-                 241023132245461013195265371854476622897, 67614362511529911572349343308687268765,
-                 1110000104637095825764760440577865061677, 1028070559146735077781127236169852573111,
-                 577668138628541638816923474704638508379, 916416344775460091879682367317587811317,
-                 1345773241683504028220533412117383352597, 1238626425080363067258776631031182377547,
-                 320305120435514594115011871033308649387, 1197109268326021967961038612824235742285,
-                 926764877417664778694097923094319047879, 79536648159856990419155959405856984433,
-                 786391644743356093258303499261870036507, 330620822942155571044628141297993865147,
-                 874100593350163205745532597124340006517, 388538350716699301473505926787122010933,
-                 129740866757172002268198114967836317133, 183227902010018921561094851270513754301,
-                 1088293970804399930493139581333867440969, 343864850460370472389187366645313305367,
-                 1269069274133048060410951018259263054143, 228999998103065884544042956656950231213,
-                 12470086128548918976290624390554341555, 593001831800812117748655781609081081077,
-                 1076983118833968289699324833137892047415, 205373109228830059829598680000637543675,
-                 59857412008469633534384274581149847801, 1015657482674604526385646495376538591823,
-                 577872329623096553920949765640981380303, 702036750237259709171083116678033445539,
-                 243174360846150203576892867643745788957, 538583192713145866967038685046893171999,
-                 823571025726745396955414247004404099789, 309554844448691686125377485535743446445,
-                 100966181309404498950876057239071925843, 950153758291904403443797294665798558151,
-                 1035003747668098091893953673733546398119, 1187485258562411432761064734911822608131,
-                 140814746464734643689490382938868849081, 1134011648048711897071346497645955723911,
-                 816415347686391597055652119342040143239, 704919022060136203995059305187463813461,
-                 66019913060972762894102394170581538619, 1114059869244170622952515178336992906497,
-                 289707801700152080975895737319733062235, 974467447395154397153005134297263886001,
-                 1053021770652264270920149503383059313395, 1004900736764942794991848153383570099613,
-                 1212185494959835972797405401408271490763, 604026753714781497556256795851778371689,
-                 207258272766369575926198705951948092203, 783633926529737586694788902930882973387,
-                 181852522248864090410176433194762907617, 894397189837182558537101871642384411845,
-                 452371964578268925318841693123752116743, 866407503009078498992823367913439985995,
-                 1084661107814760036862532789174743718551, 140710674198956475820212661337966638899,
-                 320803228329277684757734556150425019497, 967450153615643414380877327442435546807,
-                 729492492631105705436675576161680035749, 454660225795242846745323323812959588011,
-                 651277628986962145637758288952595917565, 404209041307796715274366320212958352773,
-                 676123620556676941673683032486888469051, 348915836751581443898528519948988688287,
-                 498042618147293664081581672732504426967, 328414728186350158752398790084863641213,
-                 1098350080863558997388314293782337715165, 68884147432691996626075791116051376663,
-                 830805204674852499043838451331398070523, 1268434699961474858646760696146593351973,
-                 689332655900591223228870617908096019917, 827908665421368691317763341527113110387,
-                 1231845743824314784673932914256137992591, 1002471265570260166643317155918911060203,
-                 392476813990193286990377053771452914963, 642891170934698346712724553392674022531,
-                 924887465978950712184118821194615517933, 472251706444056440641646593847306740933,
-                 101776567493659124346468604106699220803, 633751697035974604427276953581923287437,
-                 1121517293474523687355001243835641291245, 1160536050991179148275877604992998977661,
-                 675414396072874148895566536642657620867, 1085303940447535804911002767212015658875,
-                 1250405986689506419677508622360067007741, 538743533980018122435564570074466575489,
-                 853372555933799722207802086340089632297, 588654792830089847137110620213048086907,
-                 257898106186812901282923992244245590081, 1027455153029140673205959557913646656799,
-                 799390585949833788622709484147596286407, 542210332661472536274500237325175380991,
-                 643996356193435561233580303770490594009, 821936493209254958634151440158373292063,
-                 1336094184563848578386021196152635193657, 572409711405513111146336478918324060815,
-                 1030633807892674798086404357456225293147, 13556357591778748043382066266152525639,
-                 1050503435828295397674873037438268067895, 206297711875810611857931936664284907689,
-                 714455402406249308436007868933969933127, 488526900227271073473661373546664243625,
-                 1202761495907481745938125441094495020841, 269883185635176943958313710759592313561,
-                 872147573153656678865425820617954379529, 467324020332278356491028694886390728227,
-                 1162419547717904056440991005479108003511, 673477199345617597752147393905554772399,
-                 254930475510026245719180716329062417009, 414225123976747066516560673183959005319,
-                 67314876469207488915706113253630850119, 1075926698643695470665181876724320077817,
-                 1026997772251502149609890631223990220461, 741761815368366657057906700578982355087,
-                 1132992815097952261401414980953236605489, 982854284992864817646104758166203210401,
-                 369650943596110874291705763957259413169, 282304585837463100430586329019447993727,
-                 954135717128405114945339171351404408281, 1045969560727813156679737776019439812387,
-                 740434333893243965607632925212325828235, 316148044317043582221247421294724140627,
-                 547486118859683494745612341429116087369, 283342399012849917660166657072462919797,
-                 203021605175633852800158921968139956367, 295860016259404358145203358291192411107,
-                 962287983932310144406045653284125273625, 754438509547824675239205356460262864533,
-                 697758965490936395231974644252700025777, 187205749495244126867190328480716514487,
-                 822215226958506430268196948407519619623, 1224642739482075980211835386069933555231,
-                 511522081513266710867561673212573786971, 887610877473230438582064533914667100327,
-                 1069313268485468695413414081184942230069, 827375570958426233783724084321499342443,
-                 390292086083359354707819109759627909473, 409471690505584514314995659207462685237,
-                 616782316294104896871631951762590119417, 641020928790931556448855515710032575235,
-                 1152732642901753148381492989553791102709, 430475344256999798301914519894431942939,
-                 953461963280456639338389775048840039331, 1069434867883903654005569951016320063799,
-                 541150381982244720213128000863175823791, 951931168609183187288085010047201149131,
-                 2157442662953399853997759370572996413, 1239942882591639320184225185229342466667,
-                 168332428497070717825029932843008378709, 159341705777927932361094726458883948785,
-                 518174647957888048762831949783961733403, 978107354985346240178269728936634036637,
-                 329327307969000351433486070647711564101, 1360786197441015911602688527956414364959,
-                 898480248381684733483778870700317798711, 600737971656974806465970653275093255759,
-                 859945554734468666679690182239715855729, 53711717253315031613635923336088910341,
-                 1142201560595413214171031352989822155699, 186037706515662279848482665009317046129,
-                 817184626690290382625922945837668548269, 330358649698474230398376719875395764097,
-                 376004781160733644343256658000854334279, 773069501883780043606136771866862738275,
-                 1034639145565134948775548790706282911265, 833663265773837528632963130858739788621,
-                 850525904526112750971966671896091446885, 28888243121380603424348988852257071845,
-                 834784274413006306475097995504738369647, 341187740060217088822591775284348877401,
-                 1125168483018258178641097523369577348803, 541388803597060091343920477147357752961,
-                 703173819274929737477107540914693554487, 734658096688856701755815919004766382045,
-                 628096050022009396490575222561074600505, 57195269439896673962937540549778273521,
-                 68127801389519150068479990930938328155, 1229462699584755272731631135258231040973,
-                 477742195665816778331882941994649284899, 1241169266926517401627879394992902514951,
-                 336035440325248805971535611520498731883, 930804906468508457242997104477296216627,
-                 646111894063820552558544227137374180677, 692226810174547918457222038827194615515,
-                 7117001944366112774398678343452751005, 575412454503096412038994212711721275631,
-                 604533325903169756173774442523908578231, 449852675898257980113611427249301535527,
-                 1355377628982085055309482901869375880733, 466064788971613851118195023516960034437,
-                 1263450679104082074902699308642559774627, 21570920632967535526482972365372722531,
-                 110663451825115554869769432717324629819, 395507692238114622986437643621522663593,
-                 1279675659489756504102108654778457752311, 1027172118950996591814080730950302820149,
-                 794548358277553283716794186147785414463, 1307478277071983223730456495695259995489,
-                 543517671548998477662689041608571121093, 322607246017824728728014393021250565475,
-                 549484881791573734846357848638929477525, 796476332951674796726835162762100438897,
-                 1285217085843287143324428133596155472171, 1016145827195433026701538192407319801607,
-                 1069251868581486343137218208664849904867, 1328292248106584950294412870836335120077,
-                 621811329048184468880351164303207752309, 79697885956915622422212635698816960037,
-                 343243858925440621023833345398839123425, 937269008648243746671901976940463159015,
-                 193197325318387611450451446093062483511, 892922252375490934075244446588905507533,
-                 1032547133434560326213154461601235200753, 1115772328700742292317350351120920872687,
-                 1238458559858373691758032251914790162883, 17538784186817976843033280908911585603,
-                 1338018261887946095326091360737888672441, 555468808968963734182038743603913140027,
-                 1202786263314340749466616126529155609497, 68194745013578508329804768925032071007,
-                 40583599097877740505610581384850545819, 512615339136442553696543615968852424557,
-                 778747824234820665523084355959465872915, 241560401950431318692791174425393364929,
-                 426085220255443034911071991823167019039, 277032255724257246991187148637955053641,
-                 1211980419552686944052257850116795387603, 459784369962213609846355936874666125475,
-                 315206350898418378300815434051476493231, 1041650457795479618961932691600074113611,
-                 1241426725029146127268264954969322073771, 1330624416980473257229449817949299345605,
-                 1195279636985901710799161476518327931181, 953842807915427776317575925230553763119,
-                 738978625704235830314793572320225159697, 1149437178703143015672574305588032267259,
-                 786914297293749272447638043211195402297, 29698044611302620825662095246015027731,
-                 811971840452144243773880102653450250509, 270204928281224204356070436418941690431,
-                 472850524539878135420471763264648946267, 891020019142423835909408627905586015821,
-                 727754604330177926248364950129224538183, 680308395577981457147851784973774191489,
-                 40561627311050486565479994362321970239, 610766236692696725076066259317250399269,
-                 87338771737422092085583929796451305823, 386915293916103961876679922665395940675,
-                 579007284543734737886885840764935963771, 963246690841731030280168010268547284389,
-                 1338191098837772161034859948121333782389, 524402241359437375501526405004981202241]
 
-    primes256 = [156751703257833395078176549709540873671025809402851313510977011461414293790345,
-                 764256633121765462309707049227428533234210403227515609939060254472433895317963,
-                 1585506474355823525716772939587799668547973738394519630897662137014369759196781,
-                 455527300644567345598571492046424631686359485257391225566273222624480267393897,
-                 166277557237897527182173593290928178306147001883798834226072435907701273515845,
-                 322949295094747891668433957556379547685364822944523939883493447522563745745367,
-                 1390932530122782676997843291278932503413675499322490416595631603268164809164047,
-                 506589021679305341707671321577510255974698223491163848563010668238380890898205,
-                 1440750812985290245711204980087700795610349995172311977975567723382466435843087,
-                 1307239668065861081803091402155960433136970857200825258535277784113716669562453,
-                 1404527393078871037265061324628503251463422603895716812634548272542412789656461,
-                 1740014194031628095337922188672452190614343652363099877395855891441368852364951,
-                 73220666363420402851966744529385980710113923462707328246336515841684766833905,
-                 1493464446592388696444186316111381623376535520409263536287964059736208313760739,
-                 1327395083199699953030714117534491479434947201307180532065177195451191953261061,
-                 1794509827410764780209847143820599745838834477788456256681182877785286975228969,
-                 128511751872619364963625540321769346580091191707021297153844890498134767665397,
-                 1633397414356870184861176919044365215835758504668068108314082626127468546740593,
-                 1530605588678374952671032262295194464389891653553447203921115855380667740640309,
-                 1791107685092094974491680839416850851125670016055208574679772959750450359748395,
-                 1459169147910663805213389729413775476813369481283595678323068044872674740944113,
-                 287572166235182579914171070626048348628964039871267529348094144050706607883987,
-                 197732047682056537963883819868047024986523388278132110709032948945351776844809,
-                 1216811141772935469806988563789583814728617371565897286719651108512984000364173,
-                 333975906957076350271699818986673975921886678545470699423067654847413990931659,
-                 565165587841875709773864982150241118919395134988021375333886287003794672652137,
-                 36155869016931381409089155098372164237423429997402973183827095524405481172421,
-                 1570094969364046243795121119651003506682305437558079493459210409465926347415139,
-                 1018283328484748946105821232531249230966890484613537407978890491765201370983157,
-                 1844083621481514908105971493029446485015671834066266226223244697365986198749447,
-                 1712590234321255413255973157728961916091306910445503850990360539842508125992011,
-                 190691390687919703412147294594916310182738742549268314214950971626095876671513,
-                 342307147266344415480700069096877366860372904941594226089031708468547961594005,
-                 779018444298758837227661679476202594221129790784989551746132641955199862940173,
-                 1034090334297367885830449505129010639352403297904512845226052077679291294190317,
-                 1063150186577633175710479711822682379718163142502815918694501096539626610644749,
-                 625453498341240568588400485550331922940924678236982360292420631900585341123357,
-                 115034440646247873720449768472766848466367771320807528729606698099098350277413,
-                 1583855288905410404310567932803778664815551630981115147168062537349003917934725,
-                 726966958722371919835263531202947200443357184977790790901260162814221063561713,
-                 1766804689673906033176756043370233078275534980300287057119826633784145322524043,
-                 450686387401344776286692137512003546651587853674993050297054960837709075506981,
-                 1727476955273881135514608229431157253269294367629202199003492807205042811273093,
-                 769766931742867508628452893424229115973441070249394721640830841085803217664409,
-                 1756234865422152797652852380703270029670085028716946560597651396811188911091621,
-                 952407352264431675001829097580543253677831294314046362237001838671911137751783,
-                 201839737584851095068962958865223088058699432085768793073172169500642563572887,
-                 111675695860080404237816420048746425693714348203472363424542737490892232888127,
-                 991751045269819077944240057244447377086646803463778859462301026491073274132293,
-                 1706573654077356501386941329521922596224648961468219430271227971226460439115927,
-                 1703480884564577113365827228930442360685469660975644692830775964093807278870281,
-                 800337297194024472093833732179867996646460578939235605617901834348686428143565,
-                 654934386326515065448440669467214586491348142866918049727280205625089552129577,
-                 186676616398954563739565379870178942379586297870610789722993132963948045584707,
-                 1059849408419564025686832352983426793087135294937754437718746709903670066226095,
-                 900163139086830242238522688815131925335592739689668879962617446486701262391925,
-                 1066730398171214779232591482655744857692005339639283167141742972976412879067621,
-                 26826320126730594734372680080327671327659622639541431908508826498837236666667,
-                 1043012664555793041955901132850838088402730080565010809138241081385484758003213,
-                 839893783732062308862351228224702290060527566319757299508992261382725294419251,
-                 100443682391820534765744732825397248568498327781099114744655746878927906870149,
-                 924211595439366694081428388407922862350825922751957061612552021309422207106759,
-                 243104906130506349443854448029834137502926586039648923940162353092160172376301,
-                 1531951149230001455584262821899627222217120596759567643409926670743066554520633,
-                 521399013633595501486017020937920390276894714627328799357022338964222207592717,
-                 32827679213299406455654460537815889681203064243126400722409691966885375204261,
-                 1106412958620054999549300415368542386873880987762751458217196525451628330768725,
-                 519330487534269851998343672438443436197597058378093931402467299332376221917867,
-                 819634715133930687250129015251327025837384703308920457449775809106865870141339,
-                 1247619925998757313606122814715821974453189399512531827252822237124468032833869,
-                 1108338875047980683604404268673147494111788468764471123928100309509480495280569,
-                 701116050698669027595649849929012819110361467472039640054649980698310785234677,
-                 774922594041180216649608393570290490313268014320032400788016032806292260777019,
-                 881356857890720741763864189475295277001174766935362447763451787510499416323359,
-                 1676273780256758862406339182217415838829230051586880924122838055387884391515067,
-                 1790539072849672516272215404763148703740959747488177796281657661332519455117131,
-                 1095050587616303863551693889527703729724607482276743972856922337750484462527435,
-                 1741780967358460684074387152505179069077176352808694106877374119207774916764961,
-                 1160940457570211256555989903117961813931916511012416607517421403197641801445911,
-                 1784768779737834407009044612273351928361050811351863513131681401420208790230023,
-                 1849649367156864662832235670487497398088962649784223728092607540960156503852153,
-                 8496541096035228154797725096735430926807638703365801349363071678274999996167,
-                 90175517624530269166786747640301842097642530790960661978576725180758576613465,
-                 206256709885501405801008468470016106199587701280384552523647807261401407292863,
-                 923203969595622426394974071370094380894436942830431994203098616630704675858621,
-                 133298772503527804461610988978887047410527309954932510637226522002339340743985,
-                 110904327165529669329487265705903345560692082654997686142007219801270452128513,
-                 169036649851858110981829250489191938441436582391830716331325526472289490849693,
-                 831441385964566116471786048528803083735871554113751025746006563203621862281959,
-                 650013858409785045039199434648263769414709208843181691638923954191378243451631,
-                 1611105985144531346344073019506202613606080814399032298042741541658725302672529,
-                 1007810769982798319240474443636317919505866285303376111512032670460864431335837,
-                 1505644629022149768048219060584340865360220969841523444111487263370922973193811,
-                 1809022854383025947300360491350129179948945568865825781076112612161881761435661,
-                 1381334949596162845387666068069570327052192447640167447489883834184968076545889,
-                 1591317916819571945585216853511482047213534874648671557819468127158042698977009,
-                 1279433755558039100524577064053962043067530950308787635776862503488902908002077,
-                 1351353162158319204054404346148006522086736420563713161531369634166190569796251,
-                 1309042853171100267462130668668877002325010206037379906059143839428855751174589,
-                 206178991402109061751215725753724254171907269629357864489297247308065677243437,
-                 730551452315289223015941239759403587050897533742277071104212022579216742421085,
-                 1705747828135738281278323576022630408731165319799700357247508746420695321415951,
-                 572469665330960033698283041574233074944439481652645292225611485592764765830263,
-                 1554341688407263694725197753267313801665786594851526159107395957255986269469577,
-                 847564134928656419029725377417149108993181006226095074705142136371993644409615,
-                 1328767941593547998877406722411694910053084208017403917322073088728795660711121,
-                 55951987383492360440241133717813109858012379273847486710314594534747146967641,
-                 269421643070233818513202907418427759665004095158390329951493090186618987612309,
-                 662804197025970116334327820580572571953296170974307462528210562402759152297669,
-                 1596736942363284564214564142804742162336779458952764034660817707374229171999479,
-                 1644279987420821279321730089908697065527017730618900382654134643470552352267959,
-                 614133147046849110278980235963603499611262786154191648425501386033006758467243,
-                 1692617017869535441748474811018408349694683046841641835951027276742237613243553,
-                 1396472654372942455701997602072951031193469451950264365510515767537139837554297,
-                 61015003547836594034016556992815996383085975287674509814250546563930512042057,
-                 305952135509676530801617552765733288252842593113753156137097484510875562897005,
-                 1347504226802634494680933623972234142620473844995637924030622309917242875306267,
-                 614788058234449706326700493323637184087793705308679274744691385036326393773937,
-                 1377915004938884994611532810313584673673059230064820708311377096245492218197587,
-                 5633475017014295391670287724224124164850029846013535042002773091779394404015,
-                 372698333747021603694460233080670316181682175051048139752195282360021807368631,
-                 1145248473927811263606380881985487992615743938547641371610292970562269226698867,
-                 1021507611664535376599044776529486018381338987338198218750779437062634682348091,
-                 1645236155484205205762934996537472784653261397365340284539027385940746835958017,
-                 1709602853312344478662393450875523696010008834106938313513166514685274236488053,
-                 403230641563186581731196096334850469925700482039481323946882411222283322258617,
-                 1470789022723920280217046222515621201634708239162542788112087264576850170496817,
-                 1560252767203536806713897288310764536132383621729182751544998289269601362374423,
-                 1086572818669686628906562633155291493852828492080691516063551944060717372887627,
-                 665955407638239563126145712273436258915111269794028949447579982485480815113669,
-                 1120227817900169969892611868385693503066928798946209780616101738361442213371519,
-                 14569757422953482444240651164013880108151410261588635930632142204862545811961,
-                 74708497365176629149965894294398167089591308661156896938314821764122584633185,
-                 1244895072400058519354393102633898770542454457823876019383467328086843828521125,
-                 759595892379443199131119577415533223286077703567113440238031548735033065595373,
-                 200874901778296436043237353454592870297167356227387637604709098340225976349921,
-                 1325667171908015351199574897973823765959160699312334862885676939159366908409979,
-                 1255897445142991164224701979421332397304948626539178361887348677501344134212081,
-                 1647332629766147046206291498759586912803916897986055149590946864670340414946669,
-                 1291608220319676049445707956911397720839964067226380893130186702138992087639727,
-                 947859257550126391677894420993735918289929634235743707287777663752233971733177,
-                 700054934830516349165292686393636169619564380355022616961333156327322561974405,
-                 1381101613928197764345861813364602263280955795869704446533854951318004641025695,
-                 359090369704780911285169395837977204448776581104935782396682465467576209258411,
-                 37686067121484847383529706810116414139311614262672815477487683759492447883989,
-                 971114398024617464602562805740278748000403381601284429870676846599714134064889,
-                 1341300571599897220766374645369148273332103997806479079474780535785983227790909,
-                 979881810174654960158431586997188784247599358380179621121656826046187303258509,
-                 617526889364965027477016304275465857263860702106549403004101953295729121181317,
-                 161218806823999523468820319044892051514085495229359071999051547263705028606673,
-                 193794552007998931359707569778343200720603932358860321965016119492096052363185,
-                 195598351724685351890402315871520751583129905185049040076067211773954541077545,
-                 1588199155302329576087824539488930482325429179517397956081607968443224542030431,
-                 96508909632329459471694184791739936905598556265778409593086875341537606989991,
-                 508099954572376846476793610294135016520636428603320626474099453714367632060499,
-                 1147866156219349096366591930784942836195391880228588484311653401968222477698447,
-                 1784480364012422234575437143433076789235777312464946432492888027171482833857101,
-                 54909024809284254164385440527724729600245006583751534223668282354373716708701,
-                 1587002009524313566709843848680526905790133957964859856078558021826560246770767,
-                 1751529659639389092894730699404512776053235233397399769620763897312188343381227,
-                 1819802166770523619349098161209186413863249872598630876468330424128025306884583,
-                 736351627011630729001564163847304199429592380825978848815496946123095847516255,
-                 1140203467959396178825583814091552606342882255320374896822420230478100980340009,
-                 996338856161158888964072425493170854445493608269255075548832542230998723046207,
-                 115722161036756435304470561592967911704875059691357644992781837767312390699719,
-                 1680197546349596935324851981358533212804127646610926676267030959633471075507647,
-                 363798306515712888474457425970559070947970863877926758167022593979080883833077,
-                 154888308540363423634944169851053122425073604654739291952275787097350058666307,
-                 388307000575189328102678665311080620673972866037730743807198317958232562371935,
-                 435826062304095478747582166803421745119333951528486306149075595889066713113919,
-                 76175935188295631575734865673706994330335508170550341967771771643647947256643,
-                 1201487892978857089046426251442515009986654269278216157385723928339882456360715,
-                 939823792522954173061855170383904374545393657758199327690330497797212446068947,
-                 821979394226473714373384306927000126270744007414123807405738004700023004368539,
-                 831339613299959045097928451395058746593121297582907220713590029378160848377585,
-                 1469345160431762718797553467509731861284784539651282940159346854737150246527993,
-                 358974499905702261572048203124409977102775553673239408241055387772321135330193,
-                 1091090428685884569136660925474571676561726142912664848570990438769562116968439,
-                 983070469586603547824607946646008065371188527093102008453917106930478021796147,
-                 1158102316858727771590137054155579298244001511676618538867700218913986896487817,
-                 1494658456022938411695283099428596502955620006111082764928187084651218366406683,
-                 195300123196838679733873815766756444711099781534042824623377479331222045598857,
-                 326936772254295542318037938529452331006904805942901156859149391683029345669731,
-                 1253222239465066341700023828216818222445761546056297137304061786718340418908297,
-                 678735554355027659768747797202411977420481443697226809799322753394128023571075,
-                 840015441999500618509655362268909758726797794804208188434146539859516301212901,
-                 1021298205423692428266167043710590358662672308585282356299332170023303259786795,
-                 1269311160903153705555732981249983577276929837414628257365602648513274153193359,
-                 24226195216342458747985820973254754151025190275927307116935732742124643404887,
-                 574266014234836695612187099681501355606277945070381356764874915093993169789497,
-                 955786512122659200156437409294793051454448620990341993161137354923963463078829,
-                 1623696624783409458866208338211535168688212625800575645099887606807868744964485,
-                 1400714208039226726089569177474295101138415806307784675734318810549216578562413,
-                 608148799905429661577335827595745076685891204203227878759983327085808966769565,
-                 1600082146279030859085436174477245924082103857879983470126289150368248455961391,
-                 280114502796404788960223931425840875661956199625758928320972682503504353510063,
-                 225114502841159819405939382097677133147158332995380676888244946791357646716051,
-                 1489697856071582881984249128697752543863188863469562877060889420114567093540415,
-                 1453794584583539398673202410683819654285402244170782521260265005182885496128669,
-                 1218156668400045021692841351053206564695610571920195161271042246029709386754395,
-                 984365955803832714214738979878682827490598567355864690132104269532090384568611,
-                 1211478744964006669349332477117568534938324336611936641666876915684849909073841,
-                 640322536250842204231559758599711094047255067238692438272581422983917917979651,
-                 129583113102508884462066951838883074830258243692446152301953988095221005947057,
-                 1701978229823459457747601994053971064502891781549645264970051460365994359468007,
-                 674140221677155475983013929328481504959789297195604971070258192141079474722659,
-                 379481958477267046341949198220632124405345377661119361877821147203397886796055,
-                 620930319615797346845356855651704164341892874535748483906871564241726673998507,
-                 1301332374556229709856936553052430852042468175545165318287434001817780291025725,
-                 1544267040292386412787675613006909072026087860168025099036810881620499715502269,
-                 299354073342572260800880582349200991721941520358816261554752721361826437887293,
-                 265344738010058266432421359638644397470214812223769885241482493143047465161081,
-                 135147647435747885456890430047507878887453187559768020934787360249746442162123,
-                 866040430382092257816804039806692788506010122048677325996316120473070235351165,
-                 802004437164808876686615447311550951905985406093718990919784308006593837583039,
-                 1251707748378501759613398329459191251507034273596854504088488929568129786087993,
-                 34801763307107599208392362314907170032453581047094742025749116035820517962231,
-                 851967229081049529073616964007027724463230655555367469203141013552530635863727,
-                 1177240317971720594109688993561678702545705881337476568387260531661898297265519,
-                 1373622296205672671794823322368526417698400214499339157601938807282038527975499,
-                 990700871700040277805493116098766621795579164319240389930082580191588916178367,
-                 284369892855567171320729237717409858232311644513682964924451737364423942141693,
-                 393951370554107167153576578042690241093259442571675092395427870654052001808171,
-                 217402011460863875905375274433316663777759225233584015705909567185241285955381,
-                 955955348622895983033124927812025598592486287772965317167825185222467625562193,
-                 274415507454948702496552179061334969543016846553305432176601219392914628552857,
-                 1227327489171642435634715305941602559642968282762338634701475855813171749732707,
-                 1564948874308858566115829720818114241552015021338867546927357994498025562877119,
-                 618846956059478586904713028653762131809205187223371601352343255646375812339999,
-                 1578605549768827499442295129107896517451521116049261496113505351974195077594657,
-                 352103317468191892841021859336893666966177424736012408054076920516592644282545,
-                 1779444174604972462152023909372003469647345819663486494140699971250463178642955,
-                 1765086074543640982147613456592763616328004715213225160058956002630920169195139,
-                 1324111597125330122618428351948773175630071868062882811446852393073964420732355,
-                 542101758772491613116499719903732949012859751362385750326395458981719761820145,
-                 691435361114520345563511598598488790065381772929272042486950273266850044199735,
-                 1143929333321325693128395595989678302942314724866146085386765844594892145732567,
-                 33423312481808194865705495288914613634026404471495961234913141932343034744417,
-                 878187964897626836525933846912345090671863290047044761210044176948991139395555,
-                 502476832939279831286077064062628404340402601860369260990543887060205962343889,
-                 1120345154536914235917012931190698736250807025870609827629922390728231020351803,
-                 1206084861526804855506495965444960160376174821618887702797526880257876678356913,
-                 474207920183562020348120134788106777599136655664236569723167379198882076709897,
-                 321563273332785593832798486114172797679350416547817009601657068918629946997389,
-                 1551232019973812175392243800653840729456101807893700862158113950889892210351045,
-                 353603208153860271658742508225506473518431299018833425751488408878944476364887,
-                 1334917418267360929033956100258929192622964450211708909726576057813884689317311,
-                 39709714944425154404785814192633203552503382582259634524380644990331586280767,
-                 992158669161311155035998202425232363922509045499399452276997840124889540308005,
-                 728388503689629209358761190126312361928852720548906684932033613355171629629025,
-                 1014410788740791667149451051621648871354180058751342340063623842711496743411247,
-                 1042948350501663717056769394267642608821885254742382783454789653618263890929047,
-                 969161668156744812169290217651393965013106128999489831828678936559511668960161,
-                 1337264404835625520753962198372295880729522955415932567358130887548891515357127,
-                 822682329674724630042756181743706996548015588000446003072027654866005845029127,
-                 1486183117472634204360147356897990152692404411751775309725744074858185107799263,
-                 745087576947810869306552022032179683308779536372848626527402716432200279777159,
-                 418920842921346576024364833670918338154737549483139222528652435567933666614593,
-                 190418497641927525445574387241778025687760257084967847376694793970178003338561,
-                 751266227216721041001640859764101931528954241247814640217915332072807166750025,
-                 660751588254611666427300343757211551783690772815150601714998790467978394280857,
-                 1031948783783717904038087217964003914055769287668875268445056186287393186949847,
-                 1050391314784929417663606493317022094479852603314276150476626534356444355757603,
-                 1580385313312780354174130344256334045101234477150521696777930747277794155237159,
-                 976802515272147920867203407202356827097815537220215671029377753220507445781785,
-                 1475377373084470157431118085102420377852093532753243823895912059922035616589551,
-                 362202464985857867074676327733930143899570811438683207494345988714110028547415,
-                 1366279209044548917514590596014513389738166043787065750107805965988615438989129,
-                 173437780345861201857282275557294738641030644258826446296461880864315234328543,
-                 98408809461421205952085931175253946041645023725467167262625223469788694524143,
-                 62548576433719608594837272527409235887637579199548799932209457100066303921485,
-                 672137899812487991974452117608415625888041393740663654027423905092656293192417,
-                 364238212346143618404911575752331472992185592095406674567748466888838065648203,
-                 581072809872784913121646061374676845540895279219254449003295402250982215192287,
-                 296940782964105361836937984312970311252547011475138308062011154535077650591031,
-                 974024266952045430391323508889268804851598735289471450198956404618230209773197,
-                 1332658892047886173634072819669536660497197859396929354932150938381270341198995,
-                 1552716198392856756762858011915726155382090354514706451654562599672006562391983,
-                 1488167097660967396448409521998323131439952096929026220531784132565798425180885,
-                 817175501896438929427933531914289266322073254717961890224104355819743311471475,
-                 21564156119365721268639118460537774032677395708204097373013271230285597932847,
-                 1363732760115855832245798111567272810282251977824106960647005160958103119758615,
-                 807883616126222313551649915863202446205275641423284570179715956033896369736347,
-                 546742030404957587489440748853650676741600839672851263743132417893501547704243,
-                 33916107688551107832726322048199978595055281110974535311396427616995496108019,
-                 361281234902348523280681566168863246833490446798207036285364123882296493264903,
-                 897682901153461149402237718936478085992997854461621706564644801772506984208415,
-                 1169652351996456492223778981485631125177584907981484565483972898656669044193117,
-                 1238733779095817171472339848403984892389473824697376096384061117366637691813743,
-                 126381506837156972899422405353686437354733882416656156613773882482299722626691,
-                 839370540665503940405264324419553079533446077678304293852271566029715580518393,
-                 501777755334416024310446737708373395693116015653832456840266624134515629855587,
-                 1802338473569606955465846731305798337746355104766687388435966318765560024256983,
-                 248229808217244916999674251888911554097342294624393928550515864186043360666025,
-                 1285052938795388861711131710309741979786221710795863622644247173973345939983083,
-                 1725025252778945656588695284009873627058840879294619942220741098709184377951777,
-                 1841629434193100772415576682816382076664265935878688278986799158310103577940497,
-                 1206877351608363353993631928199203091495729604369444020184393583162884156894555,
-                 1008188568820822953129410366290211701214513802129696007310360970292217134867925,
-                 1522183906513979490687915193986150994264299934717471826700116886907593186044491,
-                 846438704455086732630171820073144125531213428808811101938907103764404103718165,
-                 88013242775572749371183890747703876567979357795209598918133250742041467755961,
-                 800074685517817240734013518370008892245108012737268807563709755731609274499239,
-                 633236807143037896484673845361846441957716533308824034435183526988140437561683,
-                 1464452569989108829162062159688179812765402370905908066925084308767374311833231,
-                 930299814889209478332631227566620031883739021348602184317229170697014011710751,
-                 857623652616156690197230805384516975567385295363412537871512306081615018314299,
-                 1773334481503594707594928657560642971272805947968244270968825520322953458314265,
-                 1579293433777431468417566058197287996238983993976593128803704328426444768693651,
-                 1448507170904011974682901677345183264707128559955049891063688936995480889162911,
-                 657727803401613305422249209228990388910889735630766440546536010906668987667045,
-                 266033172798704955499912602601097885611235698140528712617112524588256553129763,
-                 1342024901377923884143009818961680417141795626616253518977884102534263602039435,
-                 343576466502946845066119429093779925049946851154120919020472056047665605051711,
-                 1181384593726947240872732411593524393226107180216494953117737720273103914584333,
-                 1845641560902924093554923888036242587994503929417395389507838553241182205342989,
-                 231369498844473100375509650689323044602838839691522340180249995321486653362699,
-                 249836516473316662472251946558625906998492704437914705997303769580442861196707,
-                 1453776061425201263252424198814666016819070617767369152741966672751883321414859,
-                 406597201880532296416451993252423301082964140331929092449229837708414873829169,
-                 614064725845489712544550085685738652339425837450768415206460844719839482250491,
-                 630959380662709140190053508328257512811530093461687733041990879804982382761661,
-                 1476076667239175702315729170078338473656078999515939386213072775873262059739665,
-                 763307404537382456429073866780160636911235100681001219572800507953092535255859,
-                 1463926742768466658843155281664630298589581771665143042305861504187032502807633,
-                 1270354305050941586172426695918989341985056177133109610740904087754961097185481,
-                 950982553044735835795974724450207631763074531654978794867607127693164546140077,
-                 915650368897475971336124904532634983378387704612880701739250955581058613409131,
-                 377668715699607966204725712657982499995678940315078384543641250584394079293603,
-                 1316661445483556227561925214427926482796920032079913620693811341120271214512193,
-                 1830535514188968319372570448433458354183537506338835445264260346963045895665979,
-                 1121312071244792020390461833202922753748107257296876337538781620058223635118693,
-                 1092853477566683735391062130694058653859369339940003802324572911230050645096573,
-                 735564980724034158270821289725433032046573852069278485734789859122762961785681,
-                 157405581082574790892329906336703880454407858765058264429766204875446974000073,
-                 613242528652798355670549762925164423220812759656357944607933635257180848456177,
-                 1290210164425671801712776215730229468095411238737784261342062948024011264259431,
-                 1222161758390723112209687213797388164185106239672267177395503667219013450450039,
-                 579807223959823972206243695494984593625240011335172021232666273896474251038153,
-                 1750685159815414346902224064301692530603047076051062428517381769054696991623143,
-                 595337636203132448899931965870191379149596488896527641980406721223646882270243,
-                 1017391078663832573767519382705675195023791779379505259900109927898041313670083,
-                 1543712776253945292507264857247862504125746878787281223840659924174711543633063,
-                 354734216422701496083640460415925230261822232539773178749875502188770465253245,
-                 290821023499931042955983097100056841278208315254131504736422272738386217670119,
-                 1322108654596187136516102888876517599782880645597204588606035304138049623998375,
-                 981945140982431770601216103169266507724470679270682520269301721969021767167829,
-                 1534784738031995516752984348396085812048416030729247160877532335325847774468585,
-                 87210436708372426574108534990104132736617525265544949840937907916337259660001,
-                 1705175936471304453286642114495911577546150979389429113632133953277941679694087,
-                 1804017567197190260934357911563576182048612530056238140267611203904582240968831,
-                 1047758111307039236473743961399226527622407177277984140993803775891016447284409,
-                 1713053151340234969787640066958192640625812584270232613627477563695381061394573,
-                 1147713402355145302153139924247054675641706139235128167501879810949075676042333,
-                 919050580505243536638719443098736935267215142721046575249883030990859231063445,
-                 1571479591109946996175816880517853466777480151037945069032352100424779370216449,
-                 377545548302405637622874945055667980542226787548642894086376077618860928371263,
-                 1544953307789733018767658196988531589252557917263886415364133212207320045532353,
-                 784297905778199242847439316530364833903999101782385818018525139808908753432425,
-                 688719990925554248418159373256931683019658976217640377771915491446087689713867,
-                 768751885130081288351392932747562662431512541362540719118467985904473778579481,
-                 1563713239889554761129164707784157909885697942891367816308604650806459374661801,
-                 607693502139702563687589431744770768110171685449295565793930759768924271730505,
-                 46809400952695512749032758614996328240297248226522339276910635424119244716345,
-                 1233883238910121811302097237583581899520618768825753912919582122685136187016525,
-                 1001543246510294318602784169561653229364074499111040927562904646274262581787197,
-                 1165470053629682185825117971030839557339800373112452963391085434653683783668907,
-                 1221606486333301946407824156239242717831916881352423672351077141361143815827929,
-                 1167225460058797713742046935485219605346647213635804014670825217421556961454143,
-                 1285204501670205968645582276171841480341720935355893141590464228335137918367309,
-                 495350340786817995426955075668706117592969804023492058906360520243542318169115,
-                 951698169771511207765958647813273728373471234821625331348833118815913124800111,
-                 1247611529112420008751301359448984924288259640838779554200836102680712682691539,
-                 1729596804769714680850335280666524248676341899386940633253834708156170278212883,
-                 237435586541266925669338127545470557481154787789228014369345722834578132409733,
-                 965945909555241205001951299514282293004673366832735449684275818373452764483329,
-                 1261118708435591397771447849962614293602063207746692707903831977907896096509035,
-                 1808497412309017690766034097049294477611226940303574787009875527478722984930509,
-                 1693248929670071057363620321800810701381445595502351455537998090576903798006139,
-                 1135982423051448160732504738449149458607781318650853360406690729261127635184153,
-                 1600653181666076403897240403378855030443783060938244074810229503566507064534113,
-                 1098262974984876007263363326375231903155863913835828976056865179826788352559497,
-                 1755258947299064937865581870379251693941285577450161550208892344988411248170067,
-                 1595083759144202316332794703136294824645881100263722147575094391332688823018189,
-                 967968456866743384390525107386720686269866713140596787077089124999005457676189,
-                 760285789302268464524750432871087585467432953276551790309799504004110554052433,
-                 998544651395034134590492017212509968502442167784719039446582162682160714158041,
-                 1339902209586846627752942056591109815350845352168589601965479503250801172906963,
-                 1501198809305687673472117119633050877607267203477954002003165678581371447679593,
-                 1131552692480274924857337125890572203099975131392664705711359379635246068752531,
-                 747217377798455110888491736247522544851290989780146728472491659747674116882651,
-                 629086449284997340779297578189441150402606204525498459392077361233581653410881,
-                 1589312121083657390358484996710977890727768794049554359198840930220273092670491,
-                 1721840789040242250156345699739848220569912504778315577649032544246542374618585,
-                 1268160016536440515588382873247564075002878597048869139507356448082870525923957,
-                 690869478447677601623541974101942102269017679023929893808934999754838966477761,
-                 377661898297665280613129161546430468181480061196065250441498701107327022864767,
-                 746995962247361777359312159131274782101690677521117806246822436415611425477121,
-                 1586357239903710431780905923347515382718579619857358950579732968056617881240897,
-                 287479667261084264657070631816286567933288722986486794123076798471156888160997,
-                 1248247936724397286603570822593752975333547428751565470057280096984363555044185,
-                 1117455729352076791749182949438164857906598136662924393023842330630738038935689,
-                 1063127975231938918261746828905626338847477061858999736161562052758203810860665,
-                 791145934234164127227539037259356577612655137862846436127880738312087036392045,
-                 208307026192522522570981568803361797727082886840762310741722358375782849308979,
-                 1672184677296986218129354627431977650035043396853594076262529347300670347051965,
-                 840837620667249843857809228970355974515483930839630607401216735659723460216667,
-                 395684999342984918101648434132070598841393459471339872171491097152514207032545,
-                 1709189727969835748697667675484877197913326367478378529712557829613705599166715,
-                 966882657383701503355394168659648725419283282829021078978943127841914238972157,
-                 374417848864741737440117316321222028233753976245609626775019046043532931193101,
-                 371377185642601388758143099259766379959269622466431312468519582700738036509899,
-                 1823304526137525855348428297769253688759034737226464182003039065290765421932701,
-                 763117137335939626060286362152057330279684189450477214765332439869987004692341,
-                 1529636375399998392015354873796642390327275949685390088378463675687409472626597,
-                 624360717167338104028353005706859389810917144948753273398484498751065040153415,
-                 892721851640322635958797244083379155822934139983396824711994291608702620053737,
-                 1452636604568158949528055032606771661645308680002225097387527388191622290255611,
-                 1151168910009247042796935323431309656976589126820237364419796936824407335280119,
-                 1676846888413712591278630045539725417798735122383994062047219593501805665941375,
-                 620445792116506832345366821821240079460154085124031020672366156245967667727687,
-                 353504826945633835468868133264311752447250809756261193555829521916258217675045,
-                 1819172773596922779572345436251405315807754330495983325859785757178226615007401,
-                 1354613392449279337036336756321120874891636689302497878838142401224175696864671,
-                 702580213121721482129042732926903585428874017199093591412663953932687243802267,
-                 925437095749253296038380619011036997574570193128085563826948181608416173123385,
-                 1060561880738698533168322266534606807036493433970622629320234907586766082280671,
-                 510918309699525999816611233250581603163137428663854856049605274229124858547865,
-                 1011054117243261901781993119564974691915437389065440511499597819006044719789341,
-                 1847061220716132630783243504031410802107788907320123879277122266429867489911831,
-                 1426696700617409007202509610501992054858155383926681946933781438272163352970183,
-                 411363865692167056419003560544900282304317545480251802436567113050920625390753,
-                 499850164114077970738737457313032286531611415997117534278347645559008564252511,
-                 1737884025910040041894466707136179335696789129005077981358981020336818221321229,
-                 1508897642512331567873900216469409043652649503404793543109714354548686216257215,
-                 1685056803255368508942178650171273112794960995301791581363542853134117997762841,
-                 599572732091382272261362415878793671868507092377589796646953928705550760285563,
-                 1760227240152359914819208469228496399329055937451459447772805833673800405859797,
-                 644711883658095730285265442108844197245156617799836534559132775921913196908803,
-                 1571490864593613500630347117731809675929098394717681299582684648099494650349297,
-                 172801931899004743209097020231101598381850280977806184019154085623053100959985,
-                 1286891216470004965073391841510929742407605544192453204993556877590645126311627,
-                 1373744535526216020838303580454960587165411651564340445583524837568705409863965,
-                 250710839897294938289916033618296563885960115709053108432120470432852846704577,
-                 921089429057646893122174712109424277673326158215374594823872629767629290411399,
-                 601750252434340817506788839005561805068329114498759883844113933171570545688009,
-                 137672720572005165971717637166709956345148520115063138249381007429889799024717,
-                 1552715128591242326829754199543165519294836037647820812075032119863214270982451,
-                 121815194238987147446871067802038126112834597709865169579589653945546730116577,
-                 609207613525636112040080120398183489982007751877004673180047622728523763238815,
-                 390106399750254852574383862374874900608103119918580441519945271599027284462211,
-                 1586202185114091829361295215914720236275399616750800589531658423131361819799667,
-                 1623206291710592348014877580695204006211549759290029352086832438933968878861773,
-                 276023473552595035092380318517700987077101223003958495928451580433635061407267,
-                 1474408765530537664292649119139605820049853993597379479287606371211778121311865,
-                 837396379674944157784866869289148051124372614146654000890419073949457083599111,
-                 1079987138775946241294128576130712124426031906777010633720751286978939557880827,
-                 958431349622037884883840044301117786735674949026106753129508676011520268158109,
-                 452096091815742043648576635609546341468411719915504513845565405156817098251769,
-                 844994543402475762838479174709408301065019437341656716831777886553207644583959,
-                 1430186630936235900925274775774916515157739816324602967064424793253501350735075,
-                 911102601118777546800778991400840248976021498935770678371487629605706511608861,
-                 1162882979877809088548487370287629570857448167975181436336693972529346160284247,
-                 1306080161863299347684137203942881911546449838878558374996946913003969406613169,
-                 1102137466273759441781135456872960241943260752716057314227580857146850695247767,
-                 188449145949053014957999745523615438887765713623592549178274541474861704065873,
-                 193133911011962180493821894786899616206197357526064320175855994811352972394517,
-                 675529706864975992347401261690360437823988014095144202180995550563823044192817,
-                 97211337044890684676767607737234744573416046757272517751995916968260892637051,
-                 1524227127878758929602235349041219401321564432916599445773334798802312319252403,
-                 202302834803516815265574866060078775209998962100207111059466599074333575228063,
-                 890088797365597611745466660630237489501809314696609880866970899720571253344329,
-                 825022093473777260722328835246862272004298872276530775309697088401598505268133,
-                 1164496701810879835634111735831654506876606192287749690555074247332144328596241,
-                 663600660515627567878776123901770771191601246478933761475951658862090023491915,
-                 352965212879850040879534265990326514144382425245417879110514462731692295607421,
-                 506529030564048404358250331227061917088502735181561579512688416348244243599001,
-                 57348578053421826059325918803032181106644535859699399920513985697562870976535,
-                 27266528960208654238374500871430573096257711823657478181970747454609019424373,
-                 907980857457689473760383106777025682182486535004558426158004260895924781789027,
-                 443717688642457739448999055204268198457101814304854035611386170190620402321899,
-                 832264287390564093811922011644018007272832806654450322770990983097936650583047,
-                 1536308042008443405449557566604374148674824462994874673265925758574406249214387,
-                 652869413418863835931154983283389080539660629027064913616971555988451381776499,
-                 1313350916455473954657829842781888270151718851519917936142297057985222941221471,
-                 868284035416727387417065605040433774953306794529390007065234334481218655930823,
-                 682525847148481537660379451040028572359682568635477631668633832388827071711979,
-                 1122831827522188277423970298702609228773412742440313371617311479003158994954503,
-                 1229598583257797763377466165804900467377960001360334291753357191655121559544005,
-                 1018119383209217871767091045746062458817854309793054486378856687291563878928571,
-                 916520586077312590304109048136621706946905722495764000981925511680041498139151,
-                 1040597208050648872065691086126068072270016036573912071251926511302810724978049,
-                 1096227325370751037735041297201719850598466188849831500779338993912247805665149,
-                 655391491262292314194951378202021103585265788441227380176051752214091778751191,
-                 859573770331493333476283311101479901411073525370033068550243280814612776741101,
-                 1358123320555784473854484313329443571932513831018151231662363927503850207712623,
-                 1451666231614396292661662228964773049376127826128839845818716494852907989383075,
-                 1615194909172285744146299854611114807862524028896932611158287239371232358672889,
-                 66629868853310217669231036961925215310191502518457198053385116496737809268989,
-                 1539849950323807006827671583893453137437914219366439042005922525991012564834955,
-                 66263975833355514183818054012140363151116549809919791442308811349238391936189,
-                 59310553131727555325552243976010182466123558470419547287404026362217932988859,
-                 2082575629594436853622684045500987732793812148566266959298467152506151793923,
-                 309721597288646500154326124358729641557730701925828891006991624049238294428939,
-                 959798433729889539124217850683228092987002801087505250723811952362241074528583,
-                 1732807096744067049805120018133396019271239665041966659652916246031955629980337,
-                 1501567847380119571170742605652151296279468445961167263599648657397866402231491,
-                 1528755555987373514488981114845984218366280436815214921245112554880206892136223,
-                 1123412707346087775932445486469203100349957299175711802142001792486525758223825,
-                 1158452757612883562955337286271609800457198334255126091926956418704188437370335,
-                 1457908642172828892062701556080149722460350364256641452002046371538295477361181,
-                 875428134518074932700904880250230080564387735528665662106695889712833207702541,
-                 1220784918803178095665011592016529416877325040046508158199034103118692562178693,
-                 321274457932019909594251534178107168246533643955557802161927744712648495050905,
-                 1717632250168340994884292960816258588669819938227859698573824359949755280852921,
-                 1141110173302049178365767462673652773210488868922056789737483527944783162429523,
-                 1727951643649126572171482284077592386518880025181960460736107966712488183643217,
-                 408284904142128588096212208955130124252659905378374159752418989015192065521069,
-                 1541988619878613284042639400536897450021776612723824410332225854170996491753195,
-                 1303451448884680425309588554968140478197754889211847953502048744953880206219509,
-                 1563857584618209567895389442612121476194922984110476698681874972843529301523939,
-                 1042296514184813319771458110168813201704720920390433039112134302394878204969053,
-                 844044102838996687467352923809747425729950887661960602078157133129534066468507,
-                 276563676761349212076283813441389351672940079576790263608119317205885046172783,
-                 595510142276849938089635762675987823984134308646888823013676785485033370873969,
-                 980752022601323533950410840852613570872827623800678905978141638272959382646225,
-                 240356357275864797906777234693850103648502878587553253796460225726103362911735,
-                 1655002026651861235406521203503575608437545165747070328504665275319605556046895,
-                 1312440792789031521610905417870123098320505863896278539729120770671193124730331,
-                 972954086588479131220236981900700220049187879516773327141170658569214101235075,
-                 709298315163431644996819057102594484151601796092013230941472404423824468373523,
-                 904064003941866631718712084054781819310205252294418814881586189843841057347103,
-                 955510077819791718004947184926123177617963748293800434957316148653144723780351,
-                 1422899692594770351345123522243690463469625732119651146392002336140885638604369,
-                 675349255507872167043690487628565958423928000755646350641564153375169863790429,
-                 875725227911288711560771588879666525043634394229132086422550126408291730472619,
-                 294450076165119897926589360179075297604952447194866203232368372004317944808567,
-                 259342343742524228811458155238453198700663253624311182033371010475745771287705,
-                 813162098259753159238687723464195245962086947089811526813496627012687574144651,
-                 106345735679734810886236222011927027249740184792716961092607370516829727034525,
-                 889538850139230418899562049500764928553993934285216614118065275881251032395133,
-                 1005220430982321490370387358884234492276409989466488920991338759940192880147773,
-                 529697814732257713201076812943845055940072992612501944252331260590402775631789,
-                 543048262003004432509609937905855732141711082278563151059407956079732367946377,
-                 708956334688616652484218417627988921917994553062895738483893530406128327931737,
-                 1424974990993863468368577584998855431892404220245554753228053323458178624940501,
-                 440053646477877558585992216750179918786632469669276263358758923765697732076229,
-                 304255261265366363534023355220780950712136671929377327695624056696284307677585,
-                 1086614346258566824180552648502657614570180258052977836189934901846257374066733,
-                 366834574325308263440137670743479116501878179778768075833395961735216080029839,
-                 1602364328846114139312038760366863586038153191230498870722383354071484042169653,
-                 245448970439155447550606369040091200335363504452240223250406838559251316699639,
-                 811408530354935584765001482505698988649024945395369579731895944237649736886793,
-                 692214244665249268471705146677370759271402809822725991348647365266660411372617,
-                 1501631364381205221757341002002197375217816488397183985967664855955139792294903,
-                 909042928853694421770530661223220805363833520112703740613094221066806963818029,
-                 600667761160923368451077141651923470092018311651024251828961157902003890813503,
-                 1584304983316667925327385837910385456003220433981869239537011141896546800401295,
-                 1114886493536464675692903223952224903847771026283473317546615670726635378673035,
-                 552742168332504622130271443839356446340901898994485754358929023193550548332899,
-                 1815348642702987251882056390963427604958343868259276378479085085635868938322073,
-                 98228550155997930293066852945650026219798469366950158403237822508167860120893,
-                 1704303253707248342401318165552886611061166169629069586707273614418772873768707,
-                 1136276094422895297205927787469875595931992700481466448440943681565778519721307,
-                 1434288215211200313953094726474695310745275202994794470657052927192587148996581,
-                 1403629767307586500856797767922389273637454526394662935299760956315998740245287,
-                 229378146349601897336846863877010224206299823462588459914555580194431993994261,
-                 857918514080929984962034991229894541586839723834904332304043180055771533805961,
-                 811594940623687082808931742089346557129767167253622357702475248503008314994067,
-                 1146986397811019727036323186313049700010816495199042947322353234122350487179741,
-                 895688955835485237929035362006501497669816315842835294607152325104284358948865,
-                 352627642914358709834029828911502386352232103379037724964889530353023223540047,
-                 1295745771262676549064475719771576433256076939447994563519650651538324099456909,
-                 853600445866744700536726358623539235795602367727844820570218744669919109126733,
-                 1799600689937131125900736444436302616598368145257311502539960353801607086372691,
-                 505625292913956949940207991863690890001501838019059559342873474414506259559265,
-                 295785853053831249330619853328022765213589440916191416268710947915570179237363,
-                 1447983143445752267327012476967033269438346845534145305094970262737371851241077,
-                 874501688604167508060692515580901774705454040474084068563071385274760672052473,
-                 1127290110001920559041718208273620237617107566001586139585758769203428792083525,
-                 416263253649955308097732846503260957879578149116916273807069219603370731296593,
-                 771210034221551965741141313662779269391201200730269721729874922011954794328369,
-                 404056384186364782767300718192645481778801926922004786851812518069621447235871,
-                 822977697151574835844927857146345871529278285250057798024254005562010373166731,
-                 59766543859047621694980446068916378400026993514340465532788679245782875082629,
-                 71482543021522881746360461817873037341415414322905709204679116319830011731667,
-                 382109247496535002230159855376409156613695225220750714043803950872197373485027,
-                 970559908348578108925527375378096011486368288530169452870059809619635702674599,
-                 452581638416744366323987324078459819625813475930894065556469784355647179606307,
-                 868440555370476105811252619443131230347631272442368012008853223240704300738631,
-                 753264486086931651926622124023805076304949340597536942710364050762384456729079,
-                 640674842050710175323932708527007089510461105690779934571610259427044329714347,
-                 144240289287833270091514320095257650042346552018692405621970306670448854071691,
-                 381467514184337952622425349102264439033162375137525763136130021198203946882943,
-                 741111415473956332254705553018547216272165710198077375815247291261971649743959,
-                 1397532061195078488399861186263691796390186828964393434509730711945598420301991,
-                 920078595942643991634536038192387085761852467667772459239765973205816145796769,
-                 1808662069180984289898288004665991241939531536077587021912080638499343414113313,
-                 936744013693374816834521974987848538679768972715121330406354917185743347152019,
-                 354989148753782621765326177989205998249178395950401078434472740411941370706985,
-                 1096765882069214881681842845905258743174159349730804701624976254602452372518015,
-                 1620448096252331569369715119829267560048555901397729017271113015749001000834007,
-                 246848560352097890358749356225685535762345982524184306961930579412353954764167,
-                 554437186398360503720596247550767334221601264385940059552312927571217492281949,
-                 1513467465207432135772027927078650502449810186771070011215949008305417385126343,
-                 231526397702288745384796162482711637229855549747094105516115259533465808112663,
-                 636384022419952687446712404593918340732035112835940253916936838025394090551021,
-                 1479434559984478896009464595788931353497109126323499830169395421346653094407529,
-                 1786144119854791065492591819045022454268220716156879550227762332795163252353659,
-                 1286581302585689936235833325551819040493836563835215415417039348722912433341859,
-                 990437139497941828814185451480604230630062071385730698471587605010683659612519,
-                 3016625761706961863597664798722544673301516966413350318775783621934500626327,
-                 1807419704773109886897258109335631183787010440504467606782267403449314291174679,
-                 623890611843416273074671183829771469833096431744019641946183719433349447885525,
-                 620955502986072053597647177074613470891005764884951636897713189216262422407429,
-                 1444679733971171253006981011849651272601976916488972340880890028098530168054619,
-                 961587933138898133553030754762891402265569559357654268359385492879475816130133,
-                 1842256605913846288332722529859484434339556319117799618210520308777061328203631,
-                 44771027851884219568068951828529519063000760934059001302223082600017614887245,
-                 551701989990279316885162143999163730719731718731981265255246084872676934548527,
-                 624767258030270550526777188859855092563302247168489248295188603742721622290511,
-                 235715219272934683161673814996588546548857414654851222748061907437735874789825,
-                 1481824025977345112731706764677886295104510627302516203547407902490634903613885,
-                 1192902868947329959769885954533493236764524193265020704797490189973567831963033,
-                 347430708805417208377534412222879752526761551772781375055378422521499603743025,
-                 1813305400455501300869699441455283839002442413833762080692860570717732599480551,
-                 1668826854670228440496437682724129917725302790779160746606461930461541708859537,
-                 1573890184479794321281717025104891851861684745411169470048191867927815814128737,
-                 1392510627344436745829765100288624838398168707869632520400570504523445423137061,
-                 669307215140576227718247074102991037955316015938038213637912957007279241145749,
-                 1352748119202580041431234768770409527124079140391734513697212793429602481654293,
-                 1677321691179096627001037015163239390122851403284704957950548841940058740964445,
-                 1357301165002314597616914170875978048013954470008920998941693563812090950234525,
-                 72005360548035981476969529848902307399972199212308068103835866221636636146745,
-                 1658944291893580340849527785082465866665415841009774026799864045403802962161191,
-                 1426669534431256022758997872093802062488538953963264150846452088738278252449093,
-                 198410380367897314819947122627294639070474600385850274413397978341467050301267,
-                 1008174535703183155771624482472137939172470116211019516250530973855026670277823,
-                 1789858758621234071120763883558445907642707895001353998405913126085399711481975,
-                 518844720325274752590917919736058011869984099252799478897147177953750087911403,
-                 497285905392238163927456495395677480904135703017020080163471254225011336277665,
-                 720733793820678783206829953881959412535119194070788096242697073613001398975229,
-                 393247540956520851788657207789910778546799803432342327094703529246246707423035,
-                 246045817261684834739714717040596564607081734322400977022831665774182979814453,
-                 788666240399528518748098240597514669412393809883497131794091604503863419044945,
-                 737413619721111039995189865521728110079987060502877191814444259693911226954291,
-                 1239522812190882109256549691377289600452580057007257508500803917934144222651987,
-                 1751817570779493708802268310792899976795178464627330266797012343902740412706983,
-                 649676247298006426218007506381103354634134079934332295452945901079920700459271,
-                 203516710102759119852566064987245307237911176393449571446381632495854372355297,
-                 1408597981606578561826664884531675338870843310945779633359424940893420109545597,
-                 439157683278570221861011117270295217686237574553777568868382895890704736896821,
-                 1506694228690435926341535854546112314278007076085096759175311137430433677187861,
-                 1323262990398189596316199146263467993952493073899269645064591792225519781506859,
-                 1093005519335018723079951097349919762266256179715651932761229358553860206594377,
-                 1143880032038453501157573400666094496485224881081941149603086484335388430643553,
-                 1641498393193178459293021783371860312316326106714341604499923008176887098901989,
-                 177651104138957845567509415737693048440220280058622184795736572407697156822911,
-                 823878668406878918153919514590106958777731004929994656255097134567798831724987,
-                 775660517251081385314125652900584627771732810647093003974056589104598415951243,
-                 789310583776701896872413814797183922940885878243317034042734135104055436872379,
-                 94210570073927449645695913143262505307682625327046367836786544756592690033769,
-                 368939994580814815252441784062664289551331618222717539453114890767571865638319,
-                 1319237935784080916883621851387228871041732191713174288040563593072754372854815,
-                 103907065583672977934265753507598898657377394190906440934291241697225183935055,
-                 807487166735159509850435982763044599517334318491721708770950473448639388135889,
-                 925612881608167676510843269015027713609856625808632617852935607713504420691543,
-                 1580649820089354907297729913999602140628430986071744256026324378502171719160939,
-                 1341807105672675550097871046072549240728252526312108641510509324242303074307915,
-                 1256116263079611520477291212843371311146361420446165399450350078184843226785559,
-                 413201934489806251710319103877977156589535893767672853710709735102557754874001,
-                 966634448285541320169287870455489049035204818674874915260859191837396831579635,
-                 664034864627830118508947468994359246423377820088247017244177136796065444566687,
-                 1760327735766348227345214531379577142630539321620400366069150114013625451169963,
-                 827253090378140490433258387402682217116486399305691249527649006320882161164409,
-                 1503056500701255810155977176316867337281982724408421857342800533028212968194469,
-                 1423381715547030362095432442750289258793552240668058044452465930333163635742535,
-                 1703770247624402533867432147524757668084667866429564079243608086156276192432863,
-                 892688405045075800994567523241534026815425486687000922122053759598324606188519,
-                 576748478078371807678965279172486728111043365630051033335026659360095554563925,
-                 1546387567582399831636952047763851629888690138488807802081054673488351766246737,
-                 892593190560211258676320502615055918525625595901928082021121562243756083385473,
-                 629264613634464182670580166266657467585562594402817320397620516474085415973761,
-                 1192455570394780031707549988625765551721052898871570360757904579675026204147829,
-                 1353499207039899374984063534584807688096235724057486049317600121549100470182163,
-                 804854911331522234776046067659067778644422702933486104495539396893668593646373,
-                 445944841415704201864607731816032341166900887908504587855473714055504067833947,
-                 860673689495828981205612912373387681155302889091321346714810091209623375736159,
-                 770909956025698345849792169945927008114961764153248678985453469884253045454837,
-                 988396429762990058331166166027254883537115136465243065403528094338045005750105,
-                 261151875275809964359362105757016011942130002394238945154361090638521056384467,
-                 593147579030090168758300427526721508537351798557560874864263837325455008924951,
-                 1744359024923065496884439208624983892018743529172265779902186442913959888047625,
-                 778658898431353917498917297687753432557945928033556844000824249942551123494093,
-                 1229051323687334936563760785072838452307979017647540569875531981363613264703221,
-                 1595315126621010002670267283815880258604779915688206755790490114724263075498211,
-                 1510163343964885792724737514518554673550042147279393804942021241644136030597237,
-                 1516777421897325300600769647365659836504500768841057602318457733294596596019837,
-                 1033072970589785063292437825861523959418069959646677143393970802051283840815927,
-                 1634415995399190394855484335821894849376927113397498637764722060701900719171211,
-                 1128717823841666451232162801889195104339087817960401177911153595389156657979951,
-                 542254039155211039914282949569565054129469309896944204170537698210324849119091,
-                 1082895550654916586747045684780520002018853310739486394438550846003514600954089,
-                 406666149516624221413602296133616767382882541324969344622466035334614683172103,
-                 1760259718415995706923930196350898331536660805141316688013834162308693945800637,
-                 1314827825560029119959635936931979086694122530069637774695789761555187593976799,
-                 316031150312031541937980532592020734684842877926964785005866966263633739790015,
-                 194689589268766629821990834952846969850990187434363813138035478481342329153817,
-                 1033368002875364517331274003583798860406586310530474509725263524575115536553471,
-                 203575957519012346577419697033003333327736727711546352748738035592096417291333,
-                 1467258661084908853876942009233552966169429504321386638498562060554686196831823,
-                 1450060407571612889330898202352933624765613262407525640795217454148790678785841,
-                 315839225216567000947071052502411621849866268822439306987029019892513348590991,
-                 1169650750650454871448344823106460965006798570096845910424247934908087611892669,
-                 145858726639114213584038408075749186439482204521717737430767403728691201880259,
-                 1505158540425269382291900869132627992762927557908471389245404421375546052667011,
-                 819026893464617338532766169147602748705503921658860467394259761103312260643473,
-                 576572994428352951231756175569008296142428984142729883222961449891385263490261,
-                 739846090790296937576096434959792836611609154787831193482463027322967147789599,
-                 1286557274095170680732444660591422707719254428636577354722551149736336338655985,
-                 918906723938330705031133313397114406157158912324401087277515100675266075749399,
-                 232498002946496348925290244406800172382453363835608752850795966530818500214263,
-                 470913276465809376892298576356374740933703812214700155239608327345723336161781,
-                 344420764170364116229422064310502924637288151833918428101785346762811009740791,
-                 508423792533178459725672982532814115106328046503626763984136599352737722873281,
-                 844356909247809063737582540232087045500068004140299479508064256472078859041775,
-                 1007222862666889796014532294817795972889802082592570900696442352646155753942369,
-                 513223376510823126412991226448687740727652036344603342349038333015617858300447,
-                 1103688729730925858296692991440423009112821878302437594538204376094956671141997,
-                 1032113589114370796586479194393198855295257187532206849721148840371353161687651,
-                 975297234994031886192642019573201521515662606980173071594184973593482972459849,
-                 1673694575089262569637593167387312989118488152840848354109879522763529692857535,
-                 1556313714028905236838826614052667922145171012650364580208740306978875578470225,
-                 423051098361700034149664663161418551438014895683000306263274020033718257145773,
-                 412430414705116396633588456390871689734839891464957827568301128563776113730403,
-                 1357379765349749951194750926647600616561899420914018427600537165682814360915233,
-                 593889749564943587992675461392162230401725957601350910624661512134386459847795,
-                 373050478393300626276471301748029727316977862557588563701356424536007867632933,
-                 146949129234133173638568274813837822919901582688900667085274309847624028549663,
-                 1205388834721981488770728357854059034249330375813975253586523104941783851062801,
-                 673123197109707405562071138050486570682438515220762190202162819449979693616387,
-                 1347841793625240583738271221411929548304119168011308451053378962345438016393465,
-                 164989342485258635302093975114749088070886929374507949566466761624397974785775,
-                 547947888826663895411677523296419639000966895007933932454463385938389544831837,
-                 1043227486400040225263881925003034228387858869410703363853123567197447605823539,
-                 956427977816482224522121078335172270382931569433644551318330589778332030397059,
-                 636543112255707119918015589701204329135330510654839423654574093950782638309267,
-                 1623700649905888873991752154619240610358423769111635602239048776830362437064771,
-                 405222321125078838953987402906827476848007897726819292566946709654546463050955,
-                 618096734067305072982198296136637662268600691428002691247857231939256902783151,
-                 1142545942012339784481390158877154390388967007899114221961086263243127987564455,
-                 1811755127491858067128549476139973579469659231170297069190503966894546076339701,
-                 841045876526097020872364167440650764843712034404911737767069164605438999609621,
-                 40974483389575018134791964060577921321381496806543718804501220864405313833949,
-                 1710336584996688898542981174729881084920161554076898978690425453944413558412575,
-                 159302299871220180582805834731907615221114085536637937071204804732042771305367,
-                 703632530146123562945531004498108862104018212749628933756811902312303842194839,
-                 1755011721761648051019355955528360364042517612161149518612099019213552104759015,
-                 234798947128316079797333386533407849564474476676785011780884835080399865053367,
-                 128227937677074962868700073091887924924492388877011640117083821594269168056001,
-                 1818868760306371581616329143922531419129726498206394617562749352073453012787917,
-                 243319799690774518957466485790065291190965596108458518278878544837976802660309,
-                 1554165241984313100234289776900902052060327292592398845879629676907559298799033,
-                 557325967737196708733628758380061993285949491834389366937811101365347013262847,
-                 1841409755002215034950619150843557616717101119910223157290130787275330827443687,
-                 1004396596127270863728757459061846032387252633749706300212523394569457714102627,
-                 703881306184145096225469836748190833645466365430808130893207371109168109575015,
-                 1384508467342166273891912215102136252794183114996849116721717891199677381364511,
-                 498000635987737975225737208420894033017395449010341690848542384674741243578101,
-                 717549860542228552352318624005694728534538115483008021615352710352015442920273,
-                 1313180445057479111301173016871284343657097111236652114814321425792233324659361,
-                 878145819834912274661147709792587584829072864613921481637486266065720461796353,
-                 1602888915274245399905342439372890783650873463933026574088888750415633896183675,
-                 1070610338575272837857022707148814285808574117855887262082840194870087942525069,
-                 1844548803222292181393984766858947433457214125866906757682228535566664678815659,
-                 507619077047217275259775471040422677302321335542612902202705855159609017189663,
-                 1067907689794638882524804342456398807861269747415662077992606617488188064213127,
-                 1366727140562992134916461464590146271119410884229004998207514181864060884062545,
-                 159405645738260111665464621997610740633169737732783373702815291069279538642563,
-                 1467730167893322050771966671983985511789568888612092536910821394545239717431053,
-                 242255890553710824122948916918323522311656356986376915019015965566152435682585,
-                 1457533836880389858152929562767376901526179065601327110222140392938114157849617,
-                 79010440714608857683390075348440510470636228914643918777236993002955632734819,
-                 1266540039292159917161828534997942544194536123835416612902264824723229707858583,
-                 1531224052728134103004432437665861614576983019642824211235872586023270060985015,
-                 920825760382034436949099652332619955818061523142408868611652957779168527835879,
-                 1025547385328805462004123818394425519908214638753351135042425805775823619983479,
-                 1729773475384636865024624701385754355742961065461505397980705926393415582102041,
-                 68454787192180119016895580178086480895979471470176541427911167208604644131597,
-                 1165815263243413055172841281727658205716532417767819571845491575698902639616755,
-                 879490806373320268722341528998505550399304542651295136572503018344970140085057,
-                 338602239635982475866982997730214219712610159888671301101160153690649796234725,
-                 645441656082718135362948436144447375584812936536223270688226904226437242330173,
-                 1756420335686333462457360371632138365825766831982313799600610208978750903496651,
-                 1325449907661473286625212233357220275920918204339922999909207295274760268617635,
-                 194585204726204554362687100010170735521890565456444194102852648446252201906763,
-                 928640501236919231417468980860448384688166107750684334820985387114477107963585,
-                 31945124272918694968973678279135949628336324382687917394472650269730023639515,
-                 541436907076341014998150128496554704906990178639038916549712080269717867871957,
-                 1755705267772968688196744438132328807230142063071549184233843042786026332445279,
-                 1639881078409708302176140072306672566489816421216315121487609482624408994742675,
-                 887851980075718138083861378378938700127823071467910380049596389862309566484953,
-                 788338602896859083334597476476351645748274208319780518455233949966398570844561,
-                 1297082300616160049785748844283079012281016350717611063028953001405162593551171,
-                 1624099416888502945042711375185905083290522238974701362662729141791820221280371,
-                 655729999679243064832351754794977905442381742271641890256490534390615872633073,
-                 1375930859542755076608014516832550071844061123284238780020943700632561173467619,
-                 686188613784289438393665047731723672177257023276665175630103138392883192619091,
-                 743822245703366489657179542043145016450206003860987329016874154757120225532117,
-                 580954406838800415037462941027870542022080625527267272894525868775168661939173,
-                 1614223843029362258602280261581242576425205465678486673100427698350315927658307,
-                 1382261846270503039458436874632921238441804779337531100897517430447085449911963,
-                 734477443923719562801885762946708996100716864983546961247040466182294643880403,
-                 939191453781513366300613999391275523748616045293273284301771440940826201359265,
-                 858795086448021742630093162519591879760733186592590454683136616493389601744435,
-                 753447290537007079136252185378025908553212986712489412982742165315403057834945,
-                 65361855780728758055574029145638391540996143077260440404915534501134036105197,
-                 1305168398435046466738998170464751837972979976668786944889638563260853547633931,
-                 548444391662614745134520718710580191964962678041529120814780483298895255396599,
-                 1192520406835259838300538096866677515775170450023584338470026432057728700193681,
-                 684887841281686760455128386374611459575719258565823314669304402727195418443161,
-                 679144602677640479470396656265734829063073609564903598527410763047508731826489,
-                 833520889407041000716016889483945669679984791032159078571924594923636681574593,
-                 293705217013450021808396394233151335946782413536765842352464148166552684017319,
-                 828715761140380388248875616127940427683613070816920354708948819130855201597479,
-                 132902292826711202021163118278259975366437217138426457921951949372250574426595,
-                 187266983413340192002575046184303956080446449479182355910661477753684264762073,
-                 1697817822644361991022451010424486680090303044127033465922013077442192017329419,
-                 1503359313672754414789969146265837297017810642271049336092598856507722555162601,
-                 661918381538366003948214670313830796983278820700531060005136478674259256592889,
-                 846565758256719985086166666159371376911853449780203898349179116503346570777371,
-                 1835106224666684970771677316202995885824372611876173848855603046135452722987635,
-                 717571440422710403040909873941013501805529559943358843479754613939443810371865,
-                 1410422950824674720553834058751729926729994937226807868398550974715234786112391,
-                 1259694015576666128865565626495073744285539358812549289794407547720966753407509,
-                 1118924001796281644415056610341494223606975475231747919928446342148621419773395,
-                 1355624395621302829894068869345311362624784343456002628353637319749574712163649,
-                 425985282185765894388815611076857665222856826103137729498440863690226681364897,
-                 1061188868558129481119417852136505567461554929726446360805070915305902284820487,
-                 32612842456403501519603956369557815606015536073185968084971080760132617077811,
-                 1807570632621798119627648064580593304621345503186586973541438144126374558705427,
-                 1419725753978760345461240209905895708996080852230530286341426664082719097950219,
-                 1147541298785091697672566542760143508306642567518914978729000954239437391029623,
-                 1447939247702406932128313918381141215360948442644603098355405220546726162536765,
-                 277796914039785523707764252429179090064438853767516274140553690256875179714797,
-                 1410281202272290251416402523320279899850605282451325177853207355670903329037305,
-                 1720717930662689931251579079307743187437038964924070104339748318635062641732633,
-                 1016693390333084820720685131588041095942810651569768114835667639576756541717847,
-                 1383545604844115562857781383611726972196244830178311181018418188591932595324835,
-                 1376906465498849924060559557150866512204387758110396897537708454580800240471651,
-                 1293325247262756579369297847327389686514622355037260334569770797800624556084513,
-                 183554663516950647960966332695917055592330081240850059119144447898448646876479,
-                 859709469296235507443204933155568632261682461022350206672966225554489883245957,
-                 1029801601610792386244336284670187368340450104018764788566076814156960353928569,
-                 295827859007615514706600537786387117823608740582684700689999972053158848662205,
-                 527697388236491199906718562330539230136802061043768545602414479436899362059609,
-                 1010410556115874573226105688374646489544574832832604270911232371249484151693611,
-                 1432242995656747061675962250296809743928118219373072798622958329303840319993315,
-                 126471100775451633113065818172176575819391321120477055828507009408108199037565,
-                 444706827111348056955957461129905905083401206798940932169536782637039382364059,
-                 1327301675615552683168664413963551677488405479269909152990405162011788909491603,
-                 1529447499150979248706242583081032701479438910647534767354920754448165581918859,
-                 60963390561883768587227854643338021807831791874742808760049833744010209669133,
-                 1469111766900998629775826051150786315575282308958658916312749774189124043028757,
-                 291835976788767337460404564652431254116979399073612526055663102401759412211729,
-                 558595693402099291616167353479777782877990523489452204948876282448523319986917,
-                 759888549179584266665009883003856849338643999382698702826916595370988779697371,
-                 1315707859290376670762059439350808108946932497102045963605208354998723275210491,
-                 347112021782713726073491967543487198084883825506643853561098468958401867134943,
-                 554157103175053378396428909287369506567245557153057217328954617188215619612181,
-                 1119512838899283772714680340648872079499165830466303942683188543668628105904179,
-                 390874056786676157380633303480044369418267632644548190474324117988036805063317,
-                 584573515959081854063707761199136709109553408511075444982854761251305700977829,
-                 22489961161341838649414602675129002076566656855515366818146774937140548021463,
-                 195506368434562776790605927691412145092717562580939637937885779084072630832629,
-                 1039892932967814660019439462691553591853911916804936583338610635470892207747507,
-                 1017822286868785287532275016783122615908394308760785430595031021970325056186187,
-                 1321297105731909342514681034054944015172110158615348678758455402739930688743533,
-                 49109140221127856428070094069507856968553878085495834364450766945825273175435,
-                 781494451643712805003433633124825566647087449477902031998876009738938312062415,
-                 1733350385077066457599575563808538019195606072109720328185845962843927260456963,
-                 746211886066770448551273234938303910290488863056441579580646047187296708463307,
-                 1718961171174062054087284934074037250821935492457944188857764917257687702833503,
-                 1788724062583249703653178421947784691685003579270506891882279087849572914613459,
-                 1205676845627296417657062112160665088189131453714000877688839815308122462506553,
-                 677330421875781035094642009988275584606984370248807598364301535602133716619309,
-                 1038251068386779074860769661220174739813819692209818766145648497251793501528207,
-                 1710564264343123799787974919245470465835126185565757086142062161844803897132905,
-                 466475416846892659662991431731740907135844365659679376185209100667902540682087,
-                 714902828742995817782634184983533931558657022926498884952002645283869419833941,
-                 1706665127266491549741981233442362960338407804674853100099924867790490353326839,
-                 905178021480948475430911332540894832026283157088683898503014600115417166081503,
-                 431269818097899881802441775259394867319040751588298798814839828758397829521835,
-                 215680191339202333824092006022832987099888648873025069129252542095517915018907,
-                 877496801370933440983532403898075921404492490726958709941064985990692673855455,
-                 637258753816577934982651459686220381481285960811965687274432353051422190536205,
-                 118004250712431371815697198080095314676392005581485274317011511092146699682295,
-                 148556830990188757309260629792217488259277198297215812434494774830751037683643,
-                 716704030829659019364095690005311146920398281147564423510883014883296601418343,
-                 164890915969614815211057054000063054517180183652634590769050806407799974996049,
-                 1769616222498912486220836433548849560972304548654175337189966886647596974229831,
-                 707994774780982582792990705364986104064641446021270107406963371991873301298303,
-                 873195247083118739776642868929664513354652779934257186082845437057576913484053,
-                 157488292019203442883771941000448169299765429029205122853297504207636036750333,
-                 1067028087812211621302731168033362915011855673449916941171609019920174531205583,
-                 95204367389224686876226148753456565530037626735356547422357634563284519488889,
-                 594671632224839230211289711379881625155259219700136239126521327753016445493511,
-                 1499325247302684716566831183880829695414747677154135183654398175967756228604241,
-                 79965118327322173993964215273263707687717191267417660494311530329267544690053,
-                 1739277438597235152056210991151201723844183534784011942565304431320279245086751,
-                 1160097136541769795529147286169764613468739561503719575791492066595887536840415,
-                 1749449218370659494796233440529033096570158700997906348819783188753032364889873,
-                 1202081517529201400886383780492641847860892023669014817553069885094599235393391,
-                 1726153524151316682392091402580967858851283535143991499482033939289206173875501,
-                 1319343495754691883213727582037180992418486848282948803422474385492716504445221,
-                 1220382353585144116863677114373779629453247401701217599827207769808776050800227,
-                 947551805257611667394638839017392810182799642516216139186405886772318354247055,
-                 888761603474934941870126321059781889971283359358258851061205521320245034219489,
-                 636046094600113085813249847667570495748719082497758787294149716120959447818301,
-                 1362375872371196835593478202286922247146259926293746346431215591839929968734181,
-                 1573336732912406118828384276010208385052368015580675634601439777022013190908835,
-                 1039364222643144465956520931228638762937033633055360329776330180161566260822399,
-                 1444472232392169204236170281769420015972944956384528915086027388200629287639311,
-                 812183550629780830234699730365688112847898952289902910128499475512929974817933,
-                 1460847514726791633071175687057270170822176622025476616380143135775947393417283,
-                 1345588708975369849149596122779283419832598656434275266482868107512236085386897,
-                 729118434923049026200142823664597281865817762169894507370510046135515776181609,
-                 526242795570472745210146320279205347447329208764964629973670750512374715682747,
-                 629327522151723280912996795061083355143572277805324345938250840914178831315597,
-                 1495112799802995473403452120223317351599386644604266472307541282013210553981117,
-                 1774505333995392320511893206038022117893669961927693271333440540289807874301947,
-                 25692524520390104238280118987558387869462697927706317764239473939404717501397,
-                 714704234454342910127041157771542514069338525008698407479184059629597162077713,
-                 1736473510769407481945911462579015131541970753844874329045456264850179167190627,
-                 1516926066580653657649727305108817628799825469879723252959160725556211876327863,
-                 138335100565383606754446684272853445538588546981125713029976898494642429762199,
-                 335577528263086023361222084987106697186731358213242205273822343963878989992817,
-                 572810060722828418580137883026494550658920055065163739903650585713912383549437,
-                 263395105962811501224659685423950565248823201505021965834678635597708560727193,
-                 1828849623041418187098989357634815865697441569678709845835614734104878573872685,
-                 675539982089317314239865033958410787161131273557742244390266130154541179786921,
-                 1744590518098755841563905177299633991861596387051871908246458917997952871483791,
-                 726517090615302167068820224355321905704312100804104818553423435056484583385253,
-                 418409006385424646005340615273799153311290020738239330440543550671602954949837,
-                 962710482833505064029799460304088587301238957409845210997800692091845903170527,
-                 965418840704727522800319618892644015081696123693919396759699899945682520350251,
-                 1386840605002600195030801751396774838328347680727181036468390975724837108188581,
-                 82410262121897010491563722294276640666489739611654429688603888937289828167061,
-                 660696279729448962198889405219274480076423899057894970263640144468651404229245,
-                 1244908824742955916044657492097424457108156497573431467705217595848680987395305,
-                 14966719828668284744005298454681881721742732694954889145844945841696229725761,
-                 202920415436996626664618741130346707979857083552081544698308834205317894458099,
-                 703788839875517867349391770832177892870275401491371304000939376127987300826581,
-                 935013351254368119527626160368572924305294787699607546814696170369933727859675,
-                 747661789288227764443311813415659827152056456413586849544215077494154376234527,
-                 1413080387358755389175452128884931359107232072788399783554613549055784895213995,
-                 1091328082527043343856409101585561413795380339581583834359610457891021612329243,
-                 1563994800323203762073843865298658105300009020657985399860299615711946197478837,
-                 1251739987488628963338742096941826718520853464401316910143316116710090075406407,
-                 779121996260331734977892621783747637954053480643683280840690361696720169847859,
-                 200243828449812296271401916154737456193138267076768661131561211883476923646555,
-                 660736604467745876358784692262681272322041622548587079828181917477588042517377,
-                 683557834761242403968567636917761843676368069699391682886118521053893819052195,
-                 1360618338061432165033993980861080635367054550588338476844822267099454895194791,
-                 1480575478600786750863475015584177526467817323799951719471428033368735910418185,
-                 1126464681709162862487912280433680062923700004370099635224480084681926917534105,
-                 537617413682753677453166219373274289198753006952381599113725262829852871710671,
-                 1641005872309108252954342640532399148000427717549548031763513002771247305648991,
-                 476133242813894684896890094632586975557751009634179351991958210395169776526191,
-                 789651599086572053149724186211231497408720052975788920201043879277337914353565,
-                 1303999555071351432103165054655848076571129980745486940453894372716974845397459,
-                 1430027829968527784221029433242785176294150049893744920781582436903881680779355,
-                 1100478509237040474441734707738096359295326091086421181619505996109483418149159,
-                 24759903695448440711212085337244715022616817731353703055029305669179190441009,
-                 636206942196887497343762193891784511151210285360715824906142824793945179696401,
-                 1571530528151784299739431409588134956425327856494441515724255027996103345917481,
-                 402578636261910498068689644100692466644650782640028354597469197419778607241391,
-                 1200485998271387406594762914503366669816336950187504500762411824846563961555847,
-                 935763295973168606279181313915601135160311225601462980801115397677229171268677,
-                 250762861487019128256110262310022804001867461426913662966327099246430108483779,
-                 727514643373925994810350175442281549947733687214535625107527819361005109463149,
-                 1688971652674117724191983841954121097418925662428350776083620552490027837955579,
-                 1130169466290236122182904393697375161316234467120627482020724590681862906317127,
-                 1808233443873409463119738761273036864443161775761924723666400181905398614869555,
-                 892527454041248105419229089436740328557654387282266038420339866265149981816491,
-                 165175751655541144414993226444256706483439647049478252838289493768459684595633,
-                 136349005033921303929946437241351439917368367437934177125887876202649439837073,
-                 950948511841942073421730505875544202175813098046618710571778819827119697628155,
-                 127838000089081625963746307838519138216675254614355403103130574178912670428625,
-                 974473583988872234854201278098243535482104927485865551382862864493604190603771,
-                 687457831063501153644319071719748263621573440872357419546898847594835580664275,
-                 1297601910049656499111701819891359673373562915382844822520772808476972676244043,
-                 914565628954479326846389886775372406317763879313689525575735148064425778304559,
-                 948079262299029737903368600638359842552974729229666546389469958465605289738173,
-                 1298449156546925537214718684272470329588561030036406690558050084631962558476637,
-                 1835940356750190358632921968658271962092188026938926674644396941140383263582171,
-                 530125302745158406236951862512754181530777994882496129598830573925373247410757,
-                 391688650053356778150655363767308018575651203085441318521849030045379351557791,
-                 750239967279382594786929702337592926195328352116986290449854523885267985882169,
-                 731847602103138191516129840305622514280254877739034063657712196492207086597421]
-    primes512 = [
-        3230897856705284921690353084034223078528497203749407491190054434163778395990609785783029473046486500710873794711113566764682920048267378791194986103235058745,
-        3347160718933855015765948797076155244530951827992288596613457516984095309465322799517774806184450027218417367570666847852876133253193849474283309712195025625,
-        2690692354299390766260895876286530744089913534163973549098767374800380605290980825700305258656072687731908904471354762488771680829031094123674008643560520701,
-        2121077467005023982207768976512064858683392542225520261883092552524952874045346375252103096624531267994020921318135041563665635664311716716806797007271344309,
-        217229538920860611378373857008691612671888647013751076649329545099787062856595433416604931978446644831715594321765799239913353091717730156045877900512646445,
-        2261443383503305081267291899479343919310597924174575046779222843445517014455834932777511569472768384264451597690515007573398972822643718919849918478627258963,
-        1891558025076599165163634541701403475678322358580041376058993895817898836389708137363178028106839936412949999355121535466220500194103698508842389509302794071,
-        1198387472525815234489590977878792021734416648703801649280043461521756366426400017382114358188715783733617633911586262995562822868492531639362236110576870031,
-        2486661182264904517964715428819325999385190974898524932010840215828965461460202843217200756822295243396564470508750782058540697899610427897329449267879210201,
-        11055822735160840824568386151550706470387539672659363831633014010286334033621144577042970394168592051151716676839099420402689946190291814800719808971851547,
-        3360519704603682658009766390408595233632352617094654879296652682511913484388868845369990197784635293506969881189646725383390139185174402841823080605427657909,
-        267547385177736270168775749467462578584336557078909534963204513818563926666706010955199481962176678958957929042266582102793036920107096925106479421299064613,
-        847393735120313268107492096308516134148259122834340539601868915984078781792605470268349903429610417367116311298759303471038908129233134681506841216293952171,
-        3335947894912761405005796226432995422292901112382857920238153908696477391094801513964273566919341822922568700553186769162059986721973166308258724982030391391,
-        3149133938803918385307299487516285228041891961528952682827744785561284835460437420896216007675693539598436021761798791157982631936051538973135247993773789125,
-        610567223256610367335392776311325864358619909085131348039915313908829642039311943869461481582892308347038268584652577036815095702850609388533851950971880487,
-        1709817250775039766763399604603337231393722633229876568164172010309859356334223347051829307895274659782348529899602668270697576030700045507752946780635897959,
-        2982190542187918464063123812732118141544105505822927477097390845889642700827459495572366491474530210036080068155747040561579097779216746787901556423754767215,
-        1594553804487688795514071715860305170956010395906021408678063188107504947532353524569323055572826016877550917778531778322054437675699110589666520450434225207,
-        2054909685507888311910845455710281528255992685381529896172817629616991488158177270622519724160686157037418236885559268853620317747469089987802097709205683823,
-        1545720712548960208665308150523325592023547686067083984345701111014452189702544716634883411416535549359388089425171792440676974424136245227376142323910785347,
-        364238903790252765230852721390188198156297988851279311174700682103616744150607932878231718411049310020382068144453664691073993332614664078563279685739551057,
-        2652685112908793828467056857158653495705926904669136403108425541591328013596594914942626708203201426891544629971951081576416317845767728626818062486490830783,
-        2511881398291495869361324042593176365928754727888635086865509220411860831247479776457101014330666259523160365489513000869678888644131485931719904702623681005,
-        66440054037893177779855639869173419179822588278172733055358393064843440605654856842002739209426280117703335628380814538851017016021290742501791986886355291,
-        3157864729024940533394539328249699322470959022657612750845227175502554338613499292093614670017461679742470239004058745059837503623815357095256460246301880959,
-        3414010852845391934295196528317818632543171772484148895795556860748973801925605881238667728407461473405632631890520064688575782830199166327667020981266302305,
-        1958292166649962602628199040437502086301400543166899800149995603590565267906561692922662740510493428526407314004279052200762915846051930103234469752093189267,
-        3069670201819168516183460464462154420325893537234228389846740960727265299459322568675796005512121411526855042522983187498204606008567663589426020381719644653,
-        1547726690319331772089423130972942884793777424487646639756559680005195650326353806175410367489474327276315243115481659989555224926506825245107346977229484143,
-        1289835788504103966917917317490277195055825185601215039185029812590282149294555240029309840399239648331559988704020307045715924897990629156936538015683235751,
-        2299343101581360714260899400135216697315730537668822215449997567265797508570144953386181803484213722552924047856100723793906660573796964151929366068877442029,
-        3360933418806878094510710294811146852200468896628780245013673489362857328972536356684763739598355513211387198261094228499917781669151463583575663990264089523,
-        2255596668610152714601488188133607489546960872032511629545070736769140330976216128247426579798320318595988462230077520228770282670110373324418111874107299887,
-        1380814501967947194131982632170475804357764064898672772439203382086345252625279414140552956538579996540466046399901662669691389013836166358140583421500910653,
-        2054257915346157963990986759252514746612947058288127604061771104290488516305781234862754250375943883554807684844625499667364689679504235284421591257737390591,
-        2636656587423872695802347303558933777256782319656335941494267225747078124920697904160146593210723181537981734969331439388382250342905458411997893761034435017,
-        142630639822086829382111044446619734726566634220172270184591652314133358376985663606426009658945182842097746955916263498543217595018919519964869333096687889,
-        161247669065336594808306964070902970196450396534979666208585651829186128697617023820372272017137222028699807996739866545916323538307030421046908860649840795,
-        1975229406029034927533149668937679961086713580433604622752441137639119620173833490066358776679172998241768011450840745065658954675615935494449950425592720047,
-        723412739260787196219277137515221729519415400405880461118146951176748931924810169213599741216607148983868156226980879748506752728249824536201562158747890041,
-        2133301142140844865544481001066436953880550276955893146405441509273562325047890617052300040543071007660102739569134211188065361487974534286022278244944084407,
-        2899073942234080799932696293294016031567882832694706411002882235607021973385123366529064735411253935701541074247726026478612409427831844935936888896576033099,
-        2750742245664000598215590253592018625950300422573726662260437856643626759479528306474337497974328447196892426153615845201620293110366218321294831191174173467,
-        2676590464233579745965134802403541043952500102299606109831819710588298092394234726740038671708679070574379031247787934336165516444008393035743151094973994193,
-        907577348098481309840192205717308058300056956616308545074188302816849375619798751513517022092976684748737973903945193414774537608236277452172507096183552243,
-        2718402075642670246771562061215939899960314848498248687517938202070561887348474121170453555696044753250838296731424208460053646203297149300411712621519737037,
-        2381260902317436061969964967192510839041452223419334200695582023023712304195450291348044020243499922995892644672505636488256271911439047586433024454186575777,
-        2032700662858823271840421545874127387865213457728169794678287977566601763601352745690084088739799000512298487252947654738360698804367890826523679937259476561,
-        292058272537587083656596063751447547669536732650816599945528694723352682880977839867634516077134874739580374701155367313495919190990991919126604851747631787,
-        387325758796171273123571035142621093722507617191817730778766148645492830949386069472760818187253232140125231222568982903876843543634041665136931643089264679,
-        274576528706958909767956071548980217582520914560521228217040398765009967485607908667883279151030728202630981747036445283290999927258143972854111901741701821,
-        2590545799680208250009324195800204560691403789004372937012898930767218069523588760447713601570399110572562634703288919826275837545911073680332583329104701807,
-        683418466524166688434491632203668995727005269918495115643878934358234643325820298403969147992536394322055822792023371579849680982381039388071801925377443443,
-        865015386333239730878155152492934077340431803169818261820661402642677512605967760091713495444394228837035063120522605360698682771801293266734829174459235405,
-        2760572319459173171318795899843958844782447345723414953135237311291606053998132784502021501200063585726600666888607769910227830380968057761550321643583574613,
-        909004965444464110571666583859026663100177614178892228771571047356797362029089964194054934904056613695660492374470711004779822191384947311036564876592151047,
-        2538130901795449375363470913432544318533519586128129539473014986943470618210109873728518221432368504138141081808194218183282041191657406235281717293962466283,
-        610124435534015549286913759085916133813114952024226789145551334161869202383801241290497926635137030418292172235373816954701493872431806491664345825095668431,
-        223408133083119706650247095811759742078328128179529356826638121214485549004092516905750214905615857269018466034109920481130950650482781530025161031147814859,
-        2784054383981943508170695359720370879015003193576258486113052863386183773594801416693133927896969197439991438939315138802887749548318395190221838902729998811,
-        706562874626373663419895669114046520347297204639183930315729352282611066711221210294075182415901574858440133107083576056502123375651980225753805666100677017,
-        706346193512210948078886968326665209341059931430439675940743230599722091214299839438900123732996391160736825479312711409348826914800360409082284820814926911,
-        1739620724223054968500499621943962569773426618067910164705417631838885615023670760488381422439191759067338726274270017565797983262698952964268852457391334341,
-        844026824045909261926866928219221859551447471005234066487006161349837348056049645628198653060795163299016549800484490954636060380644116775013333238298072191,
-        2167837493140099702009252585317231659214094474706634031401712075869753211128979240478571021950402914193620058783754623590601842531152167144143060220107940671,
-        141665353290166995800346572957451001475968974141868448388190325911382082449960870094982604957942316065299222301845111419476260083003590185600235300635893487,
-        2921968865049686958747203299693594929155356216447098535391278215798231451907335931719186128542611310477286547929383651814813605163505645079121179812315020623,
-        694064476833134806363416979866172518376468012810235109120927344219962298331092412392615932502360125130037176976400219153325572397079130763533085280229648227,
-        1589234563571828763385241058208605093114221353153585265687118770992801313555628709352421452806133197090560908473934327487548671112331337165399342502309781753,
-        1913778702999634686373180824925829863197468816427759420708619239065126491921859129796380963936283873988770771758624221546225332321882234536241926608847544675,
-        1727014583648868937336016390516023959791883657155223079504982285244574555126845283042935190224857395550594205601528972218970025326340664654192448601617214401,
-        3002804089218964072151022487385887282264092652060273296424154296974115553545902529748535549141631868640709523874929059815619950080372816637056418551809160313,
-        243079588914143571513881321556961648464322757156368128835809793163452671479562440939699779167461652626997308460116985269682865456541591968824955633595986831,
-        2961686043409406029945971699705908664054862228867477105139108257563156019759888604445268593691762441576421063866648984042397645674448388274502864387247642519,
-        24179964182199924865532844658899840903020230082319038911205578655315137756509601817391780613372519800701861968249887405282332563989172644926729379640600153,
-        569764955586056261167076259428377601010290601639154014335491196249500197063773458460390234702344134379148879934036238108150311075049878291087411555331555425,
-        3214115210810198747407081171043055291371274189776350587847439961895821018952753620024542682676053502125606862941724265645942171538201127896303395314860435377,
-        1967653050197717619239905470144392424744922635694476258640470371495895362196634017541392113525366623331862367994019023816809743115617696313859384274919887721,
-        628103144333317008209913221629360057299719738462343645223433813673753688142326184883959392965979593874433137629923256775309158617947101312897282266587582559,
-        71087782946399727503861431135455544710809014126033199706442712132882788861022285409850932434109294358456044837422996151935719004586084284938046160829769445,
-        2090833294623575050103189683989799036393223809008498913148171806482087968781101043070314555643831790961073054289350910832645470441687235619964917570719153643,
-        2766815927180125902214096536773636414136972747866068887697200018660392488660548925788541433024633544113012710458986250155902794376204935432059644642722396419,
-        1268120963860624070239047844352303171144300240746345312226532818248496922127745831577574290930102349027173040863938574663976851338070762537170685406830995353,
-        2124945794783350843085874180860031697461110180992368417801274104450405318935910801793996081537657742786220139206875944252518125284252813138719203815544423981,
-        897297179727179587644080918679256309897094458177353003310301193755898433102722292138769437905491786877876977533998761542727080056796968031262010740490683989,
-        2030851158921380753625979666196858891943083973484821509370641430511509876002098206135371496755800986026021529784017267612804897030760619931986703463402297701,
-        431513304926211049426570627798781552636331386721057361834859310666573344895330645835946157502304105506772754820103924927724186147773600793033612730125666291,
-        1643727091166398547939966978146373750414782177623612644869504140903118049240211297356308186052507930017194001457473831328995390734977901670941506934337098433,
-        890957300315561103330582956089758240252306900408679163339451472058351284820008151911748100657252817230179464399291154576370385927019707832225034275312004253,
-        2345484129555927113492520498370232430231856608813311063791738123381775491808496197381489772631992520612579922494716535429336068707556581599285534761488487485,
-        376569618080195960617249992147999832394105422925533042887116194816542455241400038318824757170974303913402166021536536275241698599808931733794096561421175127,
-        1899000856716895717283494189795816685865724593140693365515035530132327622837670761938705262976771843226568543395536331264085676852034304777436033012549415023,
-        592960371162611638308322835364280853267451691276312393011580506249025933644330403645828439529391454121971503232739747004342977372214408340919569093717893135,
-        3037375545991979480534442377858455095926926605135283062282522157153777464153918667349925332529145410740059875119301612948542507696753546837463037599728611153,
-        862302902415885260696786854721869351678247074708345304537865678094675842986428299744880990139851925480462818230728949006573175361525646146498460844346790897,
-        495670919719241121236888610531349089158992880255877088532155944745539972492915065182486050252715769893564997722419370631899067658304519479402961989481938151,
-        792717827996891585011194813288044093019694375099163583259865046000925583488310620825960971845732380409784230985786882810435068619468064467264797069397918817,
-        2656466611508960768383358055192074885775010795042205726936598220094021173188918417213654571743529373711639916425274073587896401894730402944051205074980411079,
-        2400884538048187625012075706786930112690817728607507282472166779790752873601052373067691011884563947146072428904214601746240232014092917705484622062891960855,
-        2239998161967796070355170721068306181238557004526920567553422477765869761015688943208437845414402459355747096278912304673388474110557415075167396959335690585,
-        840918004451225534412035752419142412192017619358053985412884379327485889795183518858654040567479147638423326554891134438255516445454677635522651494241201457,
-        679610866048814267582839375375897069094296133695099034717790576286197177930056701678403432329625428513037448230908181043066822464721317199601822832783865101,
-        3398929761175833980163961022857947269122992423014765210840320393118876582869993172486914249522808828741003067275401898805156868383929694112479813855654852673,
-        1228656904566766888913277047704229638699115444392077898986816980704417879704494563191955470417902211206009852031653740099782419676126324804418059129936061213,
-        194196646719071555814179814382047773230893799347818955191564017741779780039351789291148031617913362060034851662099790100348377986487769065346515139614952869,
-        3284818789663655270074425932995630229627120861053672465205115130153170679342206245111357800322671561462744158213300507099553864760398399900909046430114600305,
-        1528093835727260617782984424159240469511314095212587907983692291400815359030135737954455482503340073385262203191744980121028827136236622659195392184475742369,
-        2813877669789950405898147032395621776455892593532815998276390155976769859514829566817787920943343349928401292331307015509039978647799989223036515526985993135,
-        2141838526160148766775338881863927012072403613547361056281330413687613081795174529888115810990558425088847657279228173006865841621009957133313474614186162603,
-        1030085159438070828416735111664716696902973918532298497871719034752913189220453856815682129610648566174831162180262711184275819036189237481062526429169536431,
-        901421098646824267633474601978565676648922937989760854000720109971512307332701751554874160793478544521031613051595539236544528011821337511599058636394107611,
-        416713179596830869405717150557792052202960263483198514840722145258343902059943150376893045417501509395074855498313630299335578793877442642284686517535211687,
-        1114553605133288586906970020394571932791153793964956367736732692302358642782186446970657240616818123673527885333023710580424403120483268893291836888113439209,
-        1230151410528303398137663834171171193180372518688140591529026436491695393284964880901031527316719600308120916617869704074210163306068372596782376688790104177,
-        2768333072897493405406856393264048463649695771826665037853766462864607882521654025365648843980286049460805236424616794757668446254071786707125006185626663793,
-        34570645644513423130200802565103176870509075634639592359671644864496272234475303526142697490556228067559491914091079797465668556663097475634845492515109691,
-        2241419067790326761984034025186251966441693454586912142935351374661789509839804337653771093596082155010470238899302602156653164155550603589550135493602662171,
-        1327519718284465904378928381466124681474310993363658768672215142924059671273904437718341688185180580671902743734257015588042877688842478134441858585324191131,
-        2334742226588184732548100111053228725538684265236398539562614358945436733840926056168651344885009961369253439762881765755486000218233374631474608000452843261,
-        2422804981374163168167626628346552931199441994004173735233958464251176960799767849031400248675294739301429784511563179894221974007376136950984012926759160145,
-        2178551641363256462165168267453771063124377087597330742430862439802475249244497340191729967047565124156576356765640535022096472940334134187304467312913456881,
-        2362674055985467514353746792385833255413396890379549217853384139030238355294725483558528852557588055834093641347932315829219630813119965614106064745972540083,
-        1239349979490331828716311635446221711353427694750909076143376816430013405411771182674728893922905844432279474134436954873847545607593658472069777419445844365,
-        1071512367447450026602681385714283370580844715885159598507900398842761965711327529949128087668724680666818078090129692951982313279273374193307947424055827207,
-        82023931609801197627391762097285179975401267180119591365002858919925293074502226579302506348243099197928020146217612425359166589671691067023786162091046099,
-        3185995875750490062588585119127660566744465298403781867617044747638189411942425539891442493415860668644989368948398029216702782624700618014507006386480882649,
-        774113327020358303931624846882070279687827698806475379285737164413123679286147952990818132832607646811356947979106563799845292725176260915345021654316737495,
-        2956397063636443619341129625571417388315733980715073210034778642991548939783417082659597537654004027410517169828572365120436898681541495856022771668996826271,
-        311971217758026216224882622153283247443986609090613302022123316823385915990552101465878429790092061776442758141198419920004882236819484636331279847367915545,
-        2150617391216571078040105366573020066731963868073996263051704081356163883326824011732067024260863824643374402325597411484019837676695174350526464206148259923,
-        930699135787281907058381693567571963279092473996523326860334139060000529308831220406920782591230059058825169910457717059214730932336755077022097521952979743,
-        307342108737534898713587218699959678492203296262282102167880293625656948980093608375842921304330775921578661679645867856876161325255868334789171667039410297,
-        171415009021897981707862796785818108205267207658285920773335469885311416177907295840332134428924562067981755817808284739658354307718253771390208129295760431,
-        131761113174329970760840964122742889473343791607965305669765806293488444036089060607027002221369350390654137488415599887131521622049560786904080342272140483,
-        1021475519563988616207604854621072195560093938797756946836176683043265431929561175582982316751220314986134028597842558330255948078831357192940168338638409499,
-        3262186551537906969057820427449969663976743747905640126946499788424658341451690437490011946896374910839475474299850494889070849618550033547140268123062935683,
-        494208446114573100192125921124336405017632738196330330388890192397592607535598205121725419983502314704813245069540980414837113267732952289387217910059350937,
-        753343251832382364900699221687914716812565959551458924200187800282072136212092666877219457578336583344673461991299063207258805160974836514789243204332643643,
-        538549303647040714068534970918368558462237668018762911371773649756703789122084313505734313576644980518983663311393850421883534513340322419268822906849044651,
-        2652080806199008932297837441860010090710480545493419181039050376467157652571250210879190124968870357847834267332383884211477796872893293743008690028426262591,
-        306225361990040272292641631581756274653594238145278252213269465154193927471794049820744000417882022870076008652798407266211152532238047388205668300428242447,
-        3398974411264392700954122257079952895250577442327524733789036364327375249251829243716157737778932070407420190834037069352470823775181710536172104432864316743,
-        1550067040035511843557768450679074392497861982042073872081184059525976200037878530452429620868669824054997603876340668771310052646048495373180381221108346363,
-        560205278002667758051554182910421704337764775595038176783274731281231240059479352737309117673168493066633609983316916436813604174920038434085242023209593991,
-        2258324564007113138714641300365320944789150720968202726205051013890904606317691910926364138689927276170241446012617883613511005568262912136614788743017650489,
-        2285502158728121011223748652171775588015213241795348429508746684368195301666767130140796661725094450621923079601775739906872574245083320526388510132517949951,
-        367868247878944656088266494275049432248138864993954854252514080594451322092784408296747732001290492786522366688657081467879681385370995568996348486554957455,
-        1728859009595727306239835505619709883276693312046188943876201908078862742591895099955427024022622782031913852640550442002079746926356900737377596984882258859,
-        52665921613005973599732743882147364861350451931942485379380052271807893841471983865745502301186985262618378909283160318747599385646309376406085204021578891,
-        3123199823881839107534106400676153550661104216966725254276957256446528257193598326401668831781876837961852591793667420832714320604203420732778391667089409065,
-        3252002002065344355556411072354495940020745928045709168286321334275589372484735436397606741772556549160834399502912488703290751970302624146736166714440288613,
-        1699951847629579259313310353103446453951705784058538436287500622349383511036384268581010071770412270969235962907151197814544913898997249495544434550280423449,
-        1811714129320398359531252025212037042896020663534639193088770228031215143731559189963762864787279821796486927049569292935974455825139862668873242924819651505,
-        2468822409246781224921115902703672375780106331770797399940690129806487716599028940957888579814734327890954449081052526993170017856321364981797833344346723203,
-        908213265821889652791541446289295531356754678190613207219316647256005618637155373386456819642306338491648477782804139242674290855219422882631985931930534001,
-        3389043010769041738012142476178301644918981746612422066255800873304333013207710649037487105643842882646375812452011277187201530284048976518425994346559123941,
-        3366307904298342088375538992694956687584652922770791738859536948527029790766197910107108331574748908348317318838718560194884213204936126396926499932491068857,
-        2392857433625077708909485371824416702965548516050855666898236949497064515448168078102943533184782330691106913091251738479973884759869408505527395815536129149,
-        1131210273499414381738105801926016840646149506965802753793739707105800746276320296945889827638444107677588732412767748490178118052268841855349787400785782841,
-        723647195656384885760923799508932813187177324971688764510270691271974344356573076378167478248451969552570452862725259746442539979778402642722226131651423595,
-        363153151504930411151343087005331964256764623811094345187693586705871412922788387203490852784302347822626652419009441299910359142423672364547352408269405137,
-        3331776081646543795456086217445060703256662731483838675514977882236811330900634123429363217603773258415433300586048612019282972882559733876278766020421277575,
-        2628563317691592323816549059396492893294723446788666203168155333499625549175681112118131931663428688735447016673911648926876596209450523329483933445065447283,
-        480066337309495720686328479378572588823508540502270614680403595687455934959364391363764051959761643061893893398655448004482922044262199760614701322862638271,
-        1007125134357611798376654728145592615658517543775442406571440162198102813375510625363142844416463760668058039799376449284767279866241990465636569597130207107,
-        503508288700200929650699444299910310603966878328751965899765463055380664204605633957877420458512342572369850484012304966097604280278573027338403474504555051,
-        1643785537787898453347799902176041781526639002299477189454496350814544113109117022130589051137029020746790983011091561556813694285870894749251086691195295419,
-        1471821762406978798325093775119453369699713735212165967625340910322905426941901135735804595784491401241175241203263915236315384034577591288577177822269241577,
-        1251049009550182010812008494046548505904641182961795324097396395478274058204186877077240789969076849634478820052630216996802632917576797242676044590858989069,
-        2801100169534888213352668569003608463467267031792483958044228621352020312718035726745792289435335008126323124035208970426209245420788253859387454975143508087,
-        237478748192671554191455511591290389558654176198630457286622063036867009997408386554582375832750145266624634498707488018320890810282199261510096661718949827,
-        2196304781134779424921616329824418023709767791746130150865213890856056768250600700888151524098235709260738401392341724600310739338467298496764228869146585607,
-        1005674881816559110155050302077055873119802984534933936521432829775923995652149407408349450392242922779194376861906645970428957454958804861973386574019449907,
-        3301558003332775976587502969045239932664406512494618000934261284220868830263084752771932155002938382132750351017813998988626657957307182072186150389758450519,
-        3279826326332023764426134815481383027051148924680094330348210518018043355295451039477027589704273738002089971783171465059044837124191516823840897313680380483,
-        3092577357324824238478252915924014341148883381864762977418442629564946579745359515858091210943906921473308806747511311028559911644654891197370007522144618235,
-        476556782427635223024712099709409496867684889675988692887899691745101341497599793947579637691507151727145970166650998616291801869127353474375997060279392153,
-        1683380821598684318549959428869402156633931513545681280719202799371143427580936819268953945116348014401817448193681240561760389935330996303255290154899024559,
-        105662618480819025946839746022605684725297266221277747477835409312077741541345115109007415287448226248228328082423371151419886278759527408042758208804768197,
-        2959438188624959731428280162532007341727090159680249498458261803539467975515085060367689828829072390389047565754388178036338821326838192147438640302821999857,
-        1521263623385599836260383349535832394211817981221529385629251895728620211878597868989130855936417056553800704968186838996750641607183200515749426072059912805,
-        2993551498533991406170031279218049981469676505026215247433896352193135442252077346123957265397069546139879499805240458049204487362144432177293728134416378547,
-        943049639400460790388859369251375362726936403079263888370381959969102409569887362764982144024230282369552937188549732904793190752164031536098949185830933927,
-        3330468668813423401053752603799728532006599719088064426052414589619884847892492195985267405830639152138055429684716693619864502062306549610093472838014528939,
-        930789712851374540460882393655027172382828537962394754382251815362361597099598774042390724904699155910335703436138320956258527418575480358674814003000731335,
-        816089048484388984855687908619232186362856744253591983744805341028479452967168242823154538444936504889416139352755066364089147743631630285188947045156557259,
-        3272944833128757982917744340101057919605075490626044026469714703383453711251450313791346860261561805012409526972681059903187566605392275339736349537701246999,
-        1423781592078780860521688935697337346266369158286787805075842203033365112718767570736362227278581802692374524473044050658603475066503297055911308391140449101,
-        1382279439714362324866795356942432017883366602270104559981632842999442590645913746480829955799778844394816081321959068516065008999504936455204813734171341401,
-        1332322504174406991980866063089684146217050137260062054844478823338877229394815640311857951106634235891242799310628598857247894509153342881089903576307749819,
-        1330019864376637782601631615019299900763323089213332089709903376234366548758764188151350262526080000787098289897959325074792195440497532132558849340213713569,
-        2508406499038505480862793359888633937255527053517627398027219350378136035746297183441212385946397768220284999570318690533518464722745176485427443113568278067,
-        2343680450374695468436488926744961974928003872130930952962178204764105935726962694507495323646813800113510399327193159729781869505937197934553543788313295845,
-        2725241450346129074387460726404553722767963040000732797177680531052762609224211140194514292580470324814986085209114000557103023327266487521756540388860235813,
-        3223181111298280671597698979199209022113848048091241776892267258000398684014471594386029936074828112396825024466023323052551167620779945019734499658483483559,
-        861604736939843127943520332755611507782823200502794499592626357054851046564582046278740447593470576302640879891289457753362721352584988388780746533151497119,
-        676433752621952720211170659002343363931850695397974871114175593805258710950247016318351305231827309930689202266186087864344879428176528696285325287475790921,
-        717414132388503119640749750681708364713996863098495258553272182801411343989747108126068877863765975095495407282975328290355553051207265947519075875984881097,
-        1259782858678067354729282011914349562057288251469331008278879068612452220622460253059958067536927566851098133797775444028036738344452937581185386174426584581,
-        1258249806801444357138680669259276906260853258820955783764466073979716374707469390025090783077966246695856985658343690859758975362963726358791312253190611417,
-        579651865742945594129801454253853300948732083223375366246260811667766859293325560018250233513161378418420211633303546467019568982063227090261672016972180029,
-        1249612846249800681750772496868983735915923765722247822718339206526760006925584435985184921465551862965374170089549450272121147678019695816637433853686348871,
-        1719368975401477785773347478956252427126428208180497598342665745691156792811223526870486287171047214972067056379646269646865515608655743773224551513466588571,
-        3278296195640718277041961579091335312247750778344974898641927550859293500701396782113466010616320380051982127478411911844301465199446959305127858812567165751,
-        566497565428834058900666561536963961833712617974285186602760075902950123269341615390813657107042561492139112677452908048258841904479743222970382620727186045,
-        1710502024880349608036892608341066523203854639158210255024415573801813489927036149225450059798102747706028181422683961038135989426684527264138073516447355005,
-        1670964594052727250454146424439913845038328315903446067684122878364903827025028488952682745106057500219536413715346616181103670826064851176757397088566652461,
-        1630226385913378410505349422681362728550374281144954405714407445481747383591341478772555097585154004945957222820014096647425328018824263835822864959481786265,
-        1699127129452501939216857504110223010138626477650360160586034819781016823554994522204803898125458523682611484444232220285407043478793401995575695773792890649,
-        1059100470397578485182398855989258877440092361515182363747182274761720332329462680533652326852782001499795967544187808753334397202520793953514544941312189129,
-        3157180938318488149848288946443380622583239845179000665838274486029171295909464333340629934393351643795867940782662972806082984483661513061807316312058669171,
-        2058474311632085308967358161956265672217030218310028129570943720547935492430444001309680562275138113161797292088302727154559396043644147732100516257046840629,
-        3255664194944289381883276114902704810260908065396979141912470811119723628776382231144567728736793018785755265250849056911554990257996093862621720229073651413,
-        3167525600995354742324417299987822258536121887998330522955309727894455138609806257523070580858693974423007543108538220743575897333318573846337630729843946713,
-        2502155122013125543427844392039377727868900703247420046687900800936852944057119008923289070800008641904598717201622750763243204950323364616240155827937701595,
-        2359334442091934866881191494371081209160034659669642189316693900351049907264256151065408114743994951996696932158014564721196181403387219635416012663040268809,
-        2783394832361588057493819478463177213925534710209524345156842569979257284608997980315344420725608902618473777801387201928661989570630830598776810149771933639,
-        1083802632668881544947869558233444231590595681393706934157582737647698881260165180577067516181085884320375836887414094412192971869574772889358186348856567935,
-        146924420771224142799882654026852471224784247261603328619399652883776802850888476058525767959573375659071624965291227030850052214008253250988690100876584891,
-        2279897487807263562228585439365299890871461815302729489355136497186911892035805243446074011909607736077037095218946650573605576111803913833056704194228298533,
-        2596166706996413205998807546592481279478060545421212213534479602154728316227238831730451152275345871815097445216394344305709995502189168154166739207420942071,
-        1420191108416877901868022176474624203363396191046639748985426356312270009390593646323642723303952113433077339485228348119056889088313456910611961783071253895,
-        1935551829251852444597642203744825060910742343679254971464491938993957344994327343267932989488380122015810411653154445465987472809579454627756006764209570973,
-        1060783290848908855128564508503018211090418691667644001503455923075244123160879168496375710769179717765103335823220382017938401397536393283750471816024887985,
-        2867094316357810848989633509769306940851582534514872536265631468807944952478375731779394137819616517665183372590332501826267581772153612942998151637636696083,
-        923983962554907996678623136227184048066696331120039298101324212031800992190921660548479694385464495583124883797209628967989737763676384925311170816566171453,
-        1897266265733526149042369843194537250805062293863418758277404737833166774910029158498765937334986873736380248204236724423670493951675094638110464037238188429,
-        2800328927417327978581373048541725966497030596761523527651763543410426590042176164780989965848155613151264441161058241406737094831935657494995623596742326641,
-        151232864596981008332559815252628780767609754309310338281199734712795881133575514600664342752836839541947241498295829023965073484666295686487757610944682963,
-        2362781010822512006952516085843078574893329946410029050183450376956443160995078931544021183130790422919364385216114862643679102477411076398504759788767255767,
-        1689594046378995138150142757417561669120700743703724484774195142495013568242999686096368114382262146052822217432763056108084065058869265546671503445082370285,
-        883406088888378346027734723769879760624499398294392879177834100607137910962420082173824113860829214731844662553010354967506988784074944354147301179384057381,
-        3088563185480444931690659405271404610227393026262671240281598449444749884691535331776347575727114518111234583381381846404273713639331785174195668083159572787,
-        3096077157968120233987582869480664686991181742501759674742488280110657341518734327544287303990923100573077805208795568551675074698096063949254540752301792315,
-        1019333186547880549461395966236344986645038741849867567661026785292901090779360740762523408116511233792933334180909613982040961212121118473599593865475529007,
-        2200091616057978064296680596686015012044628923235480425120496710276097583922606817289727224475333959067468749777418147748627230052239938240530836218533128355,
-        1382154376298610361544871313596502684645016957595054574012707887947437123784876893070944537102904634170682632439743503632733752551673167394685169184664131649,
-        367949341780860890545260325563836830103764465087663578717569512154282909962175837008228084490835413268657188363322413486002601155430716230700208141598527235,
-        3060224976655138480987009312186040558636112538627792962982096761471347212059132174570957004651309486167994351784451859300699899067903065975366634961770328027,
-        1153454906537228206464887889972741483467548921253901721297378083687575561981013272213585093143111770493629313797230854069878641943581395592959167469302828577,
-        24205150001427835178328118175548601000064766325144720795670025889993230603563873465131204297922535568445101679704249966325120807766554421433816339723874677,
-        2142959662282154558200550050059667533486775017727917489263817597002879776656835413195595627232244752312474106203661771744612005362350320109700162887690120333,
-        2662586527729126287835694066878819122466761765970545742932094748118748662053001934056234439691938307143392145099388173255872387804904973192916412932901983615,
-        553748529431211458198209725228928468746110031886583972400189176734979458676649742604162861863646552154319313089634190166569882100685227770093862010140200289,
-        1174720698289486250049610200418883690483272825919550525740537163161522960458969541813657112207012880765316190724189411986986892162565034224762822923701923683,
-        3429929494417343887722055614426252338806583182128815303521622750504320095933274583105934416549072559329281714678986959051882119449138429093502603807847181941,
-        1468848349863481169636128997426402815370322135383856596806768836535673937378420061557700285440418885109536644043974945965703910795369989648113227749047198491,
-        2459908968752363750895757549091732694220095110703456983428944449249133515172733686716011928981988960623389406474084985705691565662737765338938608981756565033,
-        376108474516236216822611658800021707582454718683612663180888155280173216472845694965554071357821441635776130736007525952092459130644358027926019730536365487,
-        2095606037216851552633772880728853956140000795286767987455129134276492028121433412338316331359366339654757186578779513373757849996451983203700536622242617595,
-        2726100963486624934709688644240160550190395434686182890842427513361051662027696828696059556799992799335294543803594049767663233112838778751621261523238287395,
-        2485835182506447900992653645497469003087969215683990825144987953183775256814704759875171934083861902382300847918783272297614187394677589119877804654133915795,
-        2958985797622303842407149001563369924780719043552131592810147510423176497608251953879020460967063335882161391922557794729047479527852980125425805804850552475,
-        3098266260938301573118763357518516720599570532823272106417953628234672146629296154489963998000745332768693031067829300239534115398794161954340372593887904081,
-        700253662542705411041333790078464310194055364903256962739245047591678110140294597557252088041075361717710282273793728657465958181785530418208660795453899649,
-        2705552015722748418026987398937937430257030176012440087823759112903958151080746918276470323117433251276550675712903682725537964494883263970216621791293359125,
-        1553188322801008812332061517174560084408819089916145623647873968033701837246966602266363695708352196183799330612101496471835147458310524061541786546162864879,
-        1981801107945954998739687393091284157975668609494295491074709004744144548746016914826797175676183732541203813237257910736962742363962771797597265170959904991,
-        750813488333112500700161683821269317021128870618668731082820008739615436955510065706528970831187567497014013168684453182800347860145679535008583675898007331,
-        2311842978140828177915761678529651447219797681498662266319242065950677485357657595576134657728023631780996643476750070372442691377476688237063878025862279263,
-        3342627703416924071103968782930392692501754409436270945952198565952689863132033377772105323913562137495522886076220303059133122007174420969229829731062267605,
-        80394956926383084591569510634489938802999151240774269887804026375320782238491013839760990983086490402000296014449642644902484232306386792985310636523051509,
-        3000824265286615447106493254705471700083323900525285404326435368670878608467553340111059375451508543172941848568518648120243632741834633561676992134446067077,
-        1338699490816678460722248115646650298626227608311239159359564745431153082593380677023197534046693440455034701302705793603008258910541692940803641464973032705,
-        1100790511903351045516692905651979119579803164027084721247946162282196964072813938942370832966085163725167284405486976709015238155250678917541354061514975017,
-        375972787427105020529470517452394278592617940763028717062595244050112066834921930571747568932452089022522392279614029477693653212579974156021518130177375165,
-        2243415320085635730942655809250355180352709344526454529621421784199188629624583140998922540752138268040959642354444618878226501389615795901874431062074268667,
-        1311248489447696338164521524775677663643399955718833952763441846944228576816163483678866854332574548016288579091110108914953202013198648538216245888508826923,
-        2466205741001723173361531153505915559607527526448501425572223363289008743612626945482972091131035174300778356737126330181920928859943992655339982132529560539,
-        205463870388136425579937359270457980683592728236981737981894193451871805655701450878668628307852940872106771408540186060875435913396191997454084122239550737,
-        582808020184412671008937849372718938759946287763078618689747458078960598835659571667602205424435243718634921485015468275228179829319537275189396362540191363,
-        2745915631479401985345173364778475385341769951695905522426694116423314750947153839493721689797215218913772633097743296376758070387627497465884180841339609723,
-        1720932418747909043188081128700717083171374721154887899030920907131036465440769834236500292941349603836249613653417579642606458998664368762168490215849829419,
-        2178155670088356346611767022375524363675637390053013667326157098168407023632606410575133258131671757623365160887900148816476684653466323384813645689211231965,
-        3093365689426278277494421114334185584488599218988410048004014435455527078743778495325024707002459936160546842022260020603084472621136505330731841782445774515,
-        2268322284063227449021177242254711791549064239785534248761514968830417118139089030248927259631485288946168446297454740857394581714299669971248861901486187997,
-        3147926469424593862844880543394701620287777359882510400043128313582400793553175209813109311222689808063122301141754445513002476989747964006014009613531877981,
-        2609031554073927291474810315774796421124534232691060319075020985413485918470172618738080194987232287371414433907492205604886123126140981947268910121252020393,
-        3090579190411634318600733741328882835406004834787636934061096306109733339906239123420272734661276857871019699373469648573598569969795536878597251117305872679,
-        497685017615197160084836094169480949380113177431788374485822685531996975329879150047478902638974260147167931055932286637741750190579127551023930041059866669,
-        2359745033971967445662930566029321234791811373835623269151533278388809046593110759850750924157608807809024802622990635119707112566976401690079657404741956591,
-        1923438290159890245890201884977306553363395067987620291908187377943097123323950435402014948359436876575036317424463734498980982552160724425424199587912015965,
-        3141317757813339143603954415704516816333544985996598179598145820218834035699310678713036808299335785204830963861796980659363317491319930306385462831282456469,
-        1232395977646926153484056290129470418978867940823585846668517287751597636022842635423694986776559791028992682218776674117854740916285360557176856413195451951,
-        517500857871873965154131335074501411023168211177481001718971850286380949268096372548732874890731514698295215081197577730474816901295145158341147160525772737,
-        123428790764789396390841689201059115327219078797789398879528570921500284038090082087190292619954513586092307099458479951690867358766466047240199781565673479,
-        652399657956933146435343526383221768123560521289106222511494761303103421394362696317942563382277878268549156552711801648582893508188052277187682499006616195,
-        985019598731245401338184489329152783891997562397607609863462121942250112281763846861565936749435548804496128568656118323560806922680035821812212075174559113,
-        2659513750538738755943982421231939108538391285415424201006597349250623080515758140504323393412672808125874845200383178702764548235996826336348524101418369757,
-        890031186086710432525810167557468157299106459005690892006661537100309441159327709622993112734299999784579964825367080309732098942728399612992780674819730289,
-        2585230451002639089826207156142659185201955883371898717130880128603022097872526809018397438427880696874176273019477352367727308075918784486201926170518552429,
-        3063912738134800669512189953379861202310060238005465082960746976423844012427306093738593411223286673396428601200186976462493539741573542354557696238653376931,
-        173057379639176790912658538844598134730800766177246584170293030286440822015040050542573543390612294064509081494191707547361742851542612766401282921548492403,
-        183703366790185299923232746428947669896900877962053194759979114103129698228942162523741285473014417820794888664962969239171084435584502029758336315480038739,
-        2920471465594308196898417567077515707615764586715897965057298394447396453286355299167050983716460465732760080259146205728313910839277854109484578401379590957,
-        512252444554976656852414353120905982836737811849099259295858766365576871474829593116248295063957602146522443994899576595250543821397302447284380873057224321,
-        2396193009603404582642469065459377793183480924812244495011659602975984109511683583270839502351613241243297607733828768320094749114030023511137779640123368611,
-        463639636426194344475717663282284337385042676637262015695339556729127429616695376050079415073927923699228221076223989869932997430081647006085821912937976847,
-        2095546926520061248115208655740090953802500248104623054943872444978000500900790499094679835614680452341600126998283602145722994338801632021036093650909084289,
-        2643276741284485025454843072524326188347458579794496580726414045190917112289559411081686297971627477213099662156102285635145999782586654750245272915826902557,
-        155221760274809196818270684286839283766645853379322426232158949057431401388251590694632297791434038859808648928751928483194339823135719682778058301204129993,
-        3003070640327713591575688996126588191014410126368557363545453895653302592173650535448264587564492913976912178207561412046176329365579468131165016538376724083,
-        3025505560481561446562784953161708438477713242845726224707116003423968638653463747450724475930263517404716630006787732826598661314133678355146596525562042295,
-        528538847893106714395880208131403235191485353504644316752814967730431889822989310993013392438855709041039815560265361222993622679866249154231519030856464979,
-        2827744572354759650971457641700433741257412694944632365705591043241891922687663886153646796686964053354417766441935784164752104923228518713747242715647766429,
-        1216466669094468903038317487092454239372445193030893662641219910888341153721156690831271955910169139748612136800915358685557666691805179707184450656101422283,
-        2238936484496576544511591175768911456894699689169936115685227850554306416260445798075657057319066119712689130097032093240211715624391103857024380562113190305,
-        542855779357352596411813261493375564183114050691007937802055404597279304107828309525867188053403667072092774562483390335523336727628194284091430813027287283,
-        2867978201810030672797787628765265008030310499477529225702846561267571489768681417014604957811540467197764254686700032499795264840514127819828400743986693695,
-        3340898028597194196611117531230355457983906679854361623871087525754087303921222177828287161235515748871745564521558924661142049010079638326938402751129902947,
-        1674277863502128015563426004992146043418382760215630475392420633043163740192903577013451490601903832006830688045461179417084989253821419926416916770154764507,
-        488146394165113323702397633783390550207266292300995965335662923850171673446545325597582633870326419400605387471115858917893933791600791001704401983977906021,
-        1528664477435850174782827699268076217588224922721934329571875959359744211867485260561700014023095871635730686202305070612875186679660259765822082121836306691,
-        3200315526353000571861733569327032522837943266167446333572925026791948524172467922894552117396873404403139562529315616815216475331200382708770998861319869219,
-        2458867579173589179283157623273003145138896231555922126507807752357014726206665774419137819595742425696872613260721529525552557707055197315962108591338799695,
-        3402013369728022958593936600140778994374005976200958692549252490029206909495612069910459872929042030851507717523334922055332741736935198465352138229097787947,
-        1518597164876521877184851231802512147247628878608635962247825882432400749506375369551914239218907661120937885807226843203374268293518248561625526316810653079,
-        2822210202444277754182463963880843822571834874249594295481541101573861437638145228934159166796680574037321294381248869185006654306918895154362014419394475785,
-        1350402451763252781351639165582784611044734400561683558353195234968026873444563271570642252196901169167621947380574770971279005575373241428359931920738627961,
-        2814489153289501034506699399575623788714731959374506594845323866873600905383446409651778163499756440408373949422190262812760963406214395251560894627651697163,
-        2325363754803608266244890104349952290932899292749262794705930163013709420117272551435473032479737280299727336327328123517557010919246924722288531888611644569,
-        2867009080092580599539484845242367760834236263903288654771683438658975088659467644323507199163491958447519815758278097386190865723613419960696622228838904799,
-        3005646520629575889251658662634784402944563201846462797790618295671263544004762104239874710343750353055678125809207495452201584625740893540373156577490804659,
-        3416261682681793715812999862421517496223271819612508406648947938869613689360688035419569727647066959241717579542259599660795258280573976510752675937550478977,
-        3118920361606899781629532378788338409497311267921044921643822845091326620049738538518449403775253463713601315296845682312219666287555315680742802911513144305,
-        2273843237014914317921319059395129986694129550810075954415042243042476929681198360999219593405720188307761021158026716294944829185665990030435153053504005561,
-        2507363164595990006859861557080687566514019692695785167472001209243067548273957064517866215672698824878953422693419085346552698352662840535871581507996681475,
-        235442936769602553883964317480214238498075752690834737099273528779081387683253888488552299321058939798538821995619606186334466869484871036724958861988749409,
-        3146568019601007369386737747320541498541802087779123678439217003559995777046154547626081078481700454918610143301825086782683916337654947760166634837862762621,
-        2321239944060562474113795159057818790697417529099626690152330576845027865344010441419479761544841902187913445298629786889335610153555034263725919997185246189,
-        1429615635868964136945226019053997568945109414897414059543601225715242852817405536390028659030679616592875030250320751794281213472909830232426124694952221821,
-        1743574729531854935534138676844001280193060320167529607638424131589682456727024677619054220769106311868957697393023689925187566225078300619003734637974733507,
-        2719962854768691188209107186197417709016669061575039830308443968569031499914076037342285610608398366404443425349941435672608401356463721559597039680209954329,
-        689202676595217442993324689553681777466402337440571669235915093021697194701535890813446194613222569585036998481226535701401292804876846078172207720825387929,
-        2288274338901140614782782571741933259602931866595656019954693622290205932178994469562492579313321940127349280926665686255290857608325978979806760343052250791,
-        1117126941193965418944125809128037705770195341715439801207342759682805817871537343120272426080271039057542088415731420832169774777566527501267853362208567471,
-        1882627146126965848333720361996816027496851007829177918420846732158852437822031888248231103925090242741443403678188593521777763488632727073570684544740722623,
-        1052790720248723969135492962786829463081343699309943807169824900772431852828353997758752884711809357999426610628025336628391887829093461806200851459299217185,
-        486268760691082478788847857239448265475313395016151861300995340162141721700958944878388385266008279632501399997009985979160687227319747111871171985891754213,
-        2022302327234876347556622343320922243473749084222719444471714477551992767471961463684865030295371198960859861510209951967461008842045629957642918694890008687,
-        3345038829901318256229165357160319115418610291021436857839802600437052050923643782465840959268615494061076611178724187909463598753538968827267506929487919693,
-        1161862847991469574029214151573822419527472672407407745245418945437318289313641816764313946944213437790387920317070222392273854719782700728345664000881104923,
-        1135364945272598007415435529627673948520746840087204461535701576124251609828020797521387106722433216597303619064017185213685983101484636505914393356206464633,
-        723444560527962597751884130653914134689837332635036481313166005581539606437345219243199938700652222045200908413039142049396644891732599702394651697441228525,
-        2713242549674431964347953769304527398655226423223332778399171260324685804895055565689096800697724969115010308621034704470300764935638092043250635414933638515,
-        197736298391094701114018986082230837275961336697250656471511063214686787858896477770196733410115745379417544330367906578487851030569484039964090436403716945,
-        3410255896661094193264660425917982892865217378101864153928225826541472490703590502993484873169088022026581158810171473254499164542818717188388170438541738149,
-        1927063979439067584551028350994460213854526222760735392612428316449227770940722928623967755355317304571691635220259036847066367078511565129880695345306348833,
-        846142471842532125705232113562443936349454282872216356545045485783435542530153996456702557742305022683213377194086510661494061517088329334861727537977620829,
-        29317952594431892784030366884040198128348664954290048028702476411872932884135290925816295918552674252247106983534872790045032453075798050843133573139268663,
-        3101350432602001629508434556991105726831040004535159035646721491596981038205334348225432187304030835434766062939559619971890987380408230367741597317889448221,
-        3141402426452114443814651863586486401535175185498341539196957297810352196173767402759504424618291788365789841516426885799014140155815671390352621367100938905,
-        1621909042487150858003662802622267530496159237286814290243785401852923989926928702700740369671509858069799663759401470635857507402064775321484344754107929249,
-        1246797697647049929087851102131729919222988499549156494311938473012087756764421459149871071529677948976676009004424985856653587753382659583041951204763458125,
-        2160788529161061062473612046965961320559585216254842785152807533797112411927009420617024257361452760728372074717515306391011101338327769690361518292156991363,
-        3293828625738950971871530044204088755571087684442451151972706152894428324967746235767812570588726041391411898541834551002581874269390452368704555232453027393,
-        964358296266727256120809960140753443752308274175997561193829377374821832952167129155309539191267947913560615352566563565396267961810348384116007092468738129,
-        838179200737189778875635771186795177675476300497328854496551036250974544357546769472914596101884738912389053186048199007043059834258278440663198839100864011,
-        880243014427547556803676742477349382392037945682504968005577003926179614404076308551540384392997758710281838564430990422358499986644087770397017776157893027,
-        3282775678692725005889685834932738962977380764364790215544591610204483197374269797871853837750820809808908714440056376494293527228741327284537105708318583201,
-        836208932092277953608966105838193863835416200416768204478783208679198117679032368901399943083221883726234714636978590717257314739084488696177305723754425441,
-        220355889694289062496458251093670537558978936004120893595612554336271799086614613491455935297277214221397747721416165955843889904180152852253402800536591463,
-        110962134136204142246099912134292064297332432509400783129106751565489549328795681714586561490916466204665580856172081389399856767487591144151560173113601565,
-        2582441607184062737512062632848883682838546720297078940092060040254799969686161628742544726363431789736049016568791738593786577036623688903789324706115650743,
-        890669733481968420279659337495645480715118679454092080907583982092751895251224744281297661462757489419965113838954569688534984618165086572738136533506248889,
-        992887441891889721702540967891959367409872090439136228160589800826074893768841065975314305167268663239478587992933362876351365377445666509572809795020288247,
-        170462760091637511806919182823619145888362433291608544205189853170459802881467173956465614244403430976705595491463619204823601024734522972039862627894885369,
-        2066955703602068141074603415217260716102484524912132883315112103933106955437476067855618722155930751591343805531197454035620622913029159864442375612296808651,
-        1128539569868260807515141533987431390883884872334732492058119649082937170407463452970298365263883074332695973202393609594801567785671221723745619272767524291,
-        1951756002634813276576584815484044378788067006330355839875291425971507812098157863928353030884024280899821815295946061139362045656515231082107982076153214879,
-        1044092904822638241831893643853685564018552543871906809406841135967748328049640720682495490130032861722837490181606516459983195904241769162683630261695981125,
-        3107476876003160807877604776528638660092410580221120852575807209844184954122283431402964894628995798330858447185755612799435779417309478163289669878408796003,
-        981323607204290667439790715551598355510558843653969610810882419891882442358625963041427169212533830662634237922484256066182895640235326735399564205199666785,
-        2637826497643554289532196472623896824177570492826181195485231886062099487139423308042229633834294924484405025987547325090426847756265793277752477479686502333,
-        2207168903622083027491118401808938992188720502440772288034116903138820881803662179015162126593580538593877718023560975175973284759553757501668496055932084057,
-        3081108149097831537680748747756895901883278772206717824371563150200548843841199081072696497892160270185417106937987378582571656746833464657368978496222596463,
-        793008767605401951941817258690869638146295802077080273281047362283836471480215371702042176764236345781581936212752921728629678302363898676813655218973438513,
-        1459778698641822870869877021737884394866469509036563162150910305423364798150930988541526313312981245087722725690980697907719963923181961937718290445628061957,
-        568564674995140325284674910633480742474704658753674230942649828953913898488087204634503942577190578514508686446808505709303132098245135288269841846786094523,
-        2959665873329183299332905994055911192604995801467288059856581804219003627593282249275493298281694864583841030247064321143657454686475246263545941442381008855,
-        2860290949432576874561038197887576929590838195040076255423070468632852509042344170631718617729366160816220484594426836248925620185383690273992856038863625633,
-        1044766850771006743266829722864527660259393973130026314874824228270504554713541874492941998137507443143577793442851136888545434396825547615463350724089396071,
-        3326018381824194886575694744599123918932305423097495794453669099185104089795852587572564777793329614670775699447964709987019874624930974038146918245043160251,
-        2515143043359859498427856891715610123491920305716212475523147976121402901271593157150070803537103496484725546466874339037741380006516547816192060620933437467,
-        1553874120242446092565191956912464565264896802319254702100967604217490875818311629084298120836798769942035134725321714141500827393605043809904708891807844943,
-        49420337972424407417892800875728394178441110833884348578560368056887899687539666521511532437096508055149401643520257419715869816963850797332097290148337197,
-        1263875149577079648623660180994742671706428466384712831158234359465654306268528414174889394106388542648874422427720543880692870694573003886075116307894083373,
-        2833168877017766380100324595990205404921444524756553660644678502509040042771907172839308757294454883202989572393294385232633513854465870915803166221221800853,
-        1821813357498413120763712013990544832263581661189877051274433794826894540197149889064758536748527928089063642606301165303002113101635285968613129828828077929,
-        1715256994704425065441102475519371418208743772631335150590603015581700312509891799960472659989614342464804602455860672137035719337667899134431274497941964261,
-        512654938725378465640719505980349070813324083650114190649393167051680999562893823845198258497943872845827005606985760442104508457326037042423756985795858177,
-        2649504477955531094591311287672942241329837383942726217478411524025564561101886022602652463259379898977172118634147624008977180971855126973829484407321856939,
-        1766424637432518136930730674377957022603262391136412576002522863877510948129370895894431368043729193216164357699524216588849760521299238758399756548187011741,
-        702950128693870229790867341833468903053839852438097451795743809914562813283648562866116631147881648503327801634383930786940701944740288127199417381797789581,
-        1381761422194247189776349338198374408885296343286068139219480627472360508117168387907589853534411330870233920397802743259259153257619847090248251574387926241,
-        2631534128950452213695194502354219891399937330288729393683671433877774108386890687323567427886342421867742115410832428415286591752200919496951264125181331267,
-        379578294478231694665359326231529714586812562077619204479994283199104773980017764529382714451766006998417698743037081923116317222378695458273297978201649235,
-        985028058507604001356127850222905811104112522160851596551187220182287092440941600344870179450593430837855089916345816933984683237284394991979402238168872091,
-        1306391843111073306514114664380419993544881409547186037722530123234769347174115751289908811823903204409433880164460208089502041271413137517401630364665064651,
-        2838502568275001437055854230926646788332190950920344112346982595822290708685341596481749314174207921547135331246342531716959856114177299160471685710931216655,
-        2146903013794479259911528975176017544595859434881843675683936902004279180702025492916026550354444673172262002859432031161481847248035014700284446554625323173,
-        2717771241224375266937953310785276874305757728125340620857598909763398570811470063618404691565365489221689550797874737113927245068328581527812368360680601549,
-        3237210229111088134338370347044135887743334438447707914674674547143360369668307757564654992743657306304114766552042408435722227905032097538270519892572682845,
-        2012984034881809739507276505019236181823026535987774611904220083099138340047574332202904008848560898730172098997727016955865203303697732337124048691630567571,
-        256071684631446902584258106326392183726767601743401723091320705256245336487241847560666713861731067383488851252472428340887720400467726664699296582543457125,
-        2263380756740641114678196429194301141665268509987365028966700071084349059162609761346997161077797664345253920809546878053142487113506656824773076787760982193,
-        1660690874907970234552128378203189829323346536292410137821035597288356288443474316143639058896512449492905281264983298466117560108032305449177156512844461695,
-        1121694042900208045350728114859015697938714960112231762016256958908266799596279669267715833984998379530387219971164188650330775327450174073259037383476408375,
-        1175361275763240535597890406229689551152075047132969959802606068672307468492650114153526529148490181240263741236106109608155600378159061090722220817918943627,
-        1249566521663864490773436344028587306369879169801557694879929149481057481837100158257715753034211040110754067618586231138907458331434334555828214054081351827,
-        950717196516189637676731657024290640766258977074329958451217254660469017828760178579959481635639117698875374814288332051096421108932184922592792462641887775,
-        397598764589863681756312645268983695032778935365004791039374710207456554006208640030400803876334837424069837844643467513227329447686107144660596374442583541,
-        2802130118044907462823005777717953908755392941873396784247766337067356216519421280327504426640741614272339840309686182050040781118839593708381418506259824309,
-        2885765895347621910408684997754821330891082788080110791179507633362736665693257949495247824534593860239870020190739244673585357815203937707506819308183511669,
-        3326048033885468203998470601093629464998375118426282264642087233345138559985989535085406001946497273549062622693817768278761800562034845876529475521551920205,
-        3104324853178333353352085877873883757108937581778423341266722676612629395906170313095264962974375049627028091246774820491492584541619280863441574641742138369,
-        3268764638751572592034542934819171110844537480920950125739528001473632295483469338371090749054034333688884504722256234904447157201975910870266450182564775043,
-        806430760001165038937584987340284133217330082217472838191977444702007800188398945502042336781113562215236998282279659621837444958769302988036689078047829079,
-        3010592252884455377664750289248545008490964225641754345222506408505827345239510167180453107932648466655914248110683478889338504532494944667285377638973267879,
-        2839017188750327904841874744041839668350067569731596196413587329401074238551048798017215711569966813460291427322182420135562183797336636702198575175255038533,
-        895590907141446772602916976531757486037961664489863309109037724958303200386566269992675092050585513453922183534193107963838785336679785326805723831710257865,
-        3142200491076577773590785396413955901596906226064439485161252483154657219836764612644564621812197526237355068473334462064041749310224477494368080672121232205,
-        156557387187743104107480464027440992377619876803463778132779748509852831020772734137162848758976399173399772401269705023029898987552639368622778666212701785,
-        1164388998218465880274107096215520565591944453849443615184358439802510592537904913428807645400848433067534970497280859977139652250208780081559801105486784343,
-        2355531896533474462882908570349221963522827762263987719643974301728782708971760129134852637403624046980465500664194043458822588573156900896122480821271271705,
-        1449618696169210499223492770542377765682592208289100110798997215932581085757782175440374525328786624806783871982636589921520436158005428355454103725291582707,
-        1241978895736723926347300948308622584103965995899428829207361173103350927730281699092510983301853313409558314113958974232772587102884108676188007644952364129,
-        881254968147392731800666789388337277208012739851289371896250668839726916179108847076783619403240326774483417356766227438298173475185391790235606559745408299,
-        1264279772053548597914145295997001324272531485948415700457323033667835900743951063477718160185714847113320964125211678077230996186409140251063355479429209109,
-        1008944927584208244206026979506024687832314556781738629218055193717688441662053862619369910265367197872841391631486391768497210576775026577404383688320251461,
-        2780922123589998299627894798267557996517583105627682546999231683842760469937990296058082778903609423094599720573900965678230406298729514907056837920353349471,
-        2240899192340443639407833447379230574238624527170222636977590611697271019974869575835000256893252976635718297266208223582155165916621774696517001427006411151,
-        2234661674540486265208227715522214199445068161397347154454654879738523469422132369552028651228865152030881047947575566620428780618655673807279840099632982775,
-        3003398764976453109435316381440146616174681408272175274725677197948333376185939141513045395989798580025040051612096543915639924244162789705485196622826024585,
-        2127872376376280659581310721199123779214756438462405819872781984058925007908538951856147973226136902615325458388435711188220370274271777601564399824713800597,
-        2707394937462236174137669775838206640911504830550320483710389147647857709511998490611603730143949474840773182202315411865742227146453970699242224717161381075,
-        3277371598114537223260914692518718521148003218620757850244748699363253034880913424843866881791932249421666955119235276289022267517360934080800767792395513009,
-        1173973272390880104848767376709537353287397601533005061333178043197918597854816856178726733997074633660178509381888351705008095375334714483303837501591424159,
-        1707463770585539620921178698830765780392718069670383285820499511843885918339798842289584878188575569936472294032029549256389873587193627596461705447200135605,
-        2475641007465140926329461654573835605209173604521677462419488975258966365752564795281483839097246051294594861584267187110777231013093209849730643398256724753,
-        630008249006867465214760644488924397696311937348067131248371245250701061559692133385208170883426608880274813532138186679553747482220484130471076154700400659,
-        1639568381164194168713691369200675903793956625844594902687328454709937899547351851984767399404243915717527183316423231883228752355769024570178002256429524075,
-        2754269873264034516263767829414957943188794413344984689977498808114691008651559950057224517463974592980772173080950699650185797129163398546021553514183326929,
-        1595409039559075212501730372616511902855046215684788919400039599997547392021936995183946625877871992525215144964963431027105696441878088839742527761769257589,
-        1917985134719164731254208443943903038272857951513740853432047356245930336311285751227630755608941410284510702612488328664003788583072673578248557195126054235,
-        1249534185824034038525958265252133929847263159895126638990834884967032658923625607004093244300909391106496658000455050022390329010882388051163076281044328113,
-        2190188689487315808963775182795569194042127983151539259795541283687545233900493321859428060837592886756956314862239294001110637115742696768468086102095066767,
-        2293812258629648233011384933489198432862561213087269988735275867412438403572394384590527137907663308441530302149310080465500021802705462015592552759331180501,
-        1822031739905371797626728485707886128260028180760705036701129006529727540665685168720886777434112789451169272248225909694241240771590201109365297985350895043,
-        1840505104849458454094817020896826632765493106919413387720814865072283724011085818801536915024176335599167876739791984134929086148391625993067899077658858129,
-        2799230566373024486215792256995395504255214957658362230545233938619301651026966712999083078510579422246467221824742308024074456457147934602865890620258490095,
-        2468919090684007525979331515403109127581973201791466145631661377946841598978843363537563141407492455217192890914055725695270638499122247397213861656021988661,
-        116839657733670962224645760448656370363604354209168564352213051979709235277143314222462626708413402802354157924925627953696773777454367538492177926318545803,
-        1497208722911112862518417252670800514262027576334736887114293233799865072301673094167561293462407198322471313295590653562352751542739187469764596707372617543,
-        1372038468805900533905580059231515611770049309182804950341464630974975541321262675886772771207287060029562373331655368005386157201146811992511603620321196899,
-        2484428445839733933589982833093422638027126541709275159503542638220201998444160045020382050606826947711710176536167940413965183283764790026820878875776332833,
-        2310189887511705239544979905663634846606423042473716166532042126426584544033279692604200554600592575182982762664468339869457753857662722491218964516936593987,
-        1010034347645270853052552530327245348056552802733216486534915759419191707106647540330592197639735361700319314595542911503974578061495253348406949128951860561,
-        2451798761560996981646507239903260930356553704427621404269352640520118015782160161212694515929244948572795357544453941307037079261540696830090147453978953703,
-        602421305693566731166206147594098101695102120597252631890132114265518709416371069216156299775267583139833940226172679599354489253057393567553053047939351671,
-        2457841493067973144698399198322281794847298957944387590562753571713667993314567005401093626085339553213974539172387920176589944781075908257187355873812225157,
-        1395459868251543628384653362690338190632809602818801728184972254101271892770698851929645600339930901413340595911234004256043531139262568562299485322827451639,
-        2254737963833429690714834567772858130574472088104663809538633226183878999778276748186381650912271752301779191580855815781905126303592540290999247118618538567,
-        1499856903803817016142684025065087739989775845459892485986987124530560551294764296858650965466931007346167289016322760828129221002850777227935255328181185991,
-        2303720799208768241647830304503306228109996518745597344389391233376737817883406996151714372552473557183002019491035075806513025652574501104377526893775205409,
-        2364509511713804784945463741811959442580712596473178204644775375149003294454002923861735435449216825571627730000997040115862443896957417125275293848474827969,
-        3033683203037797770513016820222946934232003891728162310274183599030452724342398339174593128865320256637080444624169079138495614486264900365070545271186531777,
-        861743758603326404905623976443110491791223676970441639457151896600104357386782552131256655694416327279565889221803314578934050853907772256345805839799091045,
-        834900189529500424142822914786650012324991871541484555044505544782456918081790642661265651205069829373493845773669270820860714042975885371640150097113785601,
-        1885650429147666218722150957717114271910804092128197597587261135101057911854149354836683887294592666362255607325592903711261115921077189541249143917587169469,
-        2673256932628272623685906988291150521143663856870881799890444226092142732661686121444943317203542595159829988095465951775461281670375302083025236975113189505,
-        2531596186857378111451928900004225907043881773367398403290897169700277181919902895442918188349208359219024696768131681371249330403378065685517301934663311301,
-        2590259259253238108666109941219473837481095637275009506173719054481982686665493704006381804643687091107789700911281325217581407934388415754415706711694676899,
-        2390685569817885551202451351409863535837469243416888298168541699075321675015034123218533101845466227142745555103876710868741717301975901963915741717331576683,
-        1724672069684372129304042276864733847023063291629586422313685620738589428216680629085502398733072695247894572596530190239457001443511816111378194710616638967,
-        224055861850102850277447990147024830574921037619587479276465195175481071667802052578986102907007840219047679761698229037987704226703593047998330110414602301,
-        2240015538332894151948674847397026359468279806032609079517626749147585233216543412690543216598677181479322112840346814054178135981828712318735658954696896655,
-        1350842769484930544139108605660209019492796981658301264391559307577400031509073384244439231891255743953183082184534799205405732621872049506685378407811473733,
-        3169802216043017025052250259005145189980993995613901986306112202869639652984221019964298690561563034351661575757935021394590661232288572420439055758708207321,
-        1952688652992298299073887409927197042124790783571773056651385960761154912999255292942552708200239777661293440914182033462342355251797136658542585678473558521,
-        1037005865699383212900159353089412775945589591295783698559022060030850470023902351699070414857959763278136024954477932062189880930869425774024759445362229599,
-        341361226147874502944110500515604867369354093093208379496357668725601872177548211825081241671670556675921062440464620478342802393435531491161594709636325357,
-        2613991440100016882069282022392778987895729362177161025149263467229384313081513585720984624059554039844286223607297690985200723427868716183654014934503870645,
-        177209495553007653756285393762103730922400945925907542879625900303771339149326855321978759716146365266104427260604744824886513844506023478200794227754217231,
-        2247702750449212544562760998138398565888693757351161349523964050469991380831474247828219958464655334253307027860497668626563706328068250111807854919621336439,
-        33731206257927585918777634629131063523728249967583087195642940282986874333584965728615480207020566807244827282049228742991518154140819851091418448836670347,
-        3198454693953459956464438387466479914292530635681873319791489028008817358449232874412693645051982570039974017915683606791074791728606433587154195063367443983,
-        4468847348182923403459742428842387606896507870082048823724253715560372147330036599709619827814130464098780020545023874181093609060469913140036855695791823,
-        3300869139086301098607556968586921006060794631897796871954131764057301362863890785647692286151900236708232435994167394509514650334279411224022941584501090063,
-        903136233620116418668931229544873135278151077172159500470114626939831841799673004688934836151290009056071408286554208962033708271741013989064069671086358077,
-        3127069015332295858924529681063680679706125338166910969372982364625315485891641615197038171466753270381539615430752174669636672730229409445735542899909078099,
-        2458871805111167591946196517600443380197705869050309416289576014657888045276400068419952287338986086300234328092386596296511002498213196991306947969313513723,
-        1532275866137187387133550802124642003221107654500880524315045017182719800501481763776525570998313172332088305705702079892864189673213692272631650423028724195,
-        2066186586959264629126388339749549008626619506524405318164516369473126080446057016261949151897070849091117784528848228881506855072051844941601239165356403529,
-        2825299101968844753992520274651528230418875697685095088502056108180897188117633659881086358330131275127453095494279203504548882561222229829234728652292403357,
-        1470295968849848355063255858822065224871430862736045103880232794934313180594544107562876473149708432848124662898648607401314658865902703011019939501121112943,
-        3065359581678314537752504974327137737246266094245707797665083977540416117143794003567290394032177076192193848166651454942940675281856003987162710049973848303,
-        2790406016036852151075220347055424350613905191925939179666983205829815753020062034107546760865782817817945845314800921713709684894394801844918377872807393627,
-        2465339019194822860735989628695409151957605224910129557712955311274832757361475665493274736176185610829178769978194004469142628746374034637648335414881642535,
-        452045701543319620574711516648633137220535440640989903695227939285002969922563531472658322762978005608550189189088447568080811539413421772273277160372017543,
-        1947253911725097133231641098591113476195699703966223606286321843286597811022312568861119872073634183280115199114774491032113725276188093255274089120346035133,
-        526491371500664523227463874717630411026843673345095140064353249166883767601812312875759747487125262085400119251067443092603772661402502277684405475264099837,
-        2241713071722351652351060202925522423513325559695567270594886979047398815716515029470762600725574384567579958132955121352400624938059987779431886921308392293,
-        3221551780647151575744466400540004038608250219278365878701851745062811229173954493327866099451407543139167772236568170140915883675314609966973556381502831429,
-        629399276382869160481164090853661815731277317078277467427503983299057912359719788233729332754212383150127568449398123503289833618205561913182031320750545923,
-        2526322273612545450994620894785086206592807931097822142968424960224708072751128762800340962868547169245519114398783924980312761653120584136351751661049916263,
-        709641165807986866476535191156032753162575993040417415745431289461757976649484134433917098817022368929208267303886590975239491341558023809924082695689234443,
-        221801676174816484910140559755434291190102376482882536504137545462755668841886550414063479563436240360159423273317374566736807497259071415020730769384588621,
-        24870180207551803468977194128854580253498773423471824377209064328335632519401292919025228876973953924788866454400124745417599669512660228141767658399770195,
-        490234330892502537483858575874388369665758192735841932739145562158347686415871238685569628675019259896072857117935281373876122946499072630596736166111084231,
-        666015793494280146707046449000303573285850188595305725431566801943268902046736619878125537172641268286023782860516220927174474465271856196867217989796589819,
-        406869948398985241536707972924804292500702218477967713023905527679920639188836958690827860273960938368356843770481123738382743820080021560888185588212448661,
-        1545367721455503066417442724644545564054618641205769248934493457419539703004599776322834174421838574938994931724274335978401049638372628489088498184785276981,
-        3227053708567374453038196294752728612064685580119318476467877909976194161751373830305078240949114797013164065926858365269356138723092650023862836878181326515,
-        1325084305586626354433832099299159109639191749248948142042176439504153133468234986109611426245683118432625197214192618828772325454672455262803044463841845827,
-        1492082662311385867833310139888235158102669051964117049884243689676765025166295847093715615340160508780545354642744123406408278247203737293510349030837344279,
-        1943011949387293691276580563897733056140153121455954197086007472216327019935716224365324372823293664739243020521372223485796420677510791931753661263527964853,
-        439129336224465061944116924701823942709818546777590610383790546549959771922646322213271141098755198513707223278861968746406291947583253856313893761636264255,
-        1630094808533362549275787000298464936948182350072468402530702213414035308967938146707484525736319245539432828150070509525578380490417740726253499692084478967,
-        2254749508987755046472681504755686227468348400408000141922185351624944409105230050555808782021940572390388526926266263199656496149120023117381743616793747165,
-        2636361185311278701977390763244394477165272066619839178329249501620003209739177141239136435062835609741532979596049353587558922938223887312282506345889443991,
-        152463666172745447481245627381301691819491510223647207775674215901013584929760159047384332533170896477261039486624447786016381496344877676618473901434798145,
-        1471025504948512014293531797383653551248987845169170690831018349584859665240974703718926057761932917773242001836110195006562129593176744336335251911149340543,
-        1702110821029174874290029574507324722712583800229983158968494187479580562581422269647351252344181326543418587569808300182190289534411018051835556296095726249,
-        935869691754655018436972607995940432755122438427932253018622815259829775410459064993704778467238611668609893559574625899531331619912982456477939958142326777,
-        1512280687034926626494515627568218960047051826193551688481066654990032588676798383135705350426564122918763519029018277686343664237973207236208523485977238261,
-        1567739557268165432287168803723127975946285689516596078237383116293889752758464502687867285406726774861615250431260123050367858198056107651345188102853075177,
-        553896258523759460441965389592189373618366034852171671748120141825007708047334513077446404482031780731868063577656019299572145383929814355502343968953260723,
-        3229290452654371579038067902133440781724767553950342066422513745784466993184241044044841691200615582814042190942774608006397985190592289788195100509536652981,
-        2196535441439873027664218279270672719477937893897650662915948767423877802402943346928489818681771692892905424513554228760690750145184789307107565612336052057,
-        367237522810049069970492601129586382782771330694274938490535458842123525840489914477370699188038980308761082873119819335209808527520827835450459565185831777,
-        555346231585356425613088141980032403156069427385877696726848825610396424716319812239060905509765837392919495383902468296443557777739327968962852130676945683,
-        130602435106633987852902644748691339025597797209695677289275203970488366994033643683296721533435127288091648457410427640927153829208116960184837658439498171,
-        244709182773369304636874382990013214356270104797386993986214940716241553834624030952807416641227700745459361714921009074279232206638828593149288937652199895,
-        2034973005458835479459680660635490536943026756409356515715746126795872270706649279218180160581853799965497310697337946806079567708165092268865842418209176929,
-        353703323021245072688697152505681276385587737054428022271287761278818816474568382073459831827065400218372683123659518876607589450805471169522477865198053279,
-        2985574339552014220687255568576005633348919578841711039842609775139104408233336397835622926633333901819204701595803043207489697256621033623306431212058521267,
-        2375768089714712075313939296413054213098585506806711761596800985486178155626135926704370801750803572885610367206199058043276491590199527024846423526591395685,
-        2382622223796669775585212555059448184996263127656493364314898755768874606940479497879437495196351651827724641102561259575306449811072390750404147293603928457,
-        1052958112995017311246827456670934828555510749544156824694628595905409613587715221639697650458627864115289547562556970694149589873125136617390063225516806487,
-        37365906794361878719431250986578650303244935448387171247243012762517539920736682691154377546284231427485909137285029154590913321356564999367905723644790065,
-        878067615361085079778539243094970989350557925088430844025271664797744584756132594456674140960560994158307962161367333304205153203931488834468377960551129465,
-        160992870899495237079678215528102469448057740821675035020369379509496399485051862945227786553530324630836001809096601091942986020016810162435071696968898927,
-        2558027524590923939191960592137407231332944872926545441789524703043923381279128113010342363454719516757278066200857823986248321214809082116558427499042937951,
-        729941575801494417888362508529077407431904506885731751119353736150514198841180985559800825448267621995867640994891821689251752834836377121460716615351939883,
-        369213227805790236025873425356196371163372934403900066692678961101571694595279554315654444343132723809942403691641608922706008085386985299605416912702078995,
-        2227125333215813309516005125477242782234050691756434020856863844439460732513366352339090480059642404038798752684323181676609992941186253107833786002328491411,
-        2956303613284441645026810978647928115203521834768836178663881517259426604554819319123326584913365018553867546643532955216545047562896410026966838500085463765,
-        3023555616674352370366606403770940625795149459869084926069771732640290540671839537693791063998597616393622818366712724246118813535705362533858926430622135209,
-        1440997016532564664760050953470421723985585279913672908316101920702565985669328473328531807649987734963209330127693269327706727350968748015409961455015132131,
-        1878647482552126009838794312413142440997705091195297296432809696447336336437138760971540432741193410087325054459273598884780660041951080542359527344509779201,
-        281207853277764233452711984946509115887312978901528188862441643193069037372292873345727041843649252502033748682893532396014384524711792335106219457755416317,
-        3121769959181749042609522316503795628532496644227563336103600260288428925168395252890747787693454084894340592815943585886103946232756629657355783324608404185,
-        2114986875293481533079711277963598871378517841427233411680092796698616455021108690310684746657640799857523742248076978454652193534237157418309720515871789333,
-        1704800642895579187011225239422945271658385134077231248851884195215939868162082694450264223451926729433525979576724036753069793107755469874260215717488087495,
-        869542465985031940757336339515860837130909835994711261795427507925338401365042506090683492995063585263824975528666479780301951101148197771622794512548014411,
-        2169105479579944798673009523889218322078660725737794389905978531648126540521032877807211373907090573024447764495729053389699398039583560268044906447916825363,
-        394695816057340297993712349909022526318994574286095773670730101524715174387891587354140869193818875683659750123169655449840779853917709183986515750217375631,
-        870104361445120805949953524409109127361108715083271093591845501227559368822089852774660204395895294018234339238221586982716256997959219007948325601650179691,
-        3083643536173459589366972459987883979999034097102425731345117027507899759756005290426915580923689336432140817389315364130568911439513509539994426550765671595,
-        3059689011751681142898088066723824488410734427739880050594687598922541061053694454458525735776929079401851178302244482347270392327593168378028328296749291857,
-        3127400452802498725277317915269275807033537267064999734197513237024541748870305238417495562053397588826416182534217913753881643570633673055821845250742956911,
-        434431067427627277466540341897626858310363950150580953906943106887586891218350336988069169480330935679650896129249440799421785565016025554747832768017404209,
-        549503319155794268652050183660379980684840520078133919893357996469782019814029702030055413866449605236840776018339374017346076184990048141500610683716825153,
-        1989006846691269237161028234187428583371241209828811930166918113248059759904612072643852097904248714823588547413168802067339308206614287529315464351573603701,
-        2383131729730465744128980846219410029809127306367657208582297173326818687756543405088529207885299612903859146250733956604838847861442825494699387988045291117,
-        323023834504831074387987061989534327745525036377938281120154140942078100359465229490377825734343234673891305010265140176913179711925072059888458049943007329,
-        2806505155174418417457761287607680933439541714934907869519310320783417811533274256455812154615597956852171764725804827557474617321770679164245983730707324023,
-        220357113635520301118474898998235335218933118813703046367887909751292444033212565309300969780355006432667231802174196777155146851453972401862901820047325843,
-        566383031919138675654184009086776616810752923993049161811760842440963631190716979338875934218658448874030068468564892639809248149661751461481326635944289395,
-        1898752629564450368745860815509994391063645801324685862464837573936610005440925213624319762510976548638218821229408582646950977513877784546080370332643700895,
-        1322782097413595508674933577089482562445877880001848448013485562952880529573614449527540964126336449707062139735857932296014890176655820755532547381158161613,
-        2391675746595530787111758009449220650229458726501671375300125815316759435162873886639165076490673083805736522994350017814966185990584016076016911637856560765,
-        1886515501159210175486538551055220851461623965290234422703948333661096286841750009731307079722266963742924761050374086667564831614736962666613769379134135429,
-        2371948138662559408005874028633719852855958523741783812181489979524067880275284967609187423267135099872856370771392528908384976062448619376821547154449053325,
-        1880958745207366490777660454099939863865511173239482883887784396953633821707979068970533222959820085441167129134757504758143516454219811524485785876049668185,
-        1063251462315561687874685581686983564435576980910276921877788599160009044381500197158586797138520699501429080526769918839996078138690256697721711214661334395,
-        749691523288844740495833162349304697772640847268863132194521643441408396682579763718335594322803845860447965506195856251105718707384461185171098735890855823,
-        1878025574655465829848640650726183087734803046861505008273772476308873141874608965562226508215153307964757393453523505352351397549871020746147940904795049691,
-        2726649290139611890454429932772887818887084933795092037607776625069702483706077545503063523714834142142680218029404516749870633332152356589777200305486147917,
-        2977301593358579829566599930730582108337432382444919363874489380304622667306450809024290634217612058568759769454755872195662035626075882284356472539306642469,
-        334670862307146102776769156657186700481193742418929145637261844153707459923572187577526668151547808534612705294699854029927610886152294384271011427183720581,
-        2652987983113467894039984524919355965742103132223441386535412631696589886445166086774376496699074708764451616985027082791867481625517212540825015278827609183,
-        2341131363973203731831006450615253425654928150340484022143916327326233337137310563733873888714849801956670661669552588298457125835061533875769246644598228003,
-        2387905282790904668693117442149581985589508013237745753013344738202948189292994044729849392056605099971557177802931840349670062530776768209065995458594792501,
-        1955978906814396175803296455926933306230853388763046919863134533605805666698512895634459929538730013460491823800407866466990824471598790469397490404224410637,
-        2469747165662148240735033745240753180324216297572759896848312873076592165957783018517453819172703946980000589895354754429572290722293952661150935488684268539,
-        1899022912524701359862296827743499950004255438208427074839495471702192289570474052484682580093633081728885679970572176751220998210412934168339733727872823767,
-        153695702098503794204251233172188120312792173862936810094794244698367849775335297039460725396806590873634835931249274844771161303186279467811591331897678011,
-        322962675248117220328299236887289607135275603216889536865153803846137720525365725743811281161273608856839269100918067798653847743257363932419832736478947549,
-        3269745067887504920938360228654851963352075649402742850932617223301796720387360558139327507961523305922046266472368222593173870082085590473488070224531809567,
-        2566630913738912146066603486320178589238166420789275030950704648254804316884133558371287629153757911345343877552930185355289602862066862366245862028094637193,
-        2355602247469052690180372195473257495849795561294056364399988044646128124287623007327064898541919448605311826252490584872169307469446716201395833757571573043,
-        338075428229339228568949437939693863885063059355892295118736389860523681036088861537138377243203939606828230918612081846160603730374422801140012928562214685,
-        676378110177453960627505718617446488221619060671591732275840407657377870157298207891299413036418759143966965350848477742246200358753082035802922009797260527,
-        973664749712371116778836077785370277367265778021126214290953185795966160066305520927232018670722155727454115468351098361088914556109002018753922512042653401,
-        1466524009397193067349074228755071495180007618314465420816768602245017108745758815804999212546214045203552466310965294354451974641625540134628987518450322513,
-        454915057559500641212223198313178736458198158924127448522251925777458587788653653081263932744217977477646983549681123112095581412583268731924858290773585585,
-        1301024942440144197244450877772224172817079181085551982796727840374957009231587837387543078427660291897602975937635513332588836151588094402980893183661900979,
-        1222972591658596421095609895042785352908952431435883706059436954383842412399694338895043767259770169244054921792126484162072167488722123081543763368335373731,
-        390322002008620347241023443223453973730588134439280936932707811598160540575469404470407371182096868351744216527966805227961825047430258181565101361753127455,
-        1930784703584077688770585961403626865168772244475737649147814692124228196636411705652494001562484207101267286710736375918350359231161849849737124771087198485,
-        117686057207604753679004706411714833051706932025953240549547149134842385400893707825190615359278768169177679148344064772597987465598320702550985248061403393,
-        965104800404467754481817940738664320793077293515961673036684190298724380554004738167102330965482681938682871925135707275497036427926944420133601398186589635,
-        542830698824712355538849346823912338526166201085118354797253889249300966630795899953159098464693769304251943873406180887337550834321772327180806049157466305,
-        2663106146230886720152673697196613079988227421703718591153793677752644429475607951872804770334240477536015350008498394095623315636189169275930238522672490353,
-        2931067920474906410892304465357060541651124967493355204462674314114754447055337338259243748551935131998132551466580827038055050646410993636858607543726197323,
-        1637047477237408455849887411067341081742418976068959987158717626658696228365718550024624012399485727644718479146978605505726650889988401816547669177120365715,
-        186539770067847324922685310124834206275628485982664141961953852482772754611487843086882637268113810189676513686696863532962291585949882455780385825991689115,
-        1566728527984051594934180916150279348604094758596522747592290024054942828191463272310648148496321908829273758262063031219496759278824642753519744474697087867,
-        1453386467343915933327933242313967637158437844498924360597706595570447011840280297296174445966703737079531798243365245149788211827953243520940635035902963067,
-        1096558156670687988232352564845009623692559196837110077259459296628999340251049584525740708401660676808864728003477360670648652872803237622380278795878662345,
-        3098427845419595500494789093324904933167308214943775039826674885471526849770008889983532786805130232891121866585529290119225386889669784385430119379963566673,
-        2094560879437886285383589418462799578258751509946097344240481430791702867513682665959928094778479119268524704278433203605728522820837743970830136666575166865,
-        1672869286210266957704831062745576790647319193613609328373110252694889849144776777632054483062857655257422221064885656167888298757807861405231751620715040347,
-        1176791980731390253047435970962782022183916578023693263198906209087406038197862113360426901427728206035807889627362568130496221707511503342393652226557784543,
-        953034925335433186865479015147161728551767045932379508104615291411204278934268461269913016616652969266724523259200913070767038217346172427806581864505880145,
-        2418017737163683818120530228908429148276818710544855247321352453861096410344003429898903366918740609347533074773332671546412030908210295418910747018533955661,
-        618838373396037138723261298939959595352434317346830022896004298656576243492099750879696544216522711539344137903258466679174404203970608968710795435676157869,
-        3256989333280614125655870762228298731142127598868879476606175401207690863616534506012979390861131767593299649567931805252459069451418625586446938492239153371,
-        844387540721531253374373414367764702207981100199629826155369433420599554403930061591425098399309608606103819405771594900209343620215517852467228180244376381,
-        967703777266123560517043890749689426136763513325623601686897940716979166934178670257858177421066491086906304320946429481218708602519751594320519170948932575,
-        2135711529139175359644746164847377625172425085724745657499029597035474849075885858810804348329120209030758786518887717551826016310475267737510872074831445621,
-        60079900661673081569557135927220047190385430299203097476289859061772964455319405265715695363926789955315181446527325027666844022910636787034730897556266381,
-        1437397286218117250127396806339085817177193257932627931462639925599667125623315654448081966489827548629202141291323893209253380798452790741145582293643939839,
-        150453985021419983355946452134483952695747589384991679270286560501640976936023916573491590339223422592563350098189442128797013522937887322686006000084096841,
-        2859235307717266584463406999802197867659497544388048268147235046779044539744483577423319691422105326304417596088346769292036713693386930201772357384504671001,
-        3400074463963870557174747768869522848683987494515057625785570644427986842865055334771993628391315195584441350787161685229428097549642753254114750657335051675,
-        3431488917860374417598272294118366557660509075196025028530787505319910603233329623692815120736229300605247866308791012041943922496518857344575887716649779177,
-        1356202894424793744048316233950686161760174899841683332416723475351294334467467331352255251607963728804734277158371008002486740278898890036390271165629498097,
-        2550928471024472999001468627569546393765196663230985197436991290188484032081872415591680062533010264048319912228998873496498246024486272600989453219471794255,
-        1744884900727657108782286408649400070016078471307884008354356453787957586575114185602621860229987032579667494133549475657169632057304032649210259675184325893,
-        105614096707963117422353556754964287279057202756967318507514353011609372060519968739326586642155579729617260484695076143315105130678808222760604105807725153,
-        3143709239273603681681589569369494001356799265407159507799575421746747073519975426200825838354987501716228274969881976761589296693869491259763974361515401275,
-        2775455594195166239317481236959614236107173266068490082950932330814676278703748859979460643844641162308398544198807478869891999674052497204044785845146651019,
-        816663464372183004753414931243860465678441893012043479515099300008300668534870883683842596099122764540201485156757382191112916715989618572365161774717538311,
-        1215597334400195408533963870027344628968561901339853776568179313609781720523531613772963976260979872235270107146122259683843499345473804642529893905147851187,
-        1171214829467072606452637137917842363314465971701011798485860752456824406280836244272739761408176272005962802821615268386971571303822840179356870993966100237,
-        3095935978757250562273795563174064943604502943066459650844086807242818572623950433174957636079147776758870554170095505338696662280894043964251514638228171861,
-        3067473882792716729361008148601429670935542040828781348991444971293232404460069051859563074066712242868760531036833908176349909650331764776083062628066106499,
-        3050437554388400628162852035789773817620881920750962298235861520130025422886312336530014897061895580618107189720100356385255371555062799077677985434897008967,
-        843239396332869709168304966877660111266062209672689556729213688399355008668226993533358411132156353819928388521327515195603370794255596377059159358059700013,
-        1963228712351646440499665760361891017037176997419007444675862666148645338630425329274855040001611203415814972069454358674794134196793702628848587903944184851,
-        1485244947319129782846503897596159862375069236899638444446089234624150231357109853181442164171479174203337092432158813826071266886972070749805099515593917507,
-        1924471802185991043741527898613559161787513644196932272484602756984998783521262967492630868037072152015197319106707730671963254743404756134691342540310727939,
-        1038360550538700313838858978456456044223912755032341150250953085880609294898419736860402700470929144272614256122162835381870413496712048382772327943360412339,
-        3020735483280812924836964691571216472071795643940970385968165274192084068883726080253269878905356055734656542909396194190266642123941609654198032651897368889,
-        2028161479571962333980715216062049106719182278822948269748712223477042763547927521043129584130104506690736515988924773205924458190331712713272028856601704773,
-        2653705982664002995004937622986624175990025738422178740556278496172945504519440514842977063177827418216545154529337819967759704797688156147400338980309983287,
-        1353470643032669156139008568762477571222389796423061890773591176398024858125162580408476301178388950061769421009391364052958797276416349192123663599564785827,
-        2664734269486807965055950623734821481893539499691978248100175839751011592326866489462766597462649615998263470075798194150656001265860204414112088401087860171,
-        2770081304181962289433630457198571655278587512213557238478323868145573116664335881389082479106909582160515976136367276389922663388525816828296094997219840917,
-        1367637032740140976820587930678898381597272219605483609029890032408898843401257835712507592799843160837339764579509667832177807442985651833487494801021372845,
-        3345049780462148051411508915014839099548359752008031446725495989762539016744568810413307565372872761106908738901291825825494680465670575094663222574856441445,
-        1994695269658564862337626303432847122647897552982274264323379497364926569336805230383509322897857110844939472586648386516817061986536447854734980863140211905,
-        1527245288445637018210160200385044034757398473841070380910834210801328605022210729027981525758247838958382234232515826049647213822180362510178625937423635533,
-        979171144855086978121399133986219059909580224857897889341401168754387609749385508791314873275225163311689811606434308698786814991097811951954408967174834397,
-        3349942959809856076892570378385208560264181860306778679766407152442544907819766720922228598930523739881502835384297616304967269376845595304635509845673013333,
-        188355058289562997315515571821219147651241661471581004550291203581358169198193732981872419448398995299709168557282203651079302331699387570644782934840659001,
-        2544612783149383160641391455309750401738717982614861939696803036105483103660802779856328200759497185409752233646443010925147155817451586425337909832108183799,
-        3091774016905470528844826508889594445926567573007278217754756244293604493370211120590278537700891696757040978335243279223722791121344657865830808508755189155,
-        2932949676335900651493621954728561809899796127789804118494142663290020091878049895938832912685794094185119526147517925311757122206882333063373852107854110975,
-        2552751780094926439699608848666736211012491366508212431346616848503682226182642064759526242602843067476432315668319517700279727948285980644911555561308760413,
-        3386488263240917112312604536984116617148546147376830920577711637069352916755314439755907147962056989510218191589790799410396241542426614089598090333228531481,
-        1465967946324306610354030602413459333578278600598082960801025374502484955718947806262839620057410046400967120673788818841430118030984721490313812274814678841,
-        2483292925399218963580706367276612647085158133100719561280686296159910893632210968449075429864097345005406044533526609717884042771902452302611135343588749031,
-        2979892990326805956842490365261567091479068209441830826472499105991033461276477604627360136232126536992810915882952764184283850261019663045501346280192807033,
-        53998730600909435055521616547346455129948999196582667940636629820644891066666937411956471619989032755660006950646733388630889994256678748033859095119877471,
-        2590961497163667573678412834886122703925032557233483990264621246204908498150250302627234469212882996230304578679080661014018762703569582709909585619774154289,
-        1911270186374732198807148190683814029944411630705889089801097967895539156391086991584532486542798316028882311357103786934294381584417229181584660790467196281,
-        169853340897337161937242255313926311548525022829094942693529895277401378388878763302207490151413108614769127037796994002242786500215040551452345807833335437,
-        3236475151337986657804925932885874965066093241413489549114609621679113175969868532297722372900719662088963669542398447697825913464450446841013224678081249663,
-        3007178410365445726168959663706873495533809436808626660958027339558994177192095209060653013043268653363696023672162880079730143243107775400549211724358717957,
-        2652800128494825633737196667468860317541326149970782070192168358465008628113042412813097164045200076515415217504129505048548961628096033945367932458026198949,
-        2672870820054495153776116295626277748140602803695438006604316129611397263859408378456170255321657794215076019406227444806546268167408965150978588290872591955,
-        1791027130919212737544128066596874751527600549924969679052847837501614813262023914005555069593270968409375950546198524194757909400112253919357580130086048509,
-        1198910360175528522192156619758441608632221491327463235256740253967876496298338005672857338113860725227558561447843701390784498870258598706417186441718529613,
-        2512608367617350773369433244402974590231123531021080830460954193236371871294846344621555064047090195418008434452409549810715360306108024756917027115855758957,
-        1998607890677743495459632192514808024543136066638239121573396082725716398755661918130032644208518115525800788085981091826433687993418879318971758276552293569,
-        1719617819489344924079442479802560148423568513602409351027025785114540210183085306056542485234895860832180616595865320459889465543683474385537510784519173301,
-        1516504617627680750792057836505341840029866777060272943527628145284796149803692729447086759474150754993235286862503630886773878118584688369624473385342866301,
-        3136150596031503416313373394229383658627927882480622338717994777847163776698101394561614766786057624600823354249135412391424750679075911760937491152581896265,
-        1072519880068710117401520366428000900104208514269555957802332875479974538564682256772701753685533750874018703963213442667758542923307647317459456174170517011,
-        599490790304360640770809519139152099674090402114032988886145432875939436133961311274830015210547663822300599729246806960055057703641582399024823491377116123,
-        1728667602931345583385894639145229501361986707178663855691142757805587987820485013900435537263705168144435485288880588127698014309829096208069676552958354009,
-        217498321206455582069073929168558363825556044204940466250788540634652690190623484530335945781070103171900199962694960662882073338918624943872566615110970069,
-        2946566136350574355757338494007386855146996930731178094496126813881392578246193346951727035214671583325284965108302183262987202393866674461601347182045435515,
-        1686305591744587720599008911138366212449593186950756701503295042885059919504796411614531148037090612584676402280763015949430755430891265856081750847613470307,
-        2616280407344854038239165680699478208751258196812034065073076949997598527974752606411158804069753969530458715312017079721056766953712776643205916711358253823,
-        294348471657655302587504486445676500717300909839378111750682128919793803035966866308558417258052785717436744528127992705203168712007070541606815579691959399,
-        3347594695033557061488037558319289081101198788345911486928931334304147505965391585526920555476197720135071282230422291380267720785538550728640718567776927909,
-        1430476463839355748621664450816269957177543346851930564417015422791508193116486134852522702569347242390831923200459678337429866519457813652934299481346826021,
-        3098732714616481752104773327575494782839748658273931616185660664254528016341648027506196893275083285363307051259756879415760521249221445860235691978938046085,
-        3126219181237140183093088628328384659424483325291180640503794807830733507188562118342128678070982898284454460918315307221046167050616772602178069828900132587,
-        676166160911141593637187506985662089065354171764871063326687164257631008326883918321687161760394242390779853702415480156389964897541721537476684641510572611,
-        1233866351354143408426617721623428791161553770590141522803836134370823237986757570242592707590376521248110557639005891512838230055242568815283221821129015861,
-        123531095993872039571537944223277130558565695608827747821860331913538379659901788789738946649630031428048098570470521371212071726220330189461372210811304749,
-        1424527726348603915598295782681121956846402818205474375854716404913264030577381908638139131435249986772439362259960331108949948398891749077412729555727122535,
-        3103360914239689062566431035270071455335366795133571931327660008405706321320236639976619181210802935240997282121198241944542493524896187031369503549177637901,
-        672909654356222789024459189066984788760415722717733473949079359460230299583451882095851336643442636517646744921229830165605454885251713154335967979728562703,
-        1749391381029489688640281128272080009493694548771907415628673332060126732383979580409743131295677871551525051576411600426315594223739393440533935422020057437,
-        518043922956850844977803013481809976909469547440203739796532921732690083583741795789596146435528775509943578998708693327314712273536564291830655148372945303,
-        1382042498567076124799442986090346790138381221043562073432773088199396515907566327496657553391780422315092044979759265861910135395799484689925384506860205731,
-        390204880087958930792826963597471375716434525237524980358033685666348254427405732469131767988560303300043607554036131124904923533840900365666677012687031237,
-        3107407181795604142338556722417052666302212266330907350069512295639270778373971737618104195794359362112618218076384515175721207793622882911833831939157324639,
-        236044130001754314057115839497650037396327763787709562084624877421182368685387501015740396447684978899919078115662351199212541852029460114557694033986410675,
-        1128822960900510950750434742590195296494235690335341932931337510677076562809263640196820339099598743842666361573825491994967773467984411458676250020592251125,
-        2835701990198455073804087675253983240558416558510480432090795851987836127767369484479722753642184550112229402528632744662444407079963296630047255276190361037,
-        202088809775654201180301633557759543130275996553238577150523079612492890513711437511920184417008582625779695500814183301645841129081682353738519652851908851,
-        637859000754569898106759158314050090440166039804335302846507345798199336918270912134061185480449645117822639100891844928500087880841988697023554076496384985,
-        3075907348287409836489139487464575004078804962986921871770398110328578920536558177075393603976520636943381806253109538132578924784391802812087356001237079945,
-        2573582677181760920974054009719635951093659886283440992699013313980524215554715601631406790077944567307504037537545998835340959092276927030140118929308610119,
-        3234461122492807104517155059376290781614391360787231954372197448429117003194247267720460221213683356850512076844535826538244231903460999989979980485755881825,
-        3293762348395316375004540517269193974948807562011631253103767059960589102628867360048293003201395092263488096442817524015283644486420384048685521834320765073,
-        1626625576328709282446878529992524210533489781133283603469031734385547858438598626485431994514766800325562800230913670921902207015574293812048066811620996261,
-        3360573722902752753425909350838159760783108884189759730464242045323228641708479161816142095468655067071778886855394615032433230379168131791282204676036842855,
-        3407986725912033729699085946260039832798235419679224291991360716416474920364648382433559592513928948498712728877044836978199973118833105497186093502442944325,
-        2565569825691593213023205996669363811759940539279914721853117590637584310688266738760505493274735361308998583210619496013618430584221522506247209215852369667,
-        3275302976491265673567199393171689957861674915361918034371524158951019967654577638528862961387471535944848221190458866278471095255066188004628690190484904957,
-        2261152177561437087778254507679760283639007931108166419641510210139163118279894217364984560186921701072556818788362347483927629762844224228809939704930184267,
-        672774247518940958096784920401431904752667397248371529780369903113843230541052344692962365441919401954613577710278082106788772244043915466440467860934778209,
-        505896127452144171237723514651215203396789118313213667996516397196378686727977793995376504776959236588048429928589188153383685989895355671703179856087462359,
-        3216218946937410449273178539561037049877019390803206381080205840916785329089193934146510466878433042930030838036459969110108166547622602256135591105778345803,
-        1375349517555071944002747489584095178340312874315230471553579496604100903114045996516647176489748603045780608772527363514572816927484619550316358949563724211,
-        1601809686341434854639210297368896815001876594422029399911562028668989067843224217626426030647360882025796211282903982317286291460716743585652003790885657571,
-        3393385246143336115581876156501359851924274234481804598026018138401614047062774802962349754654271051715838046472794566332099191271297058421584120129178901877,
-        2019199286728335038244207430452775341453140682529336388002956239484839965448960369399993078393156308794498594452362771042607484238161122293155109371229891703,
-        1073317722004537744265430762606824786563381372096656534143093099429183377519887511575461099426384897144198013978873406322381273017467750052148226604566114565,
-        352593657424425991015329081700665302066136517037008231650401861212796582044719952027607558754907375211821514214671051848679633394705390558086556523805585773,
-        884125742014716152204229195730232720950139519174013200738756148026208762133589303060623810626904023173584233663600058968645604875959091712797606290150317661,
-        1552983655639847791206484934458711682414981527851395751031415158706596117994739412473141820132244882560630835758589064696703134046951052811628694553819247051,
-        789841435385948196443588302513265151906775819557375498497109984249219603392180883137254304476487516243118514061674858942715620419844015196315455990570897061,
-        1423417990827333597989150726310036294345881633920872446982351141502715064187430143858619700459711443559854661610314650371133284862088002726289816361440722803,
-        2739580358300982302633059518902700204378873750997900579254030663592021473642569335263446977344965298342158222954238857708189536782681247676570312066345343803,
-        808329495611743320434680724294729815139277188659781444102260370741674791647026601617647047159517597640688713345991422334013317035276303194115544947401235885,
-        902967967838721834071013254913716067634226185987692167220328995828240079960070984646784570722368045469834990179651651880434081985305425183641174116518654927,
-        1150842825083922275717158630049755620233989381655503182877740453175265519786877263299416937895954428087981639408853045602562870640504897302430878022321214191,
-        3119707046942644149868354887897828612877955053525944769080611203034602350132460000323129073464929908648522361582139489805798615912254028468341995014610539893,
-        2043850770311302483148474663264476884628359939800315422609747182514030741726532551213372386908921383330257951347220949908221500008565193520188616938286576707,
-        350506921950506108229540475287572557094840494147746688836184403578133584829349485872176029510711132953224705368182278802974880124742626817743559914645592347,
-        60275126270765680207945316286337127819138647571495849672412716994455460162203399970558166234990355997673464982195995430643272257322738061267793808231285233,
-        358596733466572674403183110808996013815817073118376339228285269010270958191162319138942767137006796663846619834411646454096940091175015287091126973545117249,
-        1193198665892841061175263806338022856842686465536025911892154584682250374694098342513502972748116560688635833250431291916897799580796030208842544492960826437,
-        1096281007691899110353344243493629297435915398765221917951498709876715893285291088381354079326161635676599287311437402508702113961360067419228536883090373229,
-        290858355542680766221783678432548710673119496595249248275897008554272834314562352481293685741780541689107062673056284598789160330704906072112811985202543227,
-        2825311601443731045997637009649230988711906569258786317413606059004055661558825244773353923797955979272879209654893993107894829473489799554025551864278474583,
-        1738699127507788815011315501749486403688466027366378616061312130998387159027761739919418392156670161784609938054551233144043189915824703931511620283055001487,
-        1320114723500256592115982131239400347659371563719468563199461327071589446516278457808022971154980349264795985786491472265285322942538038993185743562819610921,
-        111019416563012098099482882285954618088838747084981014262471799075259800422752751170721332762857224082039059322449438223215684017646330011825287619345789407,
-        1056965864596699248816741696420039007136187661023783623186390527907640147014468865396568632535224469346668416232140018800857047089156758473543703624599392523,
-        3269997539664941174352540523626344466440227469660135061474400813458633931933059438815869317445479773290326162585057378526901113431077894984446778254365805163,
-        1872019977287935608223950266265205425501878285910979806230231062977417738115960760186922292208641800583048957904807789037396577529510340905435806851969689723,
-        557090130555090911561047600385432656935661400207920621255615218677770263925802126809490795248691171391597169587347503200932407099576345524342866837364937593,
-        1263793670987139194301758330218649702901452910360146197474811752068232134670848837431860717203964742457001603116648292922141048317187413166645725945834070719,
-        2756318429904414557863228240104969128500881532259645703343205704329325987525221073679186430824307804522699299773741686608647777778706352013530605659452319255,
-        2522695104150346829320669614571559938482418935408428528930833296517916021501944197941661037176529126850146986301975526994558849086098512013360985739021760509,
-        2032744157625782109567211247193129459181725694046487196710234953822249504642853169248679738018327274409177817159313073488635055891134948540723448511510759937,
-        547403106496083857067961629895720860749944390849216663955727341259203167988862370524936380835472276470245496170092878742922986174727323250820218377302786155,
-        209766639800047881678840895059532721114148161150863018221627713073757881023239647722717587268404490136360540772942014608296887426431096677504781157957081051,
-        2303947441177369247170649489059761748779616801309325760810680681779844171485505570373109594894101378577753163684680445894354304396553912459090940396708277047,
-        2361293036470993764577675143521994597472603900829995315938383058004275825863805461383176008521852165440470484643186668406408023598621459074434560866565284703,
-        3393921585302286054360725899071143912102741873050420073278494007525658889841555882595605460497907534808483223578984548741815726795768825987347762302289448675,
-        2670760693662502984315115334582190475669420872445728089923328303063557427807749142221508280303414763821244850966416738129123495060181576143506820292361853589,
-        1045647055362864384377613535079326186866232572876858870852337422919785124524905860548527783076205667823025445920415599498171416778119203608562439160628489857,
-        699357602107591337090264863498945933904955171362779616808547554381866300730093993948471440113062828373275606829247628617216184525235003333299172775745238263,
-        2405873164781422538964231660200208670715656839942235723368495812431323016834831048031608671321250133992824745588306571525329480517733265037871196106782405961,
-        1244430194026061553226204259809205855920260554465060372466079546493418774347224075824717181163076379467636829878360967933549374157050988084995595370794163163,
-        1217613034712209596629026345473479777701110002154395508748580858983284847764349589864801997624107029067621793444338330429735587445269448339344307201991073939,
-        2836768114268206509187563041707529594715374353492937822547550867125776830357508735153964625866461551424486659732315989327849001974642543983879156859117528483,
-        972868388622457518688367731558415670422808952986323230046015567064182259634402402544459675520266805814813709354267170254499740507292300539098025800970475993,
-        1785696471636315104591971995784882599094457848041512919347330607864572029385217407433187993124840142713019888326544049529678487487562579804432246535965096993,
-        1215951393403986792645115481706350448412613286884127462283276865751649712934946064591952291458212955909550128087953451706912649211521689329305606482856110773,
-        1057742485263355882636253925748548458410502042168336600926328939480833740736271040441616058425425120975487854941232939268444364471952030933918305081479131617,
-        2044614937257821667963993549146998926605579239605957697211658104891668854885562604452593280839759574260935174719290167033038757530246224729078986768393721045,
-        1561610418360566463808768384874212980770954142763333319783819525338817702519554517382910011912568992281235054812251425511307299598612994993620225207707286827,
-        1235021642010516129071412662708461662684768607329231011857321852085318329406795746754472062115376048319035717768377404043950072565177900204816429405915629113,
-        1189126548033714622172128832171576097349598836028377610569681551713715283871030028802610064818630612374786473758833291949267271444400444119261282186185416551,
-        1782250671266834146218682709340561299415899105412615046299087659982013161080011313004943180901810401093394919310261486322525221283925952304058215373469792513,
-        756327170450206205830248977977480484977378316183555929797969944198722111665877685725993197340947719086119077457462214744195715312361510804770269202670325297,
-        72111425392356214635798139361549345909645168755585704431759286731105987260848957814865745660911409690313003798829451173323369361009477952742631478935208889,
-        2896036124045847565930027740449133255611648892727368905213517854763520044719106629313253322285113820585058914450772299446294202111393844042691164998883520053,
-        971776303863390901628565915332282268136740889407797868676125329804278016222380629622424867038819606462250172699145983518952497213360910719677521328492503517,
-        1290436437057999653375493212481108366281136521678979343480437240766592786297732534500455653052327378634480325980840121141388925982699878897856288693718542707,
-        2488247099932609616249117605159036878863359474916029335438899705702806618560836958242652952626780651232211781476381298315229332114125523022831197410690412251,
-        2977017593115228536020820025069914666820395815888116578866262676047992837802370800762926437607441009016757894020052875135894901787495550853496615750638042205,
-        1109775721771881064765563693956912935757609494430363965777920235346506134281705522881743066070829782241169796671266865554797532518751224313330184689630436289,
-        967488941349928780591036839098262349655870391697526631689282286777620065956378867880709904805127111005742738944803722578339779941242006955676863556154992205,
-        1276204949688398225551194615009898694217382878798584834768226767305788835851528938837685924187613441098606164106587723524944092826852373983695912326351382815,
-        259627886170086527074965470008266563784218912706093918249809695397113257579036925299791259836468801052084681224840773758469253609074158910075440118545737173,
-        2571202335254936368746244569872860036394349113291340329487832204006161818405746347922994611128845208753086073086187178896306165110456094114614002767303004875,
-        1241607945677776414250674697580250393702651689699529971323572737138760722008636497485759998124246685234616279791388016967579659815169415138123080862465697365,
-        1400711828299553877994673923790285150315628532493984924565723231118369021010045719958018771998163511090399339960019545891230213982659273023680778448590158273,
-        2838431634057423190860548110416138586182170649990589271892516565522368066272287685904838873026810157220166925286280550278029449404910888377605523895301083543,
-        282551473527930046616078753543969167788095799206492898655706109697175526000605331549077013481133929719091305158125692650999708963175601136738786223589227747,
-        2066129385200388052987669390717296847573888634259223067149881311865287495518343755305811949688364371889421844659611805120165199003149012536858799451118352003,
-        2914102395513891526459887422270138939381388634701227455024009440750685523060868990649266668853380168628458134491374349494983348118004434521502516605334186475,
-        2698348051871901183218297662730483721463646947308116764373657581405152406978519716582467336100351022058570678916069635226023247355688299118741765606463710017,
-        2880684039749462554018517062466208309296827495051182294493328923358831764766027464987491919072794915195234864086327832087084945726134952181515978717423270813,
-        2562095886518048429775185790881519523783841399356385044564646655286117630462080085527569979160929171079627654689694131303432816265734342135387035190795804503,
-        2067379398235114706194055724484268460041540029735160488871607302114719032118546779513002087143974787153435024333510307097129908769631249612636779491266837481,
-        446042170753404694257213464803700598285716418431687135637722740739948644528923111406355528487553464015846962470515561358164912204341231665857831530150500785,
-        2796870241253562999105095850818079554962562283885024170962321359523258619193652258223801778463407564856928232946537593997445787219172271730337665950062770913,
-        1346269248875669418316414184638270959843354306297618186445838440522971894481412948925100932401254298883471443447191192470804302950865056959399606448272010509,
-        2148198311417162016916995221850511437761294825403606398515175643996748682315437774164756434233080042270836033585828536678098837101744327422073849238420344225,
-        1212789628128365323769163185386320462989381293548806185601637252250269720531713864359367552232753036101022558099455006430620975553872432926749798539849327755,
-        459839269382986577353339791240972184371767413196454965353118168721207171721128846351406165123093350530761166748056605353942290187111291884947609165569503317,
-        806639349575933105553922752349658477227698812370125484112004653488036941114078154633415605589370127886131864327477287749349911680661677673602892666025542279,
-        1303218053456711054233789320633760165708905545842841684438507176397194468140647819549953136762181227098505110261036356203356292344600769717922802893746293787,
-        1997004872338583836499708885395218931915146721119068154486729777754816884526920538741694230051584485469131675670492565919103438715256567114234875769139660987,
-        2477938309431386389671920620620893865644002524311239131575708707957633637581548566602943375437735478912578776334845277225215586124967250825190855675382906517,
-        2056918628619715035780820117579276196223668829912125783509139931990371482384475120806007358227958030473757573729368093639799108907049140715339193940403835389,
-        48407272090179973254132096535865849485761842877661163534344987690794462967895759096905682717857119833012900980798762639433362376526948188260663683513108599,
-        2787339608369422087940239014655449582122507382734498207197736959144837716487723368454943693149481129962227334386766980858401355877708815735720915779311002843,
-        3309249796389884158244854772257330064356200167658300405116711751988461826927445819962798545062101844977560544979860086198387365579023545822409043582331581407,
-        3157432511357014404226870550392290707383775212743383031904291373124602718694397317425587562554028615071953365909113568709909258003754689436102029034192268935,
-        663298060628028372738489856695102672204414614559320885483892556668922402755947341795717019486107326329012756687189667338650717638064045438865776142513727311,
-        2249082784593712525157546925050039538747942843989179815943092090070037592483540724235668481481868532853339537700205909749081715386431566869907443494087909565,
-        1038125371233349090345520305835945189766901445201324901714991286788826683792715146364779668127069094329742365595032751527281540803526072938260714929746041983,
-        1561988759946210845032478855597113810792428272169453951130531314143720750931307219324126841114100043478368861844548157077432498519082504749108884603062817167,
-        882826806196596405573672942715347088044317225247181927107188730554870842068332164455512233301875483744408626934942557839159159947751398995425120014348174217,
-        2288401734763319728286265522575765648656433244853324047610329048880696994404736148459586820979969917126711104755145832117853754576602658287026999536567770477,
-        2789092032013927730911600434622551344222087475126867202720634457560859234213253132006522267682793100084545366213320946978775590564633468565842855377522604719,
-        1764663650939312955216998244097321814208828096149025895382756544425931430086958048822172858912001427770800492469101328225181257031232995693942857382623936641,
-        2696607883274686556609289002520935653060575573811902507087727681651716390397712670771199284623389907942895959361391390606592870358290265880716326563837340279,
-        2752419198620390772371649568304342114213385135220740777489015561815434867472121318542140256524137671641733305700733547476746575400834645579225717407821866489,
-        1625604532236052237251018561309601178805850624676670425092003615491360039391551242788642678389782448994625838973397890504963820559663273453250737975196676483,
-        2343223952937796569292890095115789217600478937038363848651998192439864194298281971757558333106041295719858354117442715872630288774831685703661025771740451399,
-        1463494048096523781937241258176523823686989901591498705953213424811962502050903327538875818133050462681578479405196353132022730849997294675224265405387934769,
-        1420902843102868443696954766727240378190877781291075167338664976268563804467360933491293588761974527860484867107204325856201814073788276232294609699714883929,
-        1765405518593981926409812019316407973037938684134860235567704844043475228813847480969426106402495252510654870114336987564675889211007215851136953416532482069,
-        3084305461163860940750260370924482902989560810117890729792111010235157647253625951523336950052382123935539151007903345271112531748618940386157191028644463021,
-        3416798205353840485703752410043906642404246953128388883731057522069778518236453571238711322577157395971447737543406679182314855689785495579085494914463402031,
-        1306889646660481941447599301873949387148558843508834799397356079603723188600598145513063855846902369010629064157265898518238376901293367560107764530480187189,
-        1417683038608967241517360407282304721415909413002200422727182740090617734701393078067878161479964213163791091466730340400311850470668996124211876220659165439,
-        3059766195412544186204028531680339107564219448148135135831536096121435622765328240513362238913699398347299301599621178452151200225562476354586444462241042103,
-        2131238815281609683526843700982937111171114474364274032984014175735518241327503084099293409835592452894406004420128311933366927020058884538360768902630018583,
-        232965407226015843599006440690949264833082928663104096243163232480767191829665804747937883925624194613994161608986092097429590823270390661944162943889738463,
-        1825535924674385205278875018072730385434613225139482731030509921182838285733445505591875247042433461751211990188591848531961476852351160618508836693431168655,
-        1157906096852358934883177996660273096827759074125817054724771454151547743730701063317582136424870472462097638308527719081150245653410886751841471318921809461,
-        1570550143236569925975570665107345129568395750333227349808568885892895230875945561929743564133065000157088229504025514536475069657347346006864542528235015753,
-        748733831163567283121562634144017839962033351517813191033094865710504796255211023554635908088725089360712635646520169636283096186451527010744622757638775227,
-        860557140136488963638958175985610258374666558098495248244818272075638231288118662599531453565760559568094442818017644186179001321704320665104796712243334131,
-        2686186352351783396385089592677272528173671057972617850503226531656836037017671761305437357882670001276428249103432446990149343890421586416616298970271751763,
-        1028739074901713839991322497895135471081489715379795710367092348585146834328178962418083595059037435563371515264342689325638303234078041810722512513425878183,
-        2554475502315735266173843063132430154287300010636746159194395756433078590018732919154129399147687979721449737510360962717339075574583404437395331335919422253,
-        2679803324577293850378265194655667355464592371771753063203264619216770379782640424022119501388088319152609390092171340975769952843415361256721878843243551137,
-        232200045503076092663574559278501657474255264187364739207923822405408403914999679836385854532200238481062005623989272705154136943111302569331147293988489045,
-        2815811421899597740230412469539578524836821943676752025714143023524132055402475191609748775783954132744644890260236689543812186728405417647276862227381135499,
-        234870138053048963400545294105273365140887447151042623568118925451024764718339370224818480179417795469250754834090414282419160989966990963436879820520230843,
-        80355315256423540871672246060399586008709772531179176173085754750190535572938448598020410398053661545595187272174375686952135952239565449883150447664363273,
-        828552334476768423104566784220745417178929498187909458042663434435997004998906088336489861466421630747718322897955081025826453586992471784043423404325778493,
-        2100308926015183085518453671840984966114709606364642003324728488689075064949929507896262755745102262666065024440493407501034944629191579914560633615153601919,
-        390098873219386711488984891820446943099309270694288301416113459530864929441418158386151941464143424706428704544761976283809928699988434351643561807062904513,
-        1027010871529140059236934601023882752294728696582071497915241885593514853319842069031528798391452768512551779161294396136216305689160723856117245127360791289,
-        23401090522770848504430469974982059181499330117732328929625140506105228332435491399046363920832217024292552531573377978091504460018124730524823488638699939,
-        856757558393932334888170863743273385097572021897215952290213580354780169967726287374271788776002310613805789495388218807116556314651879179374581397577616533,
-        1979524470617900697171201187026773599124450190646744204368831713135099130476735819364980253256299660262363398946744505734984252395443880626193598505396079607,
-        2340999688515494050441304281517341916738872704897609687681178339753210936245679912494084412292047805205957401971792947999122547563655920922571730144276044655,
-        483684760762640371567625011091048656552184909161874347110549176180087232850157989150701481475841671371143875866237655652768035858332247124102972982591616159,
-        2811440424624640085699286107505957131478775005699723455062532085105809010447186887248025251135602704735438066069764595050101064221857919795427525240584084763,
-        632055078319052405820177897209626009983173007707573008671684145753543687398284577126368538301191358492666580652789534620175665612729995744939359408660350275,
-        912320172616637455304154834351246000204451962404692188966788231072659225475241891238438948061074116811026173760975957089820483769244094062807070774672480307,
-        127949007589238823982506459478631094540845109657125041477733249264007702036589403669944714732113876551432215518580349428623265633046234196784091592403953103,
-        2921556104922768755889131034729696527037832377555068530989867290798281922055534467758573615375216376469806281419056026269795046762650268075810205681292925825,
-        573803327163988434500472078295033381162329113711668202844116330880688867643579672635167376198044201531021564434126202069820470889146845216596733734189010045,
-        2449779807997846857430647902425431269252831071840205355592416523101707232520079942256716943091674198792083397950113245681400739094034876505447673892946611229,
-        1644133230444551397158154867255232529479198819558271205291919679463229284218770373789149772478682868482681550832303582761225003789843239581693577960768563209,
-        2230848938275766998240136015162244315450813755070944627957883998530759942646570293295118081610352821751143401034346154886078871359629296795221163905465801047,
-        1205966658292154881826176965179155599621822531707444885972587063584777915195257864864376998719977259530724005578898883740439407947116784335645779254418197893,
-        2059015453425732250661063388025550114427699810823903811954206175620539275529302249429109058617406231042190056518691374623135453014110440521567536139363234823,
-        2678371419513219677756287852208824731574958172086239655100526069345428205255277713679301043954573298762833153414943479162399305468324841637016390583473544213,
-        224920473230580802797827430753165118360472452318454999595316373906080182472981369360525708452601309961392402158771555146880435537354195236106873653629617815,
-        3410807795955996707264801710656767463095630370318512633206539071912165932958445205224156046835745511275680710695239287447765534441816322875467071282007093043,
-        324065832011088921549504539862939203478161096061997649973845207730585967378797415708734152006095564581767026366510091462972016595978774659789921671266130539,
-        2132520004219780806312255792147297602909061275744905900592356972324796281399810927516407773972880248120242639437844394669202053907659037251702384503391637169,
-        2589327138162017247474168699548283357292474258788838288958319417706008498685848129729450569745562991047965536727510123551044952579899769276082103467314803473,
-        233219462887314954611142428662483583448530657972747266822297374660750620812055855590416462947636537997933346821640281755520692326183265902917878035315376519,
-        1533005028586940065174688215027551673088199895961760086175283703811288560458090879132736910628300745370272003130085951505331332375428950389926266623747831791,
-        1654794987351335882108321302665752528275155885741986409921850179477640125192082191610492308422736086951539350967169188667170116124975011708526918322702689765,
-        2319184109866510858936834195884450978728137013900435950399086656902198058455395751291264975592978158490514474201033016953328754963523409145208545018701621193,
-        39681491442546552019647749109234934353132688349234576857815150340579609738926080164433646915212858545206152349751827352917877340499862346152857494714977877,
-        1175075022098529516310122429991662793561008670380752676779926919479884945202415470877815332869515160532044662580937838280731309400752805766302470855610611861,
-        1312827061984523900361304895918482771176826283506851159844690363872115942856700628260315139007269342331762400813428251344425838768809142095285242359993286017,
-        1679051042860737194070162644225332804063751579465131700407788290641415997496750116980077673592237017471357130675385041248632771351694943740094307645433580581,
-        645063900404856138591799517916781802559855958727771651708244381607414095344665929325799892227271095751978397694930089620699210517556775956164287428021220443,
-        198662793062629656993674290708402564965078381682207749299079219143901416581705523579416225034687936581574026351992293147067642343122630078667563329121251761,
-        3317338205825290660561032563157054443781923142491940761940887636877945083678885291744330494468373235207516289889833169264993015069323427587463684996674508703,
-        9743698344193697856648334097133398577931301095744138751253389113721386427765358592523837688053343111745237012914348622557663432141809222832121095642648591,
-        3129337038767804861057903516059325192265130036833325956012345059270507605643271165403850505591719105741275700308240253359728247832107513860808571088388188349,
-        2545533436992468035659394248417037821037847015150725184699148327917217245757717625049797062779616840240207963883247022944129272490846833947687077777039083253,
-        1886544143458489004187290019684954244238396191743709554659960096021797690783203417276847135180961630018716385933765819936356630820469824182254986170716283485,
-        3016586970951718580828240937964954526973370959241588298581884724218284897085800091775176212767554316082050362658830605444277817470393754156861594696544327387,
-        1693711238700333557739825657685356228880384753812191930849481551683653909907249401834762265200989834497144008527027451250507395895946978746128749037486610537,
-        2627166558716202779513515101396054549190431052037807243909947769126689968314108031619947952215948438220333049037291931924715725853112588249154700082642971989,
-        1052171916464188088621585494232994400055189661958656984134037606322232509814412865004854303323738574192771147405158836789330801351562660433397335882023704173,
-        1875502451695231743600308050813566156214854079620115586811360079517190479792947488953471301218374321228993786091394243050336419730442384102037089933182947021,
-        2030129051897802341377866659870708908721035621792144157596425389444692757328947351599096715909869926340730469061700286534688187525863979526641819534124146049,
-        739718797429235331983323316361137597313372711801384843116925334649244613140367747665166222760926382512773334687754013613584842522662269571973625006493952225,
-        1434984481045175923479065064181836642097726704538166547422842102386530700904068703593706583779541255950278449916131921604954524697808011666305021194822422087,
-        1684578456548083142236768201466515382158471387437122129827094817495432329217995036963199355409907026779713661060607432482782557436841108322738635602955925209,
-        1274710436553407251621042352109751913421947625445340312072585141402485680485811421251532279675126678217832308764805022929298144715994469100700614473528606783,
-        2083672256841630229938676167823505895388125439036742772918099724467638016057468387715229128173747870602390456415946945659993795367071887220446191446672991795,
-        962671391513300263433033369987327271625047072022625387120647766729148645185380977791664861496601066517673086281817213251121301331116903302845995180271904771,
-        2234884295981589195672324302630807154555461797429866167510740414302374700724449577753073246371612578788405668033261963593074702144798533411042942767355120263,
-        2436751300493936230389671962045777529862699003715680224700066664233916173346672865301767973120955761243256717401688425984855782051922560877381674529481432429,
-        1954481928831450089645710956537311796553360962035693804655120828163625966759178407953703442994322107474323938577958374820934339116195861473512489643782568903,
-        1459429187669151599509119066118912052450055646060543261354954219864658708046706227972712749800006337017040554241550633767121318879174089881420147518191560017,
-        2373144242394549139357497031456597672133515352007611205826469275469616394583390230324650014821998115341757059594404651974042356034547965955836807351533217741,
-        1691697057923114980661501431356983758634809699437328249827427358849820105357196246581502675215030277533786395069749813539861164439412107827122679008957216177,
-        339669802909545113385021294390916077458233244553719867624526838622090517246298446101085352171226445543145523733550182715970666020742658137044309550297995499,
-        1404854224835048206628511565549971469114644377369401304806876027177958734692068785730436734622169465415293744718931103020956938657558085049665401594286227841,
-        1062694328391231606627279102387866921370839275447871997128202824201938888517115876905110014055556524289299040094037753718673857726266655993739859764367425489,
-        463663619471098033938098350045465360821923442162611423231834719188607491387122782111104165027064331775619833102701794274450541837861335121559091934940836973,
-        2590016640448747976144938685523013855835795453631131957399210391931346380690872547194035227084006202025664488611457280898295145014988190928263879415851035711,
-        3351919370436471376214887578331945036403450972013487398226363274948958179841598760174003251824416956183822124964642693142990335076140331695246394019701428213,
-        660331628265605028419155285861171045056535036253500887320495483576085806935859266500633629229892451568571718839373675583993535980294829112538333226783015761,
-        54551332004637857896867914351016266850300766041817481746369258690730029004478748030741667943868022753331003715471955380112957901118544470045608283056538239,
-        1407417762854483516944685622726902862470004958062107889744290973980366580343936582135975181896757387076530493242262381990520983489473835614437177863040489383,
-        2903902002584095003912376705950176476629382216951510123860074629918455201527415495805670443393533341112181304971303256677665084985445509967874485167371691377,
-        316105581046111949743798213720739350628356959749370787326487018663485631021661875772464173181113968234928219015745745138223983609745680985986807839655830257,
-        573941517463417245913850155616811443315608116224661502958253302712463495719259646766217255005406263873778003557268540655476050573342543405750654853916337243,
-        2255780166675388821488668345122313633702143916008142885803252184138810214884361041391840501662434796684295208908481285659343615880076608690976317638189014771,
-        1409184414576862485984274887480946946074341987669097215820778274282560962700968849413076375018610967433671874382357105877033238971067543332861032645070323157,
-        1134197105041941357026016800016236783675413367339036578650373316312806639606369772777003577946654232709459997973533155642915646055470788351462554028291435845,
-        1082448697439869378105228558435815827531159257190436754061568737590795688670755962411214992269507632466792001026384215089526674145234402537960531020869578463,
-        902531030584491940204395382426710881628411009032803109796315211141697899870541134515833501278163087869249491341422438186710954295763767086454226335874431123,
-        593079459494347605831245695876616006210360313809323664491584456117458845994886746731021745715928341429122148782000434043570776300341911419954413658111665605,
-        2911742750877325171656802969628596108178920025559905468130597473340117661106732340853541979355568728940715611268903187916960571011255213558710134481116724271,
-        868200533167000295327901989128960507229034127419168879144475336334775050751784572483256281611850842899481254440000802252285297746822885785453282335633077089,
-        1796030831090663160261318400952322797887552026812859681303042098851756927669602955883319549638582901354273442953030329376843991404243458175071067763637471513,
-        3070035177461431734683292561396843800853398118384956952175282982744461447844378306304657340526005745164742146675566540748153789449865369575001986349096367285,
-        1416261015809087600695259097305144975191243471218841771528609976900343642830746454629362691501114082193635103550374597634820435283261448358287601555668077205,
-        1434282745637858209604826463415317915206989437226705559466624286412230523621548871041109550967628214052129908815268639771588401846879214500322788315544598211,
-        1420963130072809523685442470879156352917022686648085638245250448930671247859185171898835919052259194389433796796635755072843992376317344099392182853197880321,
-        350146287491359444176423405873308218094533270082546281568307857436932397652406704647151803526395618111970728043722704560873856988312127223686876705152296605,
-        2984652014575741394831184671421262792624416354439507227747990997042622421855441040407078193540434552040573438656842732328600302635985252446270410357204667807,
-        2460211824392283147756275405776137484308893120207361889975503726785554669330043800036659064610221196879097491798599720878932312284012070776151324351935064215,
-        581818990606501929846662512929348025240475957747618630469039866306661329426478204401947720205839841065929019790036758700117769828312739440990105647097385535,
-        924724347569096987968055059751735747072289753451226233010209653171701225411579575200236488747771530450022680497566340258268146187049417750318445470855723833,
-        1368578732626270922528559034965229987504317188534147906257590779608536478384114698066484567697858455634340675480253548259064016908444454873629154370460522917,
-        998977755044697971953808982339670456917649943464096521091026441049336093861070629660158173635703474413216109665036692640951542410925565512428366832961320879,
-        3123818723332212727724148044501598273380205569897053353185928144101269822244926185492381825154364082777430130174772163720944607940918237503807695477881032949,
-        1119717796607129343037348318795042960123047492002093668434666101093727781407948772486960832487013641465052006125381160082516537608448006354793976172918703813,
-        2969362373969579652366626459748943444818317278736346469906989057547175386780430154553462419958306492973597545170749527045469466386584919061433951185952721983,
-        191597031586390064183113386037528685743374810703557785237794333445721230690143643629677095490429600806368824726989165975868440621956194076224904987784775163,
-        1391376686185375274547211134300975874099398294573829402479906404648731681909716480566009214851673953878647627492210077733215291132194365538052270190147246811,
-        2984081643105006723131453875031564689340792265256143642832547266915151947327491073577193719538362125683065322261321916946521866036794893128221196498813621513,
-        3241060411585557836796671307907402853814435857984203948262870217724153806454839998729505551214115668751004792119714240857575952092458895444226987762851998849,
-        1328596946758962706823416187928669255991153006381054726992103320977527506385849765535246427310407909825565947191664116509615482380088774306298504618250689743,
-        2075099538499334309639642015520809869202694210822230126842750438698320910509100170169264631431113958790407207927932687500545134025206092701612134956871667233,
-        76536573906577262450309566210820628319999253067150507844693092047565889405147728410200065481105550083470825245700029560835126064965342296967266405938202323,
-        3202619434484124395343927522688960263743371648782844434246487900398337837633671031532826401958865774980793455486433578989068454015337663929406590212431928449,
-        375018970983735931953300587884260874955601736220074988250729221634590754097711590550383683391997178226755132771990135722050770827902501961848802261279564197,
-        3049760460041678089389329682786378131736407449772706390110344454319940067747637330549883753828259231599251940175716173762603095683226148580567154430484334493,
-        1193161603440850920833760111218514170278185956616350487564274204968243873225456434163873807903975178933650298910320289495100678776119939875933871636569017285,
-        1067830221335220643031127325345202347260850775606042305705338008938766460115966943728687596622896658395385089086651746056726730400564099659641053570937534577,
-        2371033906236963657788817803093004841002813815132407277758063929992376848212535643629613474398650343957135855790729691387472162339792668852643319698463339463,
-        1215096864640393181294930686550602558246565679490270815392468491708297870028095519298087852352632522016797096461128267052347781130092995769281615984916148963,
-        769681914326723316165576011887527363302604168680486443604736595597011223879048859492875144530371273668453286596904168415046523238947552000794203400482690589,
-        2672114316766669173172211627095848865880580656504650535831919111251001355227662056284968327741206677696572129428660553152862250726710929422801897993828625225,
-        2520280088787630373993719210404002350591804927895758604775628983576632812740707722791798203867555537527021351391239527508327439680679278773489825915383838627,
-        2739849105862930737775372957368793462604818040331678208227293195211015835953283499935395317212394063583682253809840827179674798593839339105161289981288514707,
-        3140552943370807397949986477974029192142753225487197890793358234276452064956346404341015649784090685386131585724145711782390606495561815923418506509173495191,
-        1178148122241705521354134751531498125987188233674698072358389456251565229972749409147437153883366889452652705556269983812214108279037386197615704484223560473,
-        866355670406467921281962610626271736369104294160789951722498107936611589800875718530455351607281584245938045882274531954121046597281097675302555453525998675,
-        1517498120808296143502584298260121953199466594985494848446250925895862760299636690215032961416999534740639493894700721940577818148422379186174700723305763825,
-        472533311161463022061400807099080512915135213778924593598911313458078049462723506838449882087667005109458033650295699641413055869075459076515176080338497897,
-        1145254000958684041757816763402022356859125102796915546888087097827840177177604276685421297405677987611159709418210355070051083043448866949484223332507836421,
-        376760345710526047188192003896926981280849528382485427285331635062353190804075912762128168140333153099797237312546915759638849529411765294372951353273440985,
-        2672796822528491147039040195081611647369090180067144713843718350111841568433485463267855036513860400823479636244718947518733253536613910437951229604695486295,
-        1955134965301820515547188633792797533226969245233429795627085142713646574990330873090959951100053389119802521526637320329117916765417033739334541971607731987,
-        2880588295991970562241581887263994732020660951191735101593143433114363339741463527689783660510050536570226897298110224020315188891692616582383871528574295545,
-        1333770454462937409160185902893326752400941733244952840050623484034250460772512625524496535024440970373909884709545728809253859677942404628170744499310691897,
-        2409751244387457425762640814365778097699818166597373549791019331279339640182288785141481234117314855927339944977015012954458191118162595025364790363188892611,
-        3203598305706227540205852850162003792503926281150359790284003566987509622356119099679971413101386103720041658909671372150591545872161960452889477268244988131,
-        1823591971218171805167152924191010305130153902066723810969775124703694780920939163961706872956500509106974514210216864511989405044141311593375536767808475865,
-        391223518220632408878494695140939080333992547857963384911305010552976127273284601342575227589741399615267751878053411582359690367994734181348108757181742661,
-        256785493276541044267101834810403083742359334563933234876885508093920292626859815033211060418108223707190643035194059578402635325378513382193717527444980995,
-        757309775623749720481146887110530001230587310868339112317861128212994081050318385805121532383567401059498764046820060833263565216513254161491841457996836171,
-        2211568006905484800274493836460172585884621985028205148729429791173457263157359082427046473077835464329410725115899567073808320717725761717794198124257185789,
-        532744596444289961478652698847953445359507887191030573802390228797411158341356543855566830340850076444813135931480093532818903386750016324244503635795410511,
-        2193294861048876080050352462376883037080488150780743671209909102254814848769061815346766356432047464718298290140226218407663078601534366103534734773928634591,
-        1413669072590628126088335231932670731393915037860607886448744692134270409224574004613370189616563654769206199395494622048217243646822901209042908076178546437,
-        3063520444676685005009966909344724989558575464727611317744386632117295219230430968062080589070554788209619090762665093028266377385923403547148421742775319215,
-        3148630661040209032834780995271086113498122685586012013310226029551008889309638320083943313868579837598249679266194143597088959408451370117385884747283411687,
-        3404405812770853992031114389592348938600808108695486943583054399122228464413333386352743956380897885113333764318445043612662987603066870860778260976064573437,
-        585237580010351579550031683542066614886079115016071975126038479507778259282674479094972500530234113990122871055148369950419664249767834801451193810497334519,
-        1306287156876002062143606475070417839797238411010312187027714122567964614891696048671517109371365045314439863091557675432543397012343434417291090244709646307,
-        491280508591609959695445863202580497394007942295325952242726004581035413937841659011740246299655241708399230465380283947672273894243094487244011680933522577,
-        1329062846909516162513473031740703887235367065110119277135774382775670061701556938220618756599236221229569100114634999616884988307216338509233494183248220461,
-        1392449443206171580749934216522079392306419600101838093495062929744433523534317369901714824574453770137322322128729332435207316231175075626518350563238963449,
-        172025984565421081698192958168814324482469122991912666096220627037429692186193063387061846222590231152843016945459452009231979997090398170591709907538721807,
-        283409917100482170721391703360425029674651748723812074616668631599140231578417583236900862102343542339717345262529577031625736799501563713900222620470024905,
-        482583954160660634485225023758728395228823593030216017608970394953469554212360637007037395323880299310966785736456143863585878927463105595784550880146766777,
-        2925539816046017901997230131338146621061762663732982790042266603663540600655823725666320386592103766169911186618319617161157739162429614130163170258905214615,
-        848941555286518188260160592912627064464212834082973770724738364189483872477079880281295302025280920759730419030097588974536417073748415524021433266195790983,
-        3102366178445952654531058999835985527448938629621286184900679736789032408909736775018368702228971195216912422373078548836080145613890193624432525368934357975,
-        141022787374832088789233403290267667424257555198193195339556710092248061540299646475561443463891412867657230769947799358505811928297015650453765660325096537,
-        2442410248221402407649627828810867562728815919542306059071938848943287427126525189476833139801380371848187160595950458383471302153870418168931677647569280879]
+def test_primes():
+    primes10000 = load_corpus('primes10000')
+    primes64 = load_corpus('primes64')
+    primes128 = load_corpus('primes128')
+    primes256 = load_corpus('primes256')
+    primes512 = load_corpus('primes512')
 
     q = 0
     ini = time()
@@ -2871,36 +58,6 @@ def test_primes():
     print('primes512: %d primes in %4.8f' % (q, end))
 
 
-def gcd(a, b):
-    while b:
-        a, b = b, a % b
-    return a
-
-
-def jacobi(a, p):
-    if (not p & 1) or (p < 0):
-        raise ValueError('p must be a positive odd number.')
-
-    if (a == 0) or (a == 1):
-        return a
-
-    a = a % p
-    t = 1
-
-    while a != 0:
-        while not a & 1:
-            a >>= 1
-            if p & 7 in (3, 5):
-                t = -t
-        a, p = p, a
-        if (a & 3 == 3) and (p & 3) == 3:
-            t = -t
-        a = a % p
-    if p == 1:
-        return t
-    return 0
-
-
 def solovay_strassen(p, t=25):
     if p < 2:
         return False
@@ -2912,11 +69,12 @@ def solovay_strassen(p, t=25):
     if p & 1 == 0:
         return False
 
+    ctx = ModContext(p)
     for i in range(t):
         a = randint(2, p - 2)
-        r = pow(a, (p - 1) // 2, p)
+        r = ctx.pow(a, ctx.half)
 
-        if r != 1 and r != p - 1:
+        if r != 1 and r != ctx.n_minus_1:
             return False
 
         if r != jacobi(a, p) % p: